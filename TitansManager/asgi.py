@@ -2,6 +2,8 @@
 ASGI config for TitansManager project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with ``gunicorn -k uvicorn.workers.UvicornWorker``; the health and
+receipt views are async and do not hold a thread while they wait.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from socket import gethostbyname, gethostname
 
@@ -140,6 +141,8 @@ JAZZMIN_UI_TWEAKS = {
     },
 }
 MIDDLEWARE = [
+    "core.middleware.RequestMetricsMiddleware",
+    "core.middleware.SamplingProfilerMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -147,11 +150,56 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.middleware.StaticFilesMiddleware",
     "django_session_timeout.middleware.SessionTimeoutMiddleware",
+    "core.middleware.QueryShapeAuditMiddleware",
 ]
 
+# Application metrics served on /metrics (see core/metrics.py). Gunicorn
+# workers share them through files in PROMETHEUS_MULTIPROC_DIR, which
+# prometheus_client reads itself; leave it unset to report the serving
+# process only. METRICS_TOKEN, when set, is required as a bearer token to
+# scrape; without it only direct requests from METRICS_ALLOWED_NETWORKS
+# are served.
+METRICS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR", "")
+METRICS_SAMPLE_INTERVAL = float(os.environ.get("METRICS_SAMPLE_INTERVAL", 1))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+METRICS_ALLOWED_NETWORKS = os.environ.get(
+    "METRICS_ALLOWED_NETWORKS",
+    "127.0.0.0/8,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,fc00::/7",
+).split(",")
+
+# Sampling profiler for slow requests (see core/profiling.py); off unless
+# explicitly enabled. A PROFILING_SLOW_MS of 0 profiles only staff requests
+# sent with an "X-Profile: 1" header.
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "False") == "True"
+PROFILING_SLOW_MS = int(os.environ.get("PROFILING_SLOW_MS", 1000))
+PROFILING_INTERVAL_MS = int(os.environ.get("PROFILING_INTERVAL_MS", 10))
+PROFILING_DIR = os.environ.get(
+    "PROFILING_DIR", os.path.join(tempfile.gettempdir(), "titans-profiles")
+)
+PROFILING_MAX_PROFILES = int(os.environ.get("PROFILING_MAX_PROFILES", 100))
+
+# Query-shape audit (see core/query_audit.py); off unless explicitly enabled
+QUERY_SHAPE_AUDIT = os.environ.get("QUERY_SHAPE_AUDIT", "False") == "True"
+QUERY_SHAPE_AUDIT_FILE = os.environ.get(
+    "QUERY_SHAPE_AUDIT_FILE", os.path.join(BASE_DIR, "query_shapes.jsonl")
+)
+QUERY_SHAPE_AUDIT_FLUSH_EVERY = int(os.environ.get("QUERY_SHAPE_AUDIT_FLUSH_EVERY", 100))
+
+# Admin changelist summary metrics: cache lifetime in seconds, the cache alias
+# they are stored in, and whether the panel is loaded from its JSON endpoint
+# after the changelist renders. Saves invalidate the panels of other processes
+# only through a shared cache (e.g. "sessions" with SESSION_CACHE_LOCATION
+# set); with the per-process default they stay stale for up to the TTL.
+ADMIN_METRICS_CACHE_TTL = int(os.environ.get("ADMIN_METRICS_CACHE_TTL", 60))
+ADMIN_METRICS_CACHE_ALIAS = os.environ.get("ADMIN_METRICS_CACHE_ALIAS", "default")
+ADMIN_METRICS_DEFERRED = os.environ.get("ADMIN_METRICS_DEFERRED", "False") == "True"
+
+# Row count above which paginators use PostgreSQL planner estimates instead
+# of an exact COUNT(*) (see core/pagination.py)
+ESTIMATED_COUNT_THRESHOLD = int(os.environ.get("ESTIMATED_COUNT_THRESHOLD", 100000))
+
 # WhiteNoise configuration
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
@@ -180,6 +228,34 @@ WSGI_APPLICATION = "TitansManager.wsgi.application"
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
 import sys
+from importlib.util import find_spec
+
+# Connection reuse. Without a pool, each worker thread keeps its connection
+# for DATABASE_CONN_MAX_AGE seconds (None: forever), pinging it before reuse
+# when DATABASE_CONN_HEALTH_CHECKS is on. DATABASE_POOL=True switches to a
+# psycopg pool per process; it needs psycopg 3 and psycopg_pool (both in
+# requirements.txt) and is ignored where they are missing. The pool holds one
+# connection per request thread plus the background receipt workers and the
+# readiness refresher.
+_conn_max_age = os.environ.get("DATABASE_CONN_MAX_AGE", "60")
+DATABASE_CONN_MAX_AGE = None if _conn_max_age == "None" else int(_conn_max_age)
+DATABASE_CONN_HEALTH_CHECKS = (
+    os.environ.get("DATABASE_CONN_HEALTH_CHECKS", "True") == "True"
+)
+DATABASE_POOL = (
+    os.environ.get("DATABASE_POOL", "False") == "True"
+    and find_spec("psycopg") is not None
+    and find_spec("psycopg_pool") is not None
+)
+WEB_THREADS = int(os.environ.get("GUNICORN_THREADS", 4))
+DATABASE_POOL_MIN_SIZE = int(os.environ.get("DATABASE_POOL_MIN_SIZE", 1))
+DATABASE_POOL_MAX_SIZE = int(
+    os.environ.get(
+        "DATABASE_POOL_MAX_SIZE",
+        WEB_THREADS + int(os.environ.get("RECEIPT_PROCESSING_WORKERS", 2)) + 1,
+    )
+)
+DATABASE_POOL_TIMEOUT = float(os.environ.get("DATABASE_POOL_TIMEOUT", 10))
 
 if 'test' in sys.argv or os.getenv('CI') == 'true':
     DATABASES = {
@@ -197,8 +273,39 @@ else:
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('DATABASE_HOST'),
         'PORT': os.getenv('DATABASE_PORT', '5432'),
+        'CONN_MAX_AGE': DATABASE_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DATABASE_CONN_HEALTH_CHECKS,
+        'OPTIONS': {},
     }
 }
+    if DATABASE_POOL:
+        # Django's native pool; replaces persistent connections (Django
+        # refuses both at once)
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': DATABASE_POOL_MIN_SIZE,
+            'max_size': DATABASE_POOL_MAX_SIZE,
+            'timeout': DATABASE_POOL_TIMEOUT,
+        }
+
+    # Optional read replica for analytics reads (see core/db_routers.py):
+    # same credentials as the primary unless overridden
+    if os.getenv('DATABASE_REPLICA_HOST'):
+        DATABASES['replica'] = {
+            **DATABASES['default'],
+            'NAME': os.getenv('DATABASE_REPLICA_NAME', os.getenv('DATABASE_NAME')),
+            'HOST': os.getenv('DATABASE_REPLICA_HOST'),
+            'PORT': os.getenv('DATABASE_REPLICA_PORT', DATABASES['default']['PORT']),
+            'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+            'TEST': {'MIRROR': 'default'},
+        }
+
+DATABASE_ROUTERS = ["core.db_routers.ReplicaRouter"]
+DATABASE_REPLICA_ALIAS = "replica" if "replica" in DATABASES else ""
+DATABASE_REPLICA_MAX_LAG = float(os.environ.get("DATABASE_REPLICA_MAX_LAG", 30))
+DATABASE_REPLICA_LAG_CHECK_INTERVAL = float(
+    os.environ.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL", 5)
+)
 
 AUTH_USER_MODEL = "core.User"
 
@@ -255,18 +362,34 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.authentication.StatelessJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "core.filters.RankedSearchFilter",
         "rest_framework.filters.OrderingFilter",
     ),
 }
 
+SIMPLE_JWT = {
+    "TOKEN_OBTAIN_SERIALIZER": "core.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": (
+        "core.serializers.RevocationAwareTokenRefreshSerializer"
+    ),
+    "TOKEN_USER_CLASS": "core.authentication.ClaimsUser",
+}
+
+# API reads are authenticated from access token claims without loading the
+# user (see core/authentication.py). Decoded tokens are reused for
+# JWT_AUTH_CACHE_TTL seconds; other processes honour a revocation within
+# JWT_REVOCATION_REFRESH seconds.
+JWT_STATELESS_READS = os.environ.get("JWT_STATELESS_READS", "True") == "True"
+JWT_AUTH_CACHE_TTL = float(os.environ.get("JWT_AUTH_CACHE_TTL", 30))
+JWT_REVOCATION_REFRESH = float(os.environ.get("JWT_REVOCATION_REFRESH", 10))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "TitansManager API",
     "DESCRIPTION": "API documentation for TitansManager application",
@@ -289,7 +412,28 @@ SECURE_SSL_REDIRECT = not DEBUG
 # Session Management Settings
 SESSION_COOKIE_AGE = 86400  # 24 hours in seconds
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
-SESSION_SAVE_EVERY_REQUEST = True
+# Sessions are saved when they change, not on every request
+SESSION_SAVE_EVERY_REQUEST = False
+
+# With SESSION_CACHE_LOCATION set (a cache shared by every process, e.g.
+# redis://host:6379/1 for SESSION_CACHE_BACKEND's default Redis backend),
+# sessions are read from that cache and written through to the database,
+# which still answers when the cache has lost them. A per-process cache
+# would serve other workers stale sessions, so without it sessions stay in
+# the database alone.
+SESSION_CACHE_LOCATION = os.environ.get("SESSION_CACHE_LOCATION", "")
+if SESSION_CACHE_LOCATION:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "sessions": {
+            "BACKEND": os.environ.get(
+                "SESSION_CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache"
+            ),
+            "LOCATION": SESSION_CACHE_LOCATION,
+        },
+    }
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+    SESSION_CACHE_ALIAS = "sessions"
 
 # Session Security Settings
 SESSION_COOKIE_SECURE = not DEBUG  # Use secure cookies in production
@@ -299,6 +443,12 @@ SESSION_COOKIE_SAMESITE = "Lax"  # Protection against CSRF
 # Session timeout settings
 SESSION_TIMEOUT = 3600  # 1 hour in seconds
 SESSION_EXPIRE_AFTER_LAST_ACTIVITY = True
+# The last-activity timestamp the timeout is measured from is rewritten at
+# most this often, so an active session costs one write per interval rather
+# than one per request. Sessions expire up to this much earlier.
+SESSION_EXPIRE_AFTER_LAST_ACTIVITY_GRACE_PERIOD = int(
+    os.environ.get("SESSION_ACTIVITY_WRITE_INTERVAL", 60)
+)
 
 # Login redirect settings
 LOGIN_REDIRECT_URL = "/titans-admin/"
@@ -315,8 +465,48 @@ AZURE_ACCOUNT_NAME = os.environ.get("AZURE_ACCOUNT_NAME", "DEFAULT")
 AZURE_ACCOUNT_KEY = os.environ.get("AZURE_ACCOUNT_KEY", "DEFAULT")
 AZURE_RECEIPT_CONTAINER = os.environ.get("AZURE_RECEIPT_CONTAINER", "tms-receipts")
 AZURE_EXPIRATION_SECS = int(os.environ.get("AZURE_EXPIRATION_SECS", 86400))
+AZURE_UPLOAD_MAX_CONN = int(os.environ.get("AZURE_UPLOAD_MAX_CONN", 4))
+AZURE_UPLOAD_CHUNK_SIZE = int(os.environ.get("AZURE_UPLOAD_CHUNK_SIZE", 4 * 1024 * 1024))
+# Transfer sizes for the SDK's BlobServiceClient: files above one chunk are
+# split into blocks sent AZURE_UPLOAD_MAX_CONN at a time
+AZURE_CLIENT_OPTIONS = {
+    "max_single_put_size": AZURE_UPLOAD_CHUNK_SIZE,
+    "max_block_size": AZURE_UPLOAD_CHUNK_SIZE,
+    "max_single_get_size": AZURE_UPLOAD_CHUNK_SIZE,
+    "max_chunk_get_size": AZURE_UPLOAD_CHUNK_SIZE,
+}
+
+# Local-disk LRU cache of receipt files (see core/custom_storage.py); a size
+# of 0 disables it
+RECEIPT_CACHE_DIR = os.environ.get(
+    "RECEIPT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "receipt-cache")
+)
+RECEIPT_CACHE_MAX_BYTES = int(
+    os.environ.get("RECEIPT_CACHE_MAX_BYTES", 256 * 1024 * 1024)
+)
+
+# Background receipt thumbnails and text extraction (see
+# core/services/finance/receipt_processing_service.py); 0 workers runs inline
+RECEIPT_PROCESSING_WORKERS = int(os.environ.get("RECEIPT_PROCESSING_WORKERS", 2))
+RECEIPT_PROCESSING_QUEUE = int(os.environ.get("RECEIPT_PROCESSING_QUEUE", 32))
+RECEIPT_THUMBNAIL_SIZE = int(os.environ.get("RECEIPT_THUMBNAIL_SIZE", 320))
+
+# Receipt files fetched concurrently while streaming a receipt ZIP archive
+RECEIPT_ARCHIVE_WORKERS = int(os.environ.get("RECEIPT_ARCHIVE_WORKERS", 4))
+
+# Uploads are hashed while they stream in, for receipt deduplication
+FILE_UPLOAD_HANDLERS = [
+    "core.upload_handlers.HashingMemoryFileUploadHandler",
+    "core.upload_handlers.HashingTemporaryFileUploadHandler",
+]
 
 # Default file storage
 DEFAULT_FILE_STORAGE = "custom_storage.AzureReceiptStorage"
 
 ENVIRONMENT = os.environ.get("DJANGO_ENV", "production")
+
+# Readiness probes (see core/services/health_service.py): refreshed in the
+# background every HEALTH_CHECK_INTERVAL seconds (0 probes on each request)
+HEALTH_CHECK_INTERVAL = float(os.environ.get("HEALTH_CHECK_INTERVAL", 5))
+HEALTH_PROBE_TIMEOUT = float(os.environ.get("HEALTH_PROBE_TIMEOUT", 2))
+HEALTH_CHECK_STORAGE = os.environ.get("HEALTH_CHECK_STORAGE", "True") == "True"
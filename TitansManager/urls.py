@@ -10,7 +10,8 @@ from drf_spectacular.views import (
 )
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from core.views.system.health_views import HealthCheckView
+from core.views.system.health_views import HealthCheckView, LivenessView
+from core.views.system.metrics_views import metrics_view
 
 urlpatterns = [
     path("", TemplateView.as_view(template_name="landing_page.html"), name="home"),
@@ -27,4 +28,7 @@ urlpatterns = [
     ),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     path("api/health/", HealthCheckView.as_view(), name="health"),
+    path("api/health/live/", LivenessView.as_view(), name="health-live"),
+    path("api/health/ready/", HealthCheckView.as_view(), name="health-ready"),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -7,6 +7,7 @@ from .finance.expense import ExpenseAdmin
 from .finance.income import IncomeAdmin
 from .finance.invoice import InvoiceAdmin
 from .project import ProjectAdmin
+from .tag import TagAdmin
 from .task import TaskAdmin
 
 # Import admin classes
@@ -1,19 +1,26 @@
 from django.contrib import admin
-from django.db.models import Count
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html
 from rangefilter.filters import DateRangeFilter
 
 from core.admin.mixins import (
     FinancialMetricsMixin,
+    SearchableAdminMixin,
     StatusDisplayMixin,
     TimestampDisplayMixin,
 )
+from core.admin.mixins.summary_mixin import related_total
 from core.models import Client
 
 
 @admin.register(Client)
 class ClientAdmin(
-    StatusDisplayMixin, FinancialMetricsMixin, TimestampDisplayMixin, admin.ModelAdmin
+    SearchableAdminMixin,
+    StatusDisplayMixin,
+    FinancialMetricsMixin,
+    TimestampDisplayMixin,
+    admin.ModelAdmin,
 ):
     """
     Admin interface for Client model with enhanced display features using
@@ -111,27 +118,46 @@ class ClientAdmin(
 
     readonly_fields = ("created_at", "updated_at")
 
-    def get_metrics(self, queryset):
+    metrics_depends_on = FinancialMetricsMixin.metrics_depends_on + ("core.project",)
+
+    def get_metric_aggregates(self):
         """
-        Override get_metrics from FinancialMetricsMixin to include
-        client-specific metrics.
+        Extend the FinancialMetricsMixin aggregates with client-specific
+        metrics.
         """
-        metrics = super().get_metrics(queryset)
-        metrics.update(
+        aggregates = super().get_metric_aggregates()
+        aggregates.update(
             {
-                "active_clients": queryset.filter(status="active").count(),
-                "total_projects": queryset.aggregate(total=Count("projects"))["total"]
-                or 0,
+                "active_clients": Count("pk", filter=Q(status="active")),
+                "total_projects": Sum(related_total(Client, "projects", Count("pk"))),
             }
         )
+        return aggregates
+
+    def get_metrics(self, queryset):
+        metrics = super().get_metrics(queryset)
+        metrics["total_projects"] = metrics["total_projects"] or 0
         return metrics
 
+    def get_queryset(self, request):
+        """Annotate the per-row totals the list display reads."""
+        queryset = (
+            super()
+            .get_queryset(request)
+            .annotate(
+                project_count=Coalesce(
+                    related_total(Client, "projects", Count("pk")), Value(0)
+                )
+            )
+        )
+        return self.annotate_financials(queryset)
+
     def display_projects(self, obj):
         """Display the number of projects as a clickable link."""
         return format_html(
             '<a href="/admin/core/project/?client__id__exact={}">{} projects</a>',
             obj.id,
-            obj.projects.count(),
+            obj.project_count,
         )
 
     display_projects.short_description = "Projects"
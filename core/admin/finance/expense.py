@@ -1,15 +1,24 @@
-from decimal import Decimal
-
 from django.contrib import admin
-from django.db.models import DecimalField, Sum
+from django.db.models import Sum
+from django.http import StreamingHttpResponse
+from django.utils.html import format_html
 from rangefilter.filters import DateRangeFilter
 
-from core.admin.mixins import FinancialAdminMixin
+from core.admin.mixins import (
+    AutocompleteAdminMixin,
+    FinancialAdminMixin,
+    SearchableAdminMixin,
+)
+from core.admin.mixins.summary_mixin import breakdown, collect_breakdowns, money_sum
 from core.models import Expense
+from core.models.finance import CATEGORY_CHOICES
+from core.services.finance.receipt_archive_service import ReceiptArchiveService
 
 
 @admin.register(Expense)
-class ExpenseAdmin(FinancialAdminMixin, admin.ModelAdmin):
+class ExpenseAdmin(
+    AutocompleteAdminMixin, SearchableAdminMixin, FinancialAdminMixin, admin.ModelAdmin
+):
     list_display = (
         "title",
         "category",
@@ -33,21 +42,61 @@ class ExpenseAdmin(FinancialAdminMixin, admin.ModelAdmin):
         "description",
     )
 
+    autocomplete_fields = ("submitted_by", "approved_by")
+    readonly_fields = ("display_receipt_preview",)
+    actions = ["download_receipts"]
+
+    def download_receipts(self, request, queryset):
+        """Stream the selected expenses' receipts as a ZIP with a CSV manifest."""
+        service = ReceiptArchiveService()
+        response = StreamingHttpResponse(
+            service.stream(queryset), content_type="application/zip"
+        )
+        response["Content-Disposition"] = f'attachment; filename="{service.filename()}"'
+        return response
+
+    download_receipts.short_description = "Download receipts of selected expenses"
+
+    def display_receipt_preview(self, obj):
+        blob = obj.receipt_blob
+        if blob is None:
+            return "-"
+        if blob.processing_status == "pending":
+            return "Processing..."
+        amount = (
+            f"Detected total: ${float(blob.detected_amount):,.2f}"
+            if blob.detected_amount is not None
+            else "No total detected"
+        )
+        if not blob.thumbnail:
+            return amount
+        return format_html(
+            '<a href="{}" target="_blank"><img src="{}" alt="Receipt preview" '
+            'style="max-width: 320px; border: 1px solid #ddd;"></a><br>{}',
+            blob.file.url,
+            blob.thumbnail.url,
+            amount,
+        )
+
+    display_receipt_preview.short_description = "Receipt Preview"
+
     def get_summary_metrics(self, queryset):
-        return {
-            "total_expenses": queryset.aggregate(
-                total=Sum(
-                    "amount", output_field=DecimalField(max_digits=18, decimal_places=2)
-                )
-            )["total"]
-            or Decimal("0.00"),
-            "category_totals": queryset.values("category")
-            .annotate(total=Sum("amount"))
-            .order_by("-total"),
-            "monthly_totals": queryset.values("date__month", "date__year")
-            .annotate(total=Sum("amount"))
-            .order_by("date__year", "date__month"),
-        }
+        metrics = queryset.aggregate(
+            total_expenses=money_sum("amount"),
+            **breakdown(
+                "category_totals",
+                "category",
+                CATEGORY_CHOICES,
+                lambda condition: money_sum("amount", condition),
+            ),
+            **breakdown(
+                "status_totals",
+                "status",
+                Expense.STATUS_CHOICES,
+                lambda condition: money_sum("amount", condition),
+            ),
+        )
+        return collect_breakdowns(metrics)
 
     def get_report_context(self, queryset, start_date, end_date):
         """Provide income-specific report context"""
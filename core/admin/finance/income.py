@@ -1,20 +1,24 @@
-from decimal import Decimal
-
 from django.contrib import admin
-from django.db.models import DecimalField, Sum
+from django.db.models import Sum
 from rangefilter.filters import DateRangeFilter
 
-from core.admin.mixins import FinancialAdminMixin
+from core.admin.mixins import (
+    AutocompleteAdminMixin,
+    AutocompleteListFilter,
+    FinancialAdminMixin,
+)
+from core.admin.mixins.summary_mixin import breakdown, collect_breakdowns, money_sum
 from core.models import Income
 
 
 @admin.register(Income)
-class IncomeAdmin(FinancialAdminMixin, admin.ModelAdmin):
+class IncomeAdmin(AutocompleteAdminMixin, FinancialAdminMixin, admin.ModelAdmin):
     list_display = ("client", "project", "display_amount", "date", "invoice")
+    list_select_related = ("client", "project", "invoice__client")
 
     list_filter = (
-        "client",
-        "project",
+        ("client", AutocompleteListFilter),
+        ("project", AutocompleteListFilter),
         ("date", DateRangeFilter),
     )
 
@@ -23,21 +27,19 @@ class IncomeAdmin(FinancialAdminMixin, admin.ModelAdmin):
         "project__name",
     )
 
+    autocomplete_fields = ("client", "project", "invoice")
+
     def get_summary_metrics(self, queryset):
-        return {
-            "total_income": queryset.aggregate(
-                total=Sum(
-                    "amount", output_field=DecimalField(max_digits=18, decimal_places=2)
-                )
-            )["total"]
-            or Decimal("0.00"),
-            "client_totals": queryset.values("client__name")
-            .annotate(total=Sum("amount"))
-            .order_by("-total"),
-            "project_totals": queryset.values("project__name")
-            .annotate(total=Sum("amount"))
-            .order_by("-total"),
-        }
+        metrics = queryset.aggregate(
+            total_income=money_sum("amount"),
+            **breakdown(
+                "status_totals",
+                "status",
+                Income.STATUS_CHOICES,
+                lambda condition: money_sum("amount", condition),
+            ),
+        )
+        return collect_breakdowns(metrics)
 
     def get_report_context(self, queryset, start_date, end_date):
         """Provide income-specific report context"""
@@ -1,16 +1,20 @@
-from decimal import Decimal
-
 from django.contrib import admin, messages
-from django.db.models import DecimalField, Sum
+from django.db.models import Count, Q
+from django.utils import timezone
 from django.utils.html import format_html
 
-from core.admin.mixins import FinancialAdminMixin
+from core.admin.mixins import (
+    AutocompleteAdminMixin,
+    AutocompleteListFilter,
+    FinancialAdminMixin,
+)
+from core.admin.mixins.summary_mixin import breakdown, collect_breakdowns, money_sum
 from core.models import Invoice
 from core.services.finance import InvoiceService
 
 
 @admin.register(Invoice)
-class InvoiceAdmin(FinancialAdminMixin, admin.ModelAdmin):
+class InvoiceAdmin(AutocompleteAdminMixin, FinancialAdminMixin, admin.ModelAdmin):
     list_display = (
         "invoice_number",
         "client",
@@ -20,12 +24,13 @@ class InvoiceAdmin(FinancialAdminMixin, admin.ModelAdmin):
         "date",
         "due_date",
     )
+    list_select_related = ("client", "project")
 
     list_filter = (
         "status",
         "date",
-        "client",
-        "project",
+        ("client", AutocompleteListFilter),
+        ("project", AutocompleteListFilter),
     )
 
     search_fields = (
@@ -35,6 +40,10 @@ class InvoiceAdmin(FinancialAdminMixin, admin.ModelAdmin):
         "notes",
     )
 
+    # Invoice numbers are typed from the start; see migration 0009
+    autocomplete_search_fields = ("^invoice_number",)
+    autocomplete_select_related = ("client",)
+    autocomplete_fields = ("client", "project")
     readonly_fields = ("invoice_number",)
 
     fieldsets = (
@@ -68,20 +77,19 @@ class InvoiceAdmin(FinancialAdminMixin, admin.ModelAdmin):
     display_status.short_description = "Status"
 
     def get_summary_metrics(self, queryset):
-        return {
-            "total_invoices": queryset.aggregate(
-                total=Sum(
-                    "amount", output_field=DecimalField(max_digits=18, decimal_places=2)
-                )
-            )["total"]
-            or Decimal("0.00"),
-            "status_totals": queryset.values("status")
-            .annotate(total=Sum("amount"))
-            .order_by("-total"),
-            "client_totals": queryset.values("client__name")
-            .annotate(total=Sum("amount"))
-            .order_by("-total"),
-        }
+        overdue = Q(status="sent", due_date__lt=timezone.now().date())
+        metrics = queryset.aggregate(
+            total_invoices=money_sum("amount"),
+            overdue_count=Count("pk", filter=overdue),
+            overdue_total=money_sum("amount", overdue),
+            **breakdown(
+                "status_totals",
+                "status",
+                Invoice.STATUS_CHOICES,
+                lambda condition: money_sum("amount", condition),
+            ),
+        )
+        return collect_breakdowns(metrics)
 
     actions = ["mark_as_paid", "mark_as_sent"]
 
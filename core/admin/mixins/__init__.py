@@ -7,4 +7,12 @@ from .app_mixin import (
     TimestampDisplayMixin,
     WorkloadDisplayMixin,
 )
+from .autocomplete_mixin import AutocompleteAdminMixin, AutocompleteListFilter
 from .finance_mixin import FinancialAdminMixin
+from .inline_mixin import (
+    PaginatedInlineAdminMixin,
+    PaginatedInlineFormSet,
+    PaginatedInlineMixin,
+)
+from .search_mixin import SearchableAdminMixin
+from .summary_mixin import SummaryMetricsMixin
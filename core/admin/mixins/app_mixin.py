@@ -1,7 +1,11 @@
-from django.db.models import Q, Sum
-from django.template.response import TemplateResponse
+from decimal import Decimal
+
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils.html import format_html
 
+from .summary_mixin import MONEY_FIELD, SummaryMetricsMixin, related_total
+
 
 class DisplayMixin:
     """Base mixin for common display formatting functionality."""
@@ -46,24 +50,22 @@ class StatusDisplayMixin(DisplayMixin):
     display_status.short_description = "Status"
 
 
-class MetricsMixin:
+class MetricsMixin(SummaryMetricsMixin):
     """Mixin for aggregate metrics and summary statistics."""
 
-    def get_metrics(self, queryset):
-        """Override this method to define custom metrics for different models."""
-        return {
-            "total_items": queryset.count(),
-        }
+    def get_metric_aggregates(self):
+        """
+        Aggregates computed together in a single query. Extend this in
+        subclasses rather than issuing extra queries from ``get_metrics``.
+        """
+        return {"total_items": Count("pk")}
 
-    def changelist_view(self, request, extra_context=None):
-        response = super().changelist_view(request, extra_context)
-
-        if not isinstance(response, TemplateResponse):
-            return response
+    def get_metrics(self, queryset):
+        """Override to post-process the aggregated values."""
+        return queryset.aggregate(**self.get_metric_aggregates())
 
-        queryset = response.context_data["cl"].queryset
-        response.context_data["summary_metrics"] = self.get_metrics(queryset)
-        return response
+    def compute_summary_metrics(self, queryset):
+        return self.get_metrics(queryset)
 
 
 class TimestampDisplayMixin(DisplayMixin):
@@ -87,11 +89,23 @@ class TimestampDisplayMixin(DisplayMixin):
 class WorkloadDisplayMixin:
     """Mixin for displaying user workload information."""
 
+    def annotate_workload(self, queryset):
+        """Add the task counts ``display_workload`` reads, as subqueries."""
+        return queryset.annotate(
+            task_count=Coalesce(
+                related_total(self.model, "tasks", Count("pk")), Value(0)
+            ),
+            active_task_count=Coalesce(
+                related_total(self.model, "tasks", Count("pk"), ~Q(status="completed")),
+                Value(0),
+            ),
+        )
+
     def display_workload(self, obj):
-        active_tasks = obj.tasks.exclude(status="completed").count()
-        total_tasks = obj.tasks.count()
-        if total_tasks:
-            return format_html("{} active / {} total", active_tasks, total_tasks)
+        if obj.task_count:
+            return format_html(
+                "{} active / {} total", obj.active_task_count, obj.task_count
+            )
         return "0 tasks"
 
     display_workload.short_description = "Workload"
@@ -115,32 +129,66 @@ class ReportsToDisplayMixin:
 class FinancialMetricsMixin(MetricsMixin):
     """Mixin specifically for financial metrics."""
 
-    def get_metrics(self, queryset):
-        metrics = super().get_metrics(queryset)
-        metrics.update(
+    metrics_depends_on = ("core.income", "core.invoice")
+
+    def get_metric_aggregates(self):
+        aggregates = super().get_metric_aggregates()
+        revenue = related_total(
+            self.model, "incomes", Sum("amount", output_field=MONEY_FIELD)
+        )
+        outstanding = related_total(
+            self.model,
+            "invoices",
+            Sum("amount", output_field=MONEY_FIELD),
+            status="Unpaid",
+        )
+        aggregates.update(
             {
-                "total_revenue": queryset.aggregate(total=Sum("incomes__amount"))[
-                    "total"
-                ]
-                or 0,
-                "total_outstanding": queryset.aggregate(
-                    total=Sum("invoices__amount", filter=Q(invoices__status="Unpaid"))
-                )["total"]
-                or 0,
+                "total_revenue": Sum(revenue),
+                "total_outstanding": Sum(outstanding),
             }
         )
+        return aggregates
+
+    def get_metrics(self, queryset):
+        metrics = super().get_metrics(queryset)
+        metrics["total_revenue"] = metrics["total_revenue"] or 0
+        metrics["total_outstanding"] = metrics["total_outstanding"] or 0
         return metrics
 
+    def annotate_financials(self, queryset):
+        """Add the totals ``display_revenue``/``display_outstanding`` read."""
+        zero = Value(Decimal("0.00"))
+        return queryset.annotate(
+            revenue_total=Coalesce(
+                related_total(
+                    self.model, "incomes", Sum("amount", output_field=MONEY_FIELD)
+                ),
+                zero,
+                output_field=MONEY_FIELD,
+            ),
+            outstanding_total=Coalesce(
+                related_total(
+                    self.model,
+                    "invoices",
+                    Sum("amount", output_field=MONEY_FIELD),
+                    status="Unpaid",
+                ),
+                zero,
+                output_field=MONEY_FIELD,
+            ),
+        )
+
     def display_revenue(self, obj):
-        return self.format_currency(obj.total_revenue)
+        return self.format_currency(obj.revenue_total)
 
     display_revenue.short_description = "Total Revenue"
 
     def display_outstanding(self, obj):
-        if obj.total_outstanding > 0:
+        if obj.outstanding_total > 0:
             return format_html(
                 '<span style="color: red;">{}</span>',
-                self.format_currency(obj.total_outstanding),
+                self.format_currency(obj.outstanding_total),
             )
         return self.format_currency(0)
 
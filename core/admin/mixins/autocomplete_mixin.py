@@ -0,0 +1,78 @@
+from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path
+from django.contrib.admin.widgets import AutocompleteSelect
+
+
+def is_autocomplete_request(request):
+    """True for requests to the admin site's autocomplete JSON view."""
+    match = getattr(request, "resolver_match", None)
+    return match is not None and match.url_name == "autocomplete"
+
+
+class AutocompleteListFilter(admin.RelatedFieldListFilter):
+    """
+    Related-object list filter backed by the admin autocomplete endpoint.
+
+    Unlike ``RelatedFieldListFilter`` it never loads the related table: the
+    only option rendered is the current selection, and the rest are fetched
+    as the user types. The related model's admin needs ``search_fields``.
+    """
+
+    template = "admin/core/filters/autocomplete_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        # A model form field gives the widget a lazy choice iterator
+        self.widget = field.formfield(
+            widget=AutocompleteSelect(field, model_admin.admin_site)
+        ).widget
+        super().__init__(field, request, params, model, model_admin, field_path)
+
+    def field_choices(self, field, request, model_admin):
+        return []
+
+    def has_output(self):
+        return True
+
+    def render_widget(self):
+        value = self.lookup_val[-1] if self.lookup_val else None
+        return self.widget.render(
+            self.lookup_kwarg,
+            value,
+            attrs={"id": f"filter_{self.field_path}", "class": "autocomplete-filter"},
+        )
+
+
+class AutocompleteAdminMixin:
+    """
+    Keeps related-object choices lazy in change forms and changelists.
+
+    Autocomplete requests against this admin search ``autocomplete_search_fields``
+    when set, which should be ``^``-prefixed so the lookups can use an index,
+    and join ``autocomplete_select_related`` for the result labels. The media
+    for ``AutocompleteListFilter`` filters is added to the changelist.
+    """
+
+    autocomplete_search_fields = None
+    autocomplete_select_related = ()
+
+    def get_search_fields(self, request):
+        if self.autocomplete_search_fields and is_autocomplete_request(request):
+            return self.autocomplete_search_fields
+        return super().get_search_fields(request)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.autocomplete_select_related and is_autocomplete_request(request):
+            queryset = queryset.select_related(*self.autocomplete_select_related)
+        return queryset
+
+    @property
+    def media(self):
+        media = super().media
+        for list_filter in self.list_filter:
+            if isinstance(list_filter, (list, tuple)) and issubclass(
+                list_filter[1], AutocompleteListFilter
+            ):
+                field = get_fields_from_path(self.model, list_filter[0])[-1]
+                return media + AutocompleteSelect(field, self.admin_site).media
+        return media
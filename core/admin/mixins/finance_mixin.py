@@ -4,10 +4,18 @@ from django.template.response import TemplateResponse
 from django.urls import path
 from django.utils.html import format_html
 
-from core.services.finance.report_service import FinancialReportService
+from core.db_routers import analytics_reads
+from core.pagination import EstimatedCountPaginator
 
+from .summary_mixin import SummaryMetricsMixin
+
+
+class FinancialAdminMixin(SummaryMetricsMixin):
+    # Finance tables are the large ones: page on planner estimates and skip
+    # the second, unfiltered COUNT(*) behind the "N total" link
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
-class FinancialAdminMixin:
     def display_amount(self, obj):
         formatted_amount = f"${float(obj.amount):,.2f}"
         return format_html("<span>{}</span>", formatted_amount)
@@ -16,18 +24,20 @@ class FinancialAdminMixin:
 
     def get_summary_metrics(self, queryset):
         """
-        Override this method in child classes to customize metrics calculation
+        Override this method in child classes to customize metrics calculation.
+        Keep it to a single aggregate() call; the result is cached.
         """
         raise NotImplementedError("Subclasses must implement get_summary_metrics()")
 
+    def compute_summary_metrics(self, queryset):
+        return self.get_summary_metrics(queryset)
+
     def changelist_view(self, request, extra_context=None):
         response = super().changelist_view(request, extra_context)
 
         if not isinstance(response, TemplateResponse):
             return response
 
-        queryset = response.context_data["cl"].queryset
-        response.context_data["summary_metrics"] = self.get_summary_metrics(queryset)
         response.context_data["export_csv_url"] = (
             f"{self.model._meta.app_label}:{self.model._meta.model_name}-export-csv"
         )
@@ -52,6 +62,9 @@ class FinancialAdminMixin:
     def generate_report_view(self, request):
         from datetime import datetime
 
+        # ReportLab takes a tenth of a second to import; pay it on first report
+        from core.services.finance.report_service import FinancialReportService
+
         report_service = FinancialReportService()
 
         start_date = request.GET.get("start_date")
@@ -88,6 +101,7 @@ class FinancialAdminMixin:
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
+    @analytics_reads()
     def export_csv(self, request):
         queryset = self.get_queryset(request)
         model_name = self.model._meta.model_name
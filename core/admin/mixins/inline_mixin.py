@@ -0,0 +1,126 @@
+from django.contrib.admin.utils import unquote
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.paginator import Paginator
+from django.forms.models import BaseInlineFormSet
+from django.http import Http404
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that builds forms for one page of related rows only.
+
+    Unbound, it shows page ``page_number`` of ``per_page`` rows. Bound, it
+    loads exactly the rows whose primary keys were posted, so a save touches
+    the page the user edited even if rows were added elsewhere meanwhile.
+    """
+
+    per_page = 20
+    page_number = 1
+    page = None
+
+    def get_queryset(self):
+        if not hasattr(self, "_page_queryset"):
+            queryset = super().get_queryset()
+            # A unique tie-breaker keeps rows from repeating across pages
+            ordering = queryset.query.order_by or self.model._meta.ordering
+            queryset = queryset.order_by(*ordering, "pk")
+            if self.is_bound:
+                self._page_queryset = queryset.filter(pk__in=self.posted_pks())
+            else:
+                self.page = Paginator(queryset, self.per_page).get_page(
+                    self.page_number
+                )
+                self._page_queryset = self.page.object_list
+        return self._page_queryset
+
+    def posted_pks(self):
+        pk_field = self.model._meta.pk
+        pks = []
+        for index in range(self.initial_form_count()):
+            value = self.data.get(f"{self.add_prefix(index)}-{pk_field.name}")
+            try:
+                pks.append(pk_field.to_python(value))
+            except ValidationError:
+                continue
+        return [pk for pk in pks if pk is not None]
+
+
+class PaginatedInlineMixin:
+    """
+    InlineModelAdmin mixin that pages the inline through
+    ``PaginatedInlineFormSet``. The page is read from ``page_param`` in the
+    query string, and pager links swap pages in place through the parent
+    admin's ``PaginatedInlineAdminMixin`` endpoint.
+    """
+
+    formset = PaginatedInlineFormSet
+    template = "admin/core/edit_inline/paginated_tabular.html"
+    per_page = 20
+    extra = 0
+
+    @property
+    def page_param(self):
+        return f"{self.opts.model_name}_page"
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.per_page = self.per_page
+        formset.page_number = request.GET.get(self.page_param, 1)
+        formset.page_param = self.page_param
+        formset.chunk_url = self.get_chunk_url(obj, formset.get_default_prefix())
+        return formset
+
+    def get_chunk_url(self, obj, prefix):
+        if obj is None or obj.pk is None:
+            return None
+        opts = self.parent_model._meta
+        return reverse(
+            f"{self.admin_site.name}:{opts.app_label}_{opts.model_name}_inline_page",
+            args=[obj.pk, prefix],
+        )
+
+
+class PaginatedInlineAdminMixin:
+    """
+    ModelAdmin mixin serving one page of a ``PaginatedInlineMixin`` inline as
+    an HTML fragment, so the change form can load inline rows in chunks.
+    """
+
+    def inline_page_view(self, request, object_id, prefix):
+        obj = self.get_object(request, unquote(object_id))
+        if obj is None:
+            raise Http404
+        if not self.has_view_or_change_permission(request, obj):
+            raise PermissionDenied
+
+        for inline in self.get_inline_instances(request, obj):
+            if not isinstance(inline, PaginatedInlineMixin):
+                continue
+            formset_class = inline.get_formset(request, obj)
+            if formset_class.get_default_prefix() != prefix:
+                continue
+            formset = formset_class(
+                instance=obj, prefix=prefix, queryset=inline.get_queryset(request)
+            )
+            (inline_admin_formset,) = self.get_inline_formsets(
+                request, [formset], [inline], obj
+            )
+            return TemplateResponse(
+                request,
+                inline.template,
+                {"inline_admin_formset": inline_admin_formset},
+            )
+        raise Http404
+
+    def get_urls(self):
+        opts = self.model._meta
+        custom_urls = [
+            path(
+                "<path:object_id>/inline/<str:prefix>/",
+                self.admin_site.admin_view(self.inline_page_view),
+                name=f"{opts.app_label}_{opts.model_name}_inline_page",
+            ),
+        ]
+        return custom_urls + super().get_urls()
@@ -0,0 +1,34 @@
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+
+from core.services.search_service import SearchService
+
+from .autocomplete_mixin import is_autocomplete_request
+
+
+class RankedChangeList(ChangeList):
+    """Puts the best search matches first unless a column sort is chosen."""
+
+    def get_ordering(self, request, queryset):
+        ordering = super().get_ordering(request, queryset)
+        # search_rank only exists once get_search_results has annotated it,
+        # which ModelAdmin.get_ordering runs too early to see
+        if ORDER_VAR in self.params or "search_rank" not in queryset.query.annotations:
+            return ordering
+        return ["-search_rank", *(o for o in ordering if o != "-search_rank")]
+
+
+class SearchableAdminMixin:
+    """
+    Routes changelist search through the full-text index and keeps results
+    ranked unless the user picks a column to sort by. Autocomplete lookups
+    match each word as a prefix, so partial input finds rows as it is typed.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        prefix = is_autocomplete_request(request)
+        return SearchService().search(queryset, search_term, prefix=prefix), False
+
+    def get_changelist(self, request, **kwargs):
+        return RankedChangeList
@@ -0,0 +1,171 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    Count,
+    DecimalField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.http import JsonResponse
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+
+from core.db_routers import analytics_reads
+from core.services.metrics_cache_service import MetricsCacheService
+
+BREAKDOWN_SEP = ":"
+MONEY_FIELD = DecimalField(max_digits=18, decimal_places=2)
+
+
+def money_sum(field, condition=None):
+    """``Sum`` of a money column that is ``0.00`` rather than NULL when empty."""
+    return Coalesce(
+        Sum(field, filter=condition), Value(Decimal("0.00")), output_field=MONEY_FIELD
+    )
+
+
+def breakdown(name, field, choices, metric=None):
+    """
+    Conditional aggregates, one per choice of ``field``, for a single
+    ``aggregate()`` call. ``collect_breakdowns`` folds them into
+    ``metrics[name]``. ``metric`` builds the aggregate from the condition and
+    defaults to a row count.
+    """
+    metric = metric or (lambda condition: Count("pk", filter=condition))
+    return {
+        f"{name}{BREAKDOWN_SEP}{value}": metric(Q(**{field: value}))
+        for value, _ in choices
+    }
+
+
+def collect_breakdowns(metrics):
+    for key in [key for key in metrics if BREAKDOWN_SEP in key]:
+        name, value = key.split(BREAKDOWN_SEP, 1)
+        metrics.setdefault(name, {})[value] = metrics.pop(key)
+    return metrics
+
+
+def related_total(model, relation, aggregate, *conditions, **filters):
+    """
+    Correlated subquery aggregating ``relation`` rows of each ``model`` row.
+    Summing these keeps several one-to-many totals in one query without the
+    row multiplication of aggregating across joins.
+    """
+    rel = model._meta.get_field(relation)
+    fk_name = rel.field.name
+    rows = (
+        rel.related_model._default_manager.filter(
+            *conditions, **{fk_name: OuterRef("pk")}, **filters
+        )
+        .order_by()
+        .values(fk_name)
+        .annotate(total=aggregate)
+        .values("total")
+    )
+    return Subquery(rows, output_field=aggregate.output_field)
+
+
+def _format_metric(value):
+    if isinstance(value, Decimal):
+        return f"{value:,.2f}"
+    if isinstance(value, dict):
+        return ", ".join(
+            f"{key}: {_format_metric(item)}" for key, item in value.items()
+        )
+    return str(value)
+
+
+def summary_rows(metrics):
+    """``(label, text)`` pairs for the summary panel template."""
+    return [
+        (key.replace("_", " ").capitalize(), _format_metric(value))
+        for key, value in metrics.items()
+    ]
+
+
+class SummaryMetricsMixin:
+    """
+    Serves the changelist summary panel from MetricsCacheService and can
+    defer it to a JSON endpoint so the changelist renders without it.
+
+    Subclasses implement ``compute_summary_metrics``; ``metrics_depends_on``
+    lists other models (``"core.income"``) whose changes affect the panel.
+    ``deferred_metrics`` defaults to ``settings.ADMIN_METRICS_DEFERRED``.
+    """
+
+    metrics_depends_on = ()
+    deferred_metrics = None
+
+    def compute_summary_metrics(self, queryset):
+        raise NotImplementedError("Subclasses must implement compute_summary_metrics()")
+
+    def get_cached_summary_metrics(self, queryset):
+        return MetricsCacheService().get_or_compute(
+            self.model._meta.label_lower,
+            queryset,
+            analytics_reads()(self.compute_summary_metrics),
+            depends_on=self.metrics_depends_on,
+        )
+
+    def is_metrics_deferred(self):
+        if self.deferred_metrics is None:
+            return getattr(settings, "ADMIN_METRICS_DEFERRED", False)
+        return self.deferred_metrics
+
+    def summary_metrics_url_name(self):
+        opts = self.model._meta
+        return f"{opts.app_label}_{opts.model_name}_summary_metrics"
+
+    def changelist_view(self, request, extra_context=None):
+        response = super().changelist_view(request, extra_context)
+
+        if not isinstance(response, TemplateResponse):
+            return response
+
+        if self.is_metrics_deferred():
+            url = reverse(f"{self.admin_site.name}:{self.summary_metrics_url_name()}")
+            query = request.GET.urlencode()
+            response.context_data["summary_metrics_url"] = (
+                f"{url}?{query}" if query else url
+            )
+        else:
+            queryset = response.context_data["cl"].queryset
+            metrics = self.get_cached_summary_metrics(queryset)
+            response.context_data["summary_metrics"] = metrics
+            response.context_data["summary_metrics_rows"] = summary_rows(metrics)
+        return response
+
+    def summary_metrics_view(self, request):
+        """JSON summary for the changelist filtered by the same query string."""
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+        changelist = self.get_changelist_instance(request)
+        metrics = self.get_cached_summary_metrics(changelist.queryset)
+        return JsonResponse(
+            {"metrics": metrics, "rows": summary_rows(metrics)},
+            encoder=DjangoJSONEncoder,
+        )
+
+    def get_urls(self):
+        urls = super().get_urls()
+        custom_urls = [
+            path(
+                "summary-metrics/",
+                self.admin_site.admin_view(self.summary_metrics_view),
+                name=self.summary_metrics_url_name(),
+            ),
+        ]
+        return custom_urls + urls
+
+    def response_action(self, request, queryset):
+        # Bulk actions often use QuerySet.update(), which sends no signals
+        response = super().response_action(request, queryset)
+        MetricsCacheService().bump(self.model)
+        return response
@@ -1,21 +1,34 @@
 from django.contrib import admin
-from django.db.models import Sum
+from django.db import models
+from django.db.models import Count, Q, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.html import format_html
 from rangefilter.filters import DateRangeFilter
 
 from core.admin.mixins import (
+    AutocompleteAdminMixin,
+    AutocompleteListFilter,
     FinancialMetricsMixin,
+    PaginatedInlineAdminMixin,
+    SearchableAdminMixin,
     StatusDisplayMixin,
     TimestampDisplayMixin,
 )
+from core.admin.mixins.summary_mixin import money_sum, related_total
 from core.admin.task_inline import TaskInline
 from core.models import Project
 
 
 @admin.register(Project)
 class ProjectAdmin(
-    StatusDisplayMixin, FinancialMetricsMixin, TimestampDisplayMixin, admin.ModelAdmin
+    AutocompleteAdminMixin,
+    PaginatedInlineAdminMixin,
+    SearchableAdminMixin,
+    StatusDisplayMixin,
+    FinancialMetricsMixin,
+    TimestampDisplayMixin,
+    admin.ModelAdmin,
 ):
     """
     Admin interface for Project model with enhanced display features using
@@ -37,7 +50,7 @@ class ProjectAdmin(
     list_filter = (
         "status",
         "priority",
-        "client",
+        ("client", AutocompleteListFilter),
         ("start_date", DateRangeFilter),
         ("end_date", DateRangeFilter),
     )
@@ -114,29 +127,29 @@ class ProjectAdmin(
     )
 
     readonly_fields = ("code", "created_at", "updated_at")
-    filter_horizontal = ("team_members",)
+    formfield_overrides = {models.URLField: {"assume_scheme": "https"}}
+    autocomplete_fields = ("client", "manager", "team_members")
 
-    def get_metrics(self, queryset):
+    def get_metric_aggregates(self):
         """
-        Override get_metrics from FinancialMetricsMixin to include
-        project-specific metrics.
+        Extend the FinancialMetricsMixin aggregates with project-specific
+        metrics.
         """
-        metrics = super().get_metrics(queryset)
-
-        total_budget = queryset.aggregate(total=Sum("budget"))["total"] or 0
-        total_actual_cost = queryset.aggregate(total=Sum("actual_cost"))["total"] or 0
-        total_profit = total_budget - total_actual_cost
-
-        metrics.update(
+        aggregates = super().get_metric_aggregates()
+        aggregates.update(
             {
-                "total_budget": total_budget,
-                "total_actual_cost": total_actual_cost,
-                "total_profit": total_profit,
-                "active_projects": queryset.filter(
-                    status__in=["planning", "in_progress"]
-                ).count(),
+                "total_budget": money_sum("budget"),
+                "total_actual_cost": money_sum("actual_cost"),
+                "active_projects": Count(
+                    "pk", filter=Q(status__in=["planning", "in_progress"])
+                ),
             }
         )
+        return aggregates
+
+    def get_metrics(self, queryset):
+        metrics = super().get_metrics(queryset)
+        metrics["total_profit"] = metrics["total_budget"] - metrics["total_actual_cost"]
         return metrics
 
     def display_profit(self, obj):
@@ -190,9 +203,28 @@ class ProjectAdmin(
 
     display_budget.short_description = "Budget"
 
+    def get_queryset(self, request):
+        """Join the related names and annotate task counts for the list."""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("client", "manager")
+            .annotate(
+                task_count=Coalesce(
+                    related_total(Project, "tasks", Count("pk")), Value(0)
+                ),
+                completed_task_count=Coalesce(
+                    related_total(Project, "tasks", Count("pk"), status="completed"),
+                    Value(0),
+                ),
+            )
+        )
+
     def display_completion(self, obj):
         """Display project completion as a progress bar."""
-        percentage = getattr(obj, "completion_percentage", 0)
+        percentage = (
+            obj.completed_task_count / obj.task_count * 100 if obj.task_count else 0
+        )
         formatted_percentage = f"{float(percentage):.1f}%"
 
         return format_html(
@@ -0,0 +1,34 @@
+from django.contrib import admin
+from django.db.models import Count
+
+from core.models import Tag
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    """Admin interface for normalized task tags and user skills."""
+
+    list_display = ("name", "display_tasks", "display_users")
+    search_fields = ("name",)
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                task_count=Count("tasks", distinct=True),
+                user_count=Count("users", distinct=True),
+            )
+        )
+
+    def display_tasks(self, obj):
+        return obj.task_count
+
+    display_tasks.short_description = "Tasks"
+    display_tasks.admin_order_field = "task_count"
+
+    def display_users(self, obj):
+        return obj.user_count
+
+    display_users.short_description = "Users"
+    display_users.admin_order_field = "user_count"
@@ -1,16 +1,34 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db import models
 from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.html import format_html
 from rangefilter.filters import DateRangeFilter
 
-from core.admin.mixins import MetricsMixin, StatusDisplayMixin, TimestampDisplayMixin
+from core.admin.mixins import (
+    AutocompleteAdminMixin,
+    AutocompleteListFilter,
+    MetricsMixin,
+    SearchableAdminMixin,
+    StatusDisplayMixin,
+    TimestampDisplayMixin,
+)
+from core.admin.mixins.summary_mixin import breakdown, collect_breakdowns
 from core.models import Task
+from core.services.assignment_service import (
+    ACTIVE_TASK_STATUSES,
+    TaskAssignmentService,
+)
 
 
 @admin.register(Task)
 class TaskAdmin(
-    StatusDisplayMixin, TimestampDisplayMixin, MetricsMixin, admin.ModelAdmin
+    AutocompleteAdminMixin,
+    SearchableAdminMixin,
+    StatusDisplayMixin,
+    TimestampDisplayMixin,
+    MetricsMixin,
+    admin.ModelAdmin,
 ):
     """
     Admin interface for Task model with enhanced display features using
@@ -31,8 +49,8 @@ class TaskAdmin(
     list_filter = (
         "status",
         "priority",
-        "project",
-        "assigned_to",
+        ("project", AutocompleteListFilter),
+        ("assigned_to", AutocompleteListFilter),
         ("due_date", DateRangeFilter),
         ("created_at", DateRangeFilter),
     )
@@ -82,33 +100,30 @@ class TaskAdmin(
     )
 
     readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("project", "assigned_to")
+    formfield_overrides = {models.URLField: {"assume_scheme": "https"}}
 
-    def get_metrics(self, queryset):
+    def get_metric_aggregates(self):
         """
-        Override get_metrics from MetricsMixin to include task-specific metrics.
+        Extend the MetricsMixin aggregates with task-specific metrics.
         """
-        metrics = super().get_metrics(queryset)
-
-        status_counts = dict(
-            queryset.values("status")
-            .annotate(count=Count("id"))
-            .values_list("status", "count")
-        )
-
-        overdue_count = queryset.filter(
-            Q(status__in=["planning", "in_progress"])
-            & Q(due_date__lt=timezone.now().date())
-        ).count()
-
-        metrics.update(
+        aggregates = super().get_metric_aggregates()
+        aggregates.update(
             {
-                "total_tasks": queryset.count(),
-                "status_breakdown": status_counts,
-                "overdue_tasks": overdue_count,
-                "unassigned_tasks": queryset.filter(assigned_to__isnull=True).count(),
+                "total_tasks": Count("pk"),
+                "overdue_tasks": Count(
+                    "pk",
+                    filter=Q(status__in=["planning", "in_progress"])
+                    & Q(due_date__lt=timezone.now().date()),
+                ),
+                "unassigned_tasks": Count("pk", filter=Q(assigned_to__isnull=True)),
+                **breakdown("status_breakdown", "status", Task.STATUS_CHOICES),
             }
         )
-        return metrics
+        return aggregates
+
+    def get_metrics(self, queryset):
+        return collect_breakdowns(super().get_metrics(queryset))
 
     def display_assigned_to(self, obj):
         """Display assigned user with link to their admin page."""
@@ -153,7 +168,7 @@ class TaskAdmin(
 
     display_priority.short_description = "Priority"
 
-    actions = ["mark_as_completed", "mark_as_in_progress"]
+    actions = ["mark_as_completed", "mark_as_in_progress", "auto_assign_tasks"]
 
     def mark_as_completed(self, request, queryset):
         """Bulk action to mark selected tasks as completed."""
@@ -167,6 +182,35 @@ class TaskAdmin(
 
     mark_as_in_progress.short_description = "Mark selected tasks as in progress"
 
+    def auto_assign_tasks(self, request, queryset):
+        """Bulk action to assign selected unassigned tasks by skills and capacity."""
+        service = TaskAssignmentService()
+        proposals = service.auto_assign(
+            queryset.filter(assigned_to__isnull=True, status__in=ACTIVE_TASK_STATUSES)
+        )
+
+        assigned = [p for p in proposals if p["assignee"] is not None]
+        for proposal in proposals:
+            if proposal["assignee"] is None:
+                self.message_user(
+                    request,
+                    f"Could not assign '{proposal['task'].name}': {proposal['reason']}",
+                    messages.WARNING,
+                )
+
+        if assigned:
+            self.message_user(
+                request,
+                f"Successfully assigned {len(assigned)} task(s).",
+                messages.SUCCESS,
+            )
+        elif not proposals:
+            self.message_user(
+                request, "No unassigned tasks were selected.", messages.INFO
+            )
+
+    auto_assign_tasks.short_description = "Auto-assign selected unassigned tasks"
+
     def get_queryset(self, request):
         """Optimize queryset with select_related for related fields."""
         return super().get_queryset(request).select_related("project", "assigned_to")
@@ -1,9 +1,24 @@
-# core/admin/task_inline.py
 from django.contrib import admin
 
+from core.admin.mixins import PaginatedInlineMixin
 from core.models import Task
 
 
-class TaskInline(admin.TabularInline):
+class TaskInline(PaginatedInlineMixin, admin.TabularInline):
+    """
+    Project tasks, a page at a time. Only the columns worth editing in bulk
+    are shown; the full task form is one click away via the change link.
+    """
+
     model = Task
-    extra = 1
+    per_page = 20
+    fields = (
+        "name",
+        "status",
+        "priority",
+        "assigned_to",
+        "due_date",
+        "estimated_hours",
+    )
+    autocomplete_fields = ("assigned_to",)
+    show_change_link = True
@@ -1,22 +1,29 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.db.models import Count
+from django.db.models import Count, Exists, OuterRef, Q, Sum
 from django.utils import timezone
 from django.utils.html import format_html
 from rangefilter.filters import DateRangeFilter
 
 from core.admin.mixins import (
+    AutocompleteAdminMixin,
     MetricsMixin,
     ReportsToDisplayMixin,
     StatusDisplayMixin,
     TimestampDisplayMixin,
     WorkloadDisplayMixin,
 )
-from core.models import User
+from core.admin.mixins.summary_mixin import (
+    breakdown,
+    collect_breakdowns,
+    related_total,
+)
+from core.models import Task, User
 
 
 @admin.register(User)
 class UserAdmin(
+    AutocompleteAdminMixin,
     StatusDisplayMixin,
     WorkloadDisplayMixin,
     ReportsToDisplayMixin,
@@ -58,6 +65,13 @@ class UserAdmin(
         "employee_id",
         "phone",
     )
+    # Backed by the prefix indexes of migration 0009
+    autocomplete_search_fields = (
+        "^username",
+        "^first_name",
+        "^last_name",
+        "^email",
+    )
 
     fieldsets = (
         (
@@ -139,6 +153,7 @@ class UserAdmin(
         ),
     )
 
+    autocomplete_fields = ("reports_to",)
     readonly_fields = (
         "date_joined",
         "last_login",
@@ -146,48 +161,51 @@ class UserAdmin(
         "display_updated_at",
     )
 
-    def get_metrics(self, queryset):
+    metrics_depends_on = ("core.task",)
+
+    def get_metric_aggregates(self):
         """
-        Override get_metrics to include user-specific metrics.
+        Extend the MetricsMixin aggregates with user-specific metrics. Task
+        statistics use per-user subqueries so they share the same query.
         """
-        metrics = super().get_metrics(queryset)
-
-        # Department breakdown
-        dept_counts = dict(
-            queryset.values("department")
-            .annotate(count=Count("id"))
-            .values_list("department", "count")
-        )
-
-        # Role breakdown
-        role_counts = dict(
-            queryset.values("role")
-            .annotate(count=Count("id"))
-            .values_list("role", "count")
-        )
-
-        # Task statistics
-        task_metrics = {
-            "users_with_tasks": queryset.filter(tasks__isnull=False).distinct().count(),
-            "total_active_tasks": queryset.filter(
-                tasks__status__in=["planning", "in_progress"]
-            ).count(),
-            "overdue_tasks": queryset.filter(
-                tasks__status__in=["planning", "in_progress"],
-                tasks__due_date__lt=timezone.now().date(),
-            ).count(),
-        }
-
-        metrics.update(
+        active_statuses = ["planning", "in_progress"]
+        aggregates = super().get_metric_aggregates()
+        aggregates.update(
             {
-                "total_users": queryset.count(),
-                "active_users": queryset.filter(is_active=True).count(),
-                "department_breakdown": dept_counts,
-                "role_breakdown": role_counts,
-                "task_metrics": task_metrics,
+                "total_users": Count("pk"),
+                "active_users": Count("pk", filter=Q(is_active=True)),
+                **breakdown(
+                    "department_breakdown", "department", User.DEPARTMENT_CHOICES
+                ),
+                **breakdown("role_breakdown", "role", User.ROLE_CHOICES),
+                "users_with_tasks": Count(
+                    "pk",
+                    filter=Q(Exists(Task.objects.filter(assigned_to=OuterRef("pk")))),
+                ),
+                "total_active_tasks": Sum(
+                    related_total(
+                        User, "tasks", Count("pk"), status__in=active_statuses
+                    )
+                ),
+                "overdue_tasks": Sum(
+                    related_total(
+                        User,
+                        "tasks",
+                        Count("pk"),
+                        status__in=active_statuses,
+                        due_date__lt=timezone.now().date(),
+                    )
+                ),
             }
         )
+        return aggregates
 
+    def get_metrics(self, queryset):
+        metrics = collect_breakdowns(super().get_metrics(queryset))
+        metrics["task_metrics"] = {
+            key: metrics.pop(key) or 0
+            for key in ("users_with_tasks", "total_active_tasks", "overdue_tasks")
+        }
         return metrics
 
     def get_full_name(self, obj):
@@ -227,4 +245,6 @@ class UserAdmin(
 
     def get_queryset(self, request):
         """Optimize queryset with select_related for related fields."""
-        return super().get_queryset(request).select_related("reports_to")
+        return self.annotate_workload(
+            super().get_queryset(request).select_related("reports_to")
+        )
@@ -0,0 +1,191 @@
+"""
+Stateless JWT authentication for API reads.
+
+Access tokens carry the user's ``role``, ``is_manager``, ``is_staff`` and
+``is_superuser`` as claims (added at login by
+``ClaimsTokenObtainPairSerializer``). For safe methods
+``StatelessJWTAuthentication`` builds a ``ClaimsUser`` from them instead of
+loading the ``User`` row, and keeps decoded tokens for
+``JWT_AUTH_CACHE_TTL`` seconds so repeat requests skip signature checks as
+well. Writes, and tokens issued before the claims existed, still load the
+user, since services store it on the objects they change.
+
+Revoked tokens are listed in ``RevokedToken``. Each process reloads the list
+at most every ``JWT_REVOCATION_REFRESH`` seconds, which bounds how long
+another process keeps accepting a token after it is revoked. Changing a
+user's role, staff flags, password or active status revokes every token
+issued to them before the change, so claims never outlive what they
+describe by more than that interval.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from core.metrics import record_cache_lookup
+from core.models import RevokedToken
+
+CLAIMS = ("role", "is_manager", "is_staff", "is_superuser")
+
+
+def add_user_claims(token: Token, user) -> Token:
+    """Copy the fields ``ClaimsUser`` exposes into ``token``."""
+    token["role"] = user.role
+    token["is_manager"] = user.is_manager
+    token["is_staff"] = user.is_staff
+    token["is_superuser"] = user.is_superuser
+    return token
+
+
+class ClaimsUser(TokenUser):
+    """The requesting user as described by their access token."""
+
+    @cached_property
+    def role(self) -> str:
+        return self.token.get("role", "")
+
+    @cached_property
+    def is_manager(self) -> bool:
+        return self.token.get("is_manager", False)
+
+
+class RevocationList:
+    """Per-process, rate-limited copy of the unexpired ``RevokedToken`` rows."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._jtis = frozenset()
+        self._users: Dict[object, float] = {}
+
+    @property
+    def interval(self) -> float:
+        return getattr(settings, "JWT_REVOCATION_REFRESH", 10.0)
+
+    def refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.interval:
+            return
+        # One thread reloads; the others keep the last list meanwhile
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            jtis, users = set(), {}
+            rows = RevokedToken.objects.filter(
+                expires_at__gt=timezone.now()
+            ).values_list("jti", "user_id", "revoked_at")
+            for jti, user_id, revoked_at in rows:
+                if user_id is None:
+                    jtis.add(jti)
+                else:
+                    users[user_id] = max(users.get(user_id, 0), revoked_at.timestamp())
+            self._jtis, self._users = frozenset(jtis), users
+            self._checked_at = now
+        finally:
+            self._lock.release()
+
+    def is_revoked(self, token: Token) -> bool:
+        self.refresh()
+        if token.get(api_settings.JTI_CLAIM) in self._jtis:
+            return True
+        revoked_at = self._users.get(token.get(api_settings.USER_ID_CLAIM))
+        return revoked_at is not None and token.get("iat", 0) < revoked_at
+
+    def revoke_token(self, token: Token) -> None:
+        self._add(
+            jti=token[api_settings.JTI_CLAIM],
+            expires_at=datetime.fromtimestamp(token["exp"], dt_timezone.utc),
+        )
+
+    def revoke_user(self, user) -> None:
+        """Revoke every token issued to ``user`` until now."""
+        now = timezone.now()
+        self._add(
+            user=user,
+            # Token iat claims are whole seconds
+            revoked_at=now.replace(microsecond=0),
+            expires_at=now
+            + max(
+                api_settings.REFRESH_TOKEN_LIFETIME, api_settings.ACCESS_TOKEN_LIFETIME
+            ),
+        )
+
+    def _add(self, **fields) -> None:
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        RevokedToken.objects.create(**fields)
+        # This process honours the revocation from its next request on
+        self.reset()
+
+    def reset(self) -> None:
+        self._checked_at = float("-inf")
+        self._jtis = frozenset()
+        self._users = {}
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    revocations = RevocationList()
+
+    _tokens: Dict[bytes, Tuple[float, Token]] = {}
+    _tokens_lock = threading.Lock()
+
+    @property
+    def cache_ttl(self) -> float:
+        return getattr(settings, "JWT_AUTH_CACHE_TTL", 30.0)
+
+    @property
+    def cache_size(self) -> int:
+        return getattr(settings, "JWT_AUTH_CACHE_SIZE", 10000)
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if self.revocations.is_revoked(validated_token):
+            raise AuthenticationFailed(
+                _("Token has been revoked"), code="token_revoked"
+            )
+
+        stateless = getattr(settings, "JWT_STATELESS_READS", True) and (
+            request.method in SAFE_METHODS
+        )
+        if stateless and all(claim in validated_token for claim in CLAIMS):
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        now = time.time()
+        cached = self._tokens.get(raw_token)
+        record_cache_lookup("jwt", cached is not None and cached[0] > now)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        token = super().get_validated_token(raw_token)
+        # Never past the token's own expiry
+        expires = min(now + self.cache_ttl, token["exp"])
+        with self._tokens_lock:
+            if len(self._tokens) >= self.cache_size:
+                self._tokens.clear()
+            self._tokens[raw_token] = (expires, token)
+        return token
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._tokens_lock:
+            cls._tokens.clear()
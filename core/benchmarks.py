@@ -0,0 +1,311 @@
+"""
+Benchmarks of the API and admin hot paths.
+
+Each scenario is one GET request replayed through the Django test client
+against whatever data the database holds (``seed_data --scale`` loads a
+realistic volume). A timed pass records latency percentiles; a second pass
+counts queries and measures peak Python memory, since tracing allocations
+would skew the timings. Results are saved as JSON and compared against a
+stored baseline so regressions show up as a list rather than a hunch.
+"""
+
+import json
+import math
+import platform
+import time
+import tracemalloc
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count
+from django.test import Client as TestClient
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from core.models import Client, Project, User
+from core.serializers import ClaimsTokenObtainPairSerializer
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    # Builds the URL from the benchmark context, or returns None to skip
+    url: Callable[[Dict], Optional[str]]
+    admin: bool = False
+    # Latency target the p95 must meet whatever the baseline says
+    p95_budget_ms: Optional[float] = None
+
+
+def _detail(route: str, key: str) -> Callable[[Dict], Optional[str]]:
+    def url(context):
+        pk = context.get(key)
+        return reverse(route, args=[pk]) if pk is not None else None
+
+    return url
+
+
+def _list(route: str, query: str = "") -> Callable[[Dict], str]:
+    return lambda context: reverse(route) + query
+
+
+SCENARIOS = [
+    Scenario("api.users.list", _list("user-list")),
+    Scenario("api.projects.list", _list("project-list")),
+    Scenario("api.projects.search", _list("project-list", "?search=project")),
+    Scenario("api.incomes.list", _list("income-list", "?page=1")),
+    Scenario("api.incomes.filtered", _list("income-list", "?status=pending&page=1")),
+    Scenario("api.expenses.list", _list("expense-list", "?page=1")),
+    Scenario("api.expenses.search", _list("expense-list", "?search=aws&page=1")),
+    # Short prefixes match most of the index, a term matching nothing takes
+    # the fallback for every type; the 50 ms target is for the large seed
+    # scale (1.9M search entries)
+    Scenario("api.search", _list("global-search", "?q=proj"), p95_budget_ms=50),
+    Scenario("api.search.one_letter", _list("global-search", "?q=p"), p95_budget_ms=50),
+    Scenario(
+        "api.search.two_letters", _list("global-search", "?q=pr"), p95_budget_ms=50
+    ),
+    Scenario(
+        "api.search.no_match", _list("global-search", "?q=xyzzy"), p95_budget_ms=50
+    ),
+    Scenario("api.projects.metrics", _detail("project-metrics", "project")),
+    Scenario("api.users.workload", _detail("user-workload", "user")),
+    Scenario(
+        "api.clients.financial_summary",
+        _detail("client-financial-summary", "client"),
+    ),
+    Scenario(
+        "admin.expenses.changelist",
+        _list("admin:core_expense_changelist"),
+        admin=True,
+    ),
+    Scenario(
+        "admin.incomes.changelist",
+        _list("admin:core_income_changelist"),
+        admin=True,
+    ),
+    Scenario("admin.tasks.changelist", _list("admin:core_task_changelist"), admin=True),
+    Scenario(
+        "admin.expenses.export_csv",
+        _list("admin:core_expense-export-csv"),
+        admin=True,
+    ),
+    Scenario(
+        "admin.incomes.export_csv",
+        _list("admin:core_income-export-csv"),
+        admin=True,
+    ),
+    Scenario("admin.expenses.report_pdf", _list("admin:expense-report"), admin=True),
+]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile: the smallest value at or above ``p`` percent."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    url: str
+    status: int
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    queries: int
+    peak_memory_kb: float
+
+
+@dataclass
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self):
+        return f"{self.scenario}: {self.metric} {self.baseline:g} -> {self.current:g}"
+
+
+def benchmark_context() -> Dict:
+    """Objects the detail scenarios run against: the busiest of each kind."""
+
+    def busiest(queryset, relation):
+        return (
+            queryset.annotate(n=Count(relation))
+            .order_by("-n", "pk")
+            .values_list("pk", flat=True)
+            .first()
+        )
+
+    return {
+        "project": busiest(Project.objects.all(), "tasks"),
+        "user": busiest(User.objects.all(), "tasks"),
+        "client": busiest(Client.objects.all(), "incomes"),
+    }
+
+
+class BenchmarkRunner:
+    def __init__(
+        self,
+        user: User,
+        iterations: int = 20,
+        warmup: int = 2,
+        scenarios: Optional[Iterable[Scenario]] = None,
+    ):
+        self.user = user
+        self.iterations = iterations
+        self.warmup = warmup
+        self.scenarios = list(SCENARIOS if scenarios is None else scenarios)
+        self.client = TestClient()
+        self.client.force_login(user)
+        # A token as issued at login, so reads take the stateless path
+        token = ClaimsTokenObtainPairSerializer.get_token(user).access_token
+        self.api_headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def _get(self, scenario: Scenario, url: str):
+        headers = {} if scenario.admin else self.api_headers
+        response = self.client.get(url, secure=True, **headers)
+        # Streamed bodies (archives, exports) cost nothing until consumed
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        else:
+            response.content
+        return response
+
+    def run_scenario(self, scenario: Scenario, url: str) -> ScenarioResult:
+        for _ in range(self.warmup):
+            self._get(scenario, url)
+
+        timings = []
+        for _ in range(self.iterations):
+            started = time.perf_counter()
+            self._get(scenario, url)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        with ExitStack() as stack:
+            captures = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in connections
+            ]
+            tracemalloc.start()
+            try:
+                response = self._get(scenario, url)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        return ScenarioResult(
+            name=scenario.name,
+            url=url,
+            status=response.status_code,
+            iterations=self.iterations,
+            p50_ms=round(percentile(timings, 50), 3),
+            p95_ms=round(percentile(timings, 95), 3),
+            p99_ms=round(percentile(timings, 99), 3),
+            mean_ms=round(sum(timings) / len(timings), 3) if timings else 0.0,
+            queries=sum(len(capture) for capture in captures),
+            peak_memory_kb=round(peak / 1024, 1),
+        )
+
+    def run(self, progress: Optional[Callable] = None) -> List[ScenarioResult]:
+        context = benchmark_context()
+        results = []
+        hosts = list(settings.ALLOWED_HOSTS) + ["testserver"]
+        with override_settings(ALLOWED_HOSTS=hosts):
+            for scenario in self.scenarios:
+                url = scenario.url(context)
+                if url is None:
+                    continue
+                result = self.run_scenario(scenario, url)
+                results.append(result)
+                if progress:
+                    progress(result)
+        return results
+
+
+def report(results: List[ScenarioResult]) -> Dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "database": connections["default"].vendor,
+        "python": platform.python_version(),
+        "counts": {
+            "clients": Client.objects.count(),
+            "projects": Project.objects.count(),
+            "users": User.objects.count(),
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def load_report(path: str) -> Dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def save_report(path: str, data: Dict) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def compare(
+    baseline: Dict,
+    current: Dict,
+    tolerance: float = 0.2,
+    min_delta_ms: float = 2.0,
+) -> List[Regression]:
+    """
+    Scenarios slower, chattier or hungrier than ``baseline``. Latency and
+    memory may grow by ``tolerance`` (a fraction) before they count, and a
+    latency change must also exceed ``min_delta_ms`` so sub-millisecond
+    noise on fast endpoints is ignored. Query counts must not grow at all.
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if result[metric] > max(
+                base[metric] * (1 + tolerance), base[metric] + min_delta_ms
+            ):
+                regressions.append(
+                    Regression(name, metric, base[metric], result[metric])
+                )
+        if result["queries"] > base["queries"]:
+            regressions.append(
+                Regression(name, "queries", base["queries"], result["queries"])
+            )
+        if result["peak_memory_kb"] > base["peak_memory_kb"] * (1 + tolerance):
+            regressions.append(
+                Regression(
+                    name,
+                    "peak_memory_kb",
+                    base["peak_memory_kb"],
+                    result["peak_memory_kb"],
+                )
+            )
+    return regressions
+
+
+def over_budget(
+    results: Iterable[ScenarioResult], scenarios: Iterable[Scenario] = SCENARIOS
+) -> List[Regression]:
+    """Results whose p95 latency exceeds their scenario's budget."""
+    budgets = {s.name: s.p95_budget_ms for s in scenarios if s.p95_budget_ms}
+    return [
+        Regression(result.name, "p95_ms budget", budgets[result.name], result.p95_ms)
+        for result in results
+        if result.name in budgets and result.p95_ms > budgets[result.name]
+    ]
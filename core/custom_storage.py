@@ -1,26 +1,326 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
 from datetime import UTC, datetime  # Add UTC import
+from typing import Callable, Optional
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from storages.backends.azure_storage import AzureStorage
-
-
-class AzureReceiptStorage(AzureStorage):
-    def __init__(self):
-        super().__init__()
-        # Ensure the account key is properly padded for base64
-        if hasattr(settings, "AZURE_ACCOUNT_KEY"):
-            # Add padding if needed
-            key = settings.AZURE_ACCOUNT_KEY
-            padding = 4 - (len(key) % 4)
-            if padding != 4:
-                key = key + ("=" * padding)
-            self.account_key = key
-
-    account_name = settings.AZURE_ACCOUNT_NAME
-    azure_container = settings.AZURE_RECEIPT_CONTAINER
-    expiration_secs = getattr(
-        settings, "AZURE_EXPIRATION_SECS", 60 * 60 * 24
-    )  # Default 24 hours
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import Storage
+from django.core.files.utils import validate_file_name
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+
+from core.metrics import record_cache_lookup
+
+
+class LocalDiskCache:
+    """
+    Size-bounded least-recently-used cache of storage files on local disk.
+
+    Entries are plain files named by a hash of the storage name, so several
+    worker processes can share one directory: files are written to a
+    temporary name and renamed into place, and a hit refreshes the file's
+    modification time, which eviction uses as the recency order.
+
+    Eviction walks the whole directory, so it only runs when the bytes this
+    process has cached since the last walk push the total over
+    ``max_bytes``, and every ``rescan_every`` fills to count what other
+    processes added.
+    """
+
+    rescan_every = 100
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Cached bytes as of the last walk plus this process's fills since
+        self._size: Optional[int] = None
+        self._fills = 0
+        self._evicting = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path(self, name: str) -> str:
+        key = hashlib.sha256(name.encode()).hexdigest()
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, name: str) -> Optional[str]:
+        path = self.path(name)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def fill(self, name: str, write: Callable) -> str:
+        """Create the entry for ``name`` by calling ``write(fileobj)``."""
+        path = self.path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as fileobj:
+                write(fileobj)
+                size = fileobj.tell()
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._track(size)
+        return path
+
+    def _track(self, size: int) -> None:
+        """Count a fill and evict once the cache may have outgrown its bound."""
+        with self._lock:
+            self._fills += 1
+            if self._size is not None:
+                self._size += size
+            due = not self._evicting and (
+                self._size is None
+                or self._size > self.max_bytes
+                or self._fills >= self.rescan_every
+            )
+            if due:
+                self._evicting = True
+                self._fills = 0
+        if due:
+            try:
+                self.evict()
+            finally:
+                with self._lock:
+                    self._evicting = False
+
+    def put(self, name: str, content: File) -> str:
+        def write(fileobj):
+            for chunk in content.chunks():
+                fileobj.write(chunk)
+
+        return self.fill(name, write)
+
+    def discard(self, name: str) -> None:
+        try:
+            os.unlink(self.path(name))
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> None:
+        """Drop least recently used entries until the cache fits its bound."""
+        entries = []
+        for dir_path, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                if file_name.endswith(".part"):
+                    continue
+                path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        with self._lock:
+            self._size = total
+
+
+class ReceiptStorageMixin:
+    """
+    Receipt handling for any Django storage backend.
+
+    - Files are named by a hash of their content, so a name collision means
+      identical bytes: saving probes ``exists()`` once and reuses the file
+      instead of looping over candidate names.
+    - Saved and opened files are kept in a ``LocalDiskCache``
+      (``RECEIPT_CACHE_DIR``, bounded by ``RECEIPT_CACHE_MAX_BYTES``).
+    - URLs are cached until ``url_refresh_margin`` seconds before the
+      backend's ``expiration_secs`` runs out; ``aurl`` reads the same cache
+      from async views.
+    """
+
+    hash_length = 16
+    url_refresh_margin = 300
+    default_url_cache_ttl = 60 * 60
+
+    @property
+    def disk_cache(self) -> LocalDiskCache:
+        if getattr(self, "_disk_cache", None) is None:
+            self._disk_cache = LocalDiskCache(
+                getattr(
+                    settings,
+                    "RECEIPT_CACHE_DIR",
+                    os.path.join(tempfile.gettempdir(), "receipt-cache"),
+                ),
+                getattr(settings, "RECEIPT_CACHE_MAX_BYTES", 0),
+            )
+        return self._disk_cache
+
+    @staticmethod
+    def content_digest(content: File) -> str:
+        """SHA-256 of ``content``, read in chunks so large scans stay on disk."""
+        if getattr(content, "sha256", None):
+            return content.sha256
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+        return digest.hexdigest()
+
+    def hashed_name(self, name: str, digest: str, max_length=None) -> str:
+        dir_name, file_name = os.path.split(name)
+        file_root, file_ext = os.path.splitext(file_name)
+        suffix = f"_{digest[: self.hash_length]}"
+        if max_length:
+            # -1 for the separator between directory and file name
+            available = max_length - len(dir_name) - len(suffix) - len(file_ext) - 1
+            file_root = file_root[: max(available, 0)]
+        return os.path.join(dir_name, f"{file_root}{suffix}{file_ext}")
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        validate_file_name(name, allow_relative_path=True)
+
+        name = self.hashed_name(name, self.content_digest(content), max_length)
+        if not self.exists(name):
+            name = self._save(name, content)
+        validate_file_name(name, allow_relative_path=True)
+
+        if self.disk_cache.enabled:
+            content.seek(0)
+            self.disk_cache.put(name, content)
+        return name
+
+    def _fetch(self, name: str, fileobj) -> None:
+        """Copy the stored file into ``fileobj``; backends may parallelise."""
+        with super()._open(name, "rb") as source:
+            shutil.copyfileobj(source, fileobj)
+
+    def _open(self, name, mode="rb"):
+        if not self.disk_cache.enabled or any(flag in mode for flag in "wa+"):
+            return super()._open(name, mode)
+
+        path = self.disk_cache.get(name)
+        record_cache_lookup("receipt-disk", path is not None)
+        try:
+            if path is not None:
+                return File(open(path, mode), name)
+        except FileNotFoundError:
+            # Evicted by another process between the lookup and the open
+            pass
+        path = self.disk_cache.fill(name, lambda fileobj: self._fetch(name, fileobj))
+        return File(open(path, mode), name)
+
+    def delete(self, name):
+        super().delete(name)
+        self.disk_cache.discard(name)
+        cache.delete(self.url_cache_key(name))
+
+    def url_cache_key(self, name: str) -> str:
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return f"receipt-url:{type(self).__name__}:{digest}"
+
+    def url_cache_ttl(self) -> int:
+        expiration = getattr(self, "expiration_secs", None)
+        if not expiration:
+            return self.default_url_cache_ttl
+        return expiration - self.url_refresh_margin
+
+    def url(self, name, *args, **kwargs):
+        # Only URLs with the default expiry and permissions are shared
+        if args or kwargs:
+            return super().url(name, *args, **kwargs)
+
+        key = self.url_cache_key(name)
+        url = cache.get(key)
+        record_cache_lookup("receipt-url", url is not None)
+        if url is None:
+            url = super().url(name)
+            ttl = self.url_cache_ttl()
+            if ttl > 0:
+                cache.set(key, url, ttl)
+        return url
+
+    async def aurl(self, name):
+        """``url`` for async views; only signing a new URL leaves the loop."""
+        key = self.url_cache_key(name)
+        url = await cache.aget(key)
+        record_cache_lookup("receipt-url", url is not None)
+        if url is None:
+            # Signing may fetch a delegation key; it touches no database
+            url = await sync_to_async(super().url, thread_sensitive=False)(name)
+            ttl = self.url_cache_ttl()
+            if ttl > 0:
+                await cache.aset(key, url, ttl)
+        return url
+
+
+class LazyAzureStorage(Storage):
+    """
+    The storage API of an ``AzureStorage`` that is only built, and the Azure
+    SDK only imported, when a file is first touched. Models create their
+    storages at import, so a direct subclass would make every process pay
+    the SDK's import time at startup; management commands and workers that
+    never read a receipt now skip it.
+    """
+
+    backend_class = "core.azure_storage.ReceiptBlobStorage"
+
+    @cached_property
+    def backend(self):
+        return import_string(self.backend_class)()
+
+    def __getattr__(self, name):
+        # Settings and the SDK client (account_key, client, timeout, ...)
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    def _open(self, name, mode="rb"):
+        return self.backend._open(name, mode)
+
+    def _save(self, name, content):
+        return self.backend._save(name, content)
+
+    def delete(self, name):
+        self.backend.delete(name)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def url(self, name, *args, **kwargs):
+        return self.backend.url(name, *args, **kwargs)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
+
+
+@deconstructible(path="core.custom_storage.AzureReceiptStorage")
+class AzureReceiptStorage(ReceiptStorageMixin, LazyAzureStorage):
+    def _fetch(self, name, fileobj):
+        self.backend.fetch(name, fileobj)
 
     def get_valid_name(self, name):
         """
@@ -37,6 +337,8 @@ class AzureReceiptStorage(AzureStorage):
         """
         Returns a filename that's free on the target storage system.
         If the filename exists, it will append a timestamp.
+
+        ``save()`` names files by content hash and does not call this.
         """
         import os
 
@@ -0,0 +1,156 @@
+"""
+Read-replica routing for analytics.
+
+Code marked with ``analytics_reads`` (a context manager and decorator) reads
+from ``DATABASE_REPLICA_ALIAS``: report aggregates, admin summary panels and
+exports, so they stop competing with transactional writes on the primary.
+Everything else, and any read inside a transaction on the primary, stays on
+``default``. The replica's lag is checked at most every
+``DATABASE_REPLICA_LAG_CHECK_INTERVAL`` seconds; while it is further behind
+than ``DATABASE_REPLICA_MAX_LAG`` seconds, or cannot be reached, marked
+reads fall back to the primary.
+"""
+
+import logging
+import threading
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from prometheus_client import Counter, Gauge
+
+from core.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+REPLICA_LAG = Gauge(
+    "database_replica_lag_seconds",
+    "Replication lag of the analytics replica at the last check.",
+    ["alias"],
+    multiprocess_mode="livemostrecent",
+    registry=REGISTRY,
+)
+ANALYTICS_READS = Counter(
+    "database_analytics_reads",
+    "Reads marked as analytics, by the database that served them.",
+    ["alias"],
+    registry=REGISTRY,
+)
+
+_analytics: ContextVar[bool] = ContextVar("analytics_reads", default=False)
+
+
+class analytics_reads(ContextDecorator):
+    """Send the ORM reads made inside this block to the replica, if healthy."""
+
+    def _recreate_cm(self):
+        # A fresh token holder per decorated call, which may run concurrently
+        return type(self)()
+
+    def __enter__(self):
+        self._token = _analytics.set(True)
+        return self
+
+    def __exit__(self, *exc):
+        _analytics.reset(self._token)
+        return False
+
+
+def in_analytics() -> bool:
+    return _analytics.get()
+
+
+class ReplicaLagMonitor:
+    """Per-process, rate-limited view of whether the replica is usable."""
+
+    LAG_SQL = (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+        "THEN 0 ELSE COALESCE(EXTRACT(EPOCH FROM now() - "
+        "pg_last_xact_replay_timestamp()), 0) END"
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = float("-inf")
+        self._usable = True
+
+    @property
+    def max_lag(self) -> float:
+        return getattr(settings, "DATABASE_REPLICA_MAX_LAG", 30.0)
+
+    @property
+    def interval(self) -> float:
+        return getattr(settings, "DATABASE_REPLICA_LAG_CHECK_INTERVAL", 5.0)
+
+    def lag(self, alias: str) -> float:
+        """Seconds the replica is behind; 0 on backends without replication."""
+        connection = connections[alias]
+        if connection.vendor != "postgresql":
+            return 0.0
+        with connection.cursor() as cursor:
+            cursor.execute(self.LAG_SQL)
+            return float(cursor.fetchone()[0])
+
+    def usable(self, alias: str) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at < self.interval:
+            return self._usable
+        # One thread checks; the others keep the last answer meanwhile
+        if not self._lock.acquire(blocking=False):
+            return self._usable
+        try:
+            try:
+                lag = self.lag(alias)
+            except DatabaseError:
+                logger.warning("Replica %s unreachable", alias, exc_info=True)
+                self._usable = False
+            else:
+                REPLICA_LAG.labels(alias=alias).set(lag)
+                self._usable = lag <= self.max_lag
+            self._checked_at = now
+            return self._usable
+        finally:
+            self._lock.release()
+
+    def reset(self) -> None:
+        self._checked_at = float("-inf")
+        self._usable = True
+
+
+class ReplicaRouter:
+    monitor = ReplicaLagMonitor()
+
+    @property
+    def replica(self) -> str:
+        return getattr(settings, "DATABASE_REPLICA_ALIAS", "")
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if not self.replica or not in_analytics():
+            return None
+        # Inside a transaction the primary may hold writes the replica lacks
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            alias = DEFAULT_DB_ALIAS
+        elif self.monitor.usable(self.replica):
+            alias = self.replica
+        else:
+            alias = DEFAULT_DB_ALIAS
+        ANALYTICS_READS.labels(alias=alias).inc()
+        return alias
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        return DEFAULT_DB_ALIAS if self.replica else None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # The replica holds the same rows as the primary
+        aliases = {DEFAULT_DB_ALIAS, self.replica}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if self.replica and db == self.replica:
+            return False
+        return None
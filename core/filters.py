@@ -1,6 +1,35 @@
 import django_filters
+from rest_framework.filters import SearchFilter
 
 from . import models
+from .services.search_service import SearchService
+from .services.tag_service import TagService
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    SearchFilter that uses the full-text index for searchable models and
+    returns results best match first. Other models keep DRF's behaviour.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        service = SearchService()
+        if not service.is_searchable(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return service.search(queryset, " ".join(terms))
+
+
+class TagSetFilterMixin:
+    """Comma-separated any-of / all-of filters over normalized Tag relations."""
+
+    def filter_any_of(self, queryset, name, value):
+        return TagService().filter_any(queryset, self.tag_relations[name], value)
+
+    def filter_all_of(self, queryset, name, value):
+        return TagService().filter_all(queryset, self.tag_relations[name], value)
 
 
 class ProjectFilter(django_filters.FilterSet):
@@ -23,7 +52,12 @@ class ProjectFilter(django_filters.FilterSet):
         }
 
 
-class TaskFilter(django_filters.FilterSet):
+class TaskFilter(TagSetFilterMixin, django_filters.FilterSet):
+    tags_any = django_filters.CharFilter(method="filter_any_of")
+    tags_all = django_filters.CharFilter(method="filter_all_of")
+
+    tag_relations = {"tags_any": "normalized_tags", "tags_all": "normalized_tags"}
+
     due_date_after = django_filters.DateFilter(field_name="due_date", lookup_expr="gte")
     due_date_before = django_filters.DateFilter(
         field_name="due_date", lookup_expr="lte"
@@ -47,6 +81,24 @@ class TaskFilter(django_filters.FilterSet):
         }
 
 
+class UserFilter(TagSetFilterMixin, django_filters.FilterSet):
+    skills_any = django_filters.CharFilter(method="filter_any_of")
+    skills_all = django_filters.CharFilter(method="filter_all_of")
+
+    tag_relations = {
+        "skills_any": "normalized_skills",
+        "skills_all": "normalized_skills",
+    }
+
+    class Meta:
+        model = models.User
+        fields = {
+            "role": ["exact"],
+            "department": ["exact"],
+            "status": ["exact"],
+        }
+
+
 class ExpenseFilter(django_filters.FilterSet):
     date_after = django_filters.DateFilter(field_name="date", lookup_expr="gte")
     date_before = django_filters.DateFilter(field_name="date", lookup_expr="lte")
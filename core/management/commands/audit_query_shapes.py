@@ -0,0 +1,73 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.query_audit import QueryShapeRecorder, covering_index, suggest_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports recorded query shapes by total time, with the index each one "
+        "needs and whether a declared index already serves it"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file",
+            default=settings.QUERY_SHAPE_AUDIT_FILE,
+            help="JSON lines file written by QueryShapeAuditMiddleware.",
+        )
+        parser.add_argument("--min-count", type=int, default=1)
+        parser.add_argument("--limit", type=int, default=25)
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only list shapes no declared index serves.",
+        )
+        parser.add_argument(
+            "--clear", action="store_true", help="Delete the file after reporting."
+        )
+
+    def handle(self, *args, **options):
+        path = options["file"]
+        if not os.path.exists(path):
+            raise CommandError(
+                f"No query shapes recorded at {path}. Enable QUERY_SHAPE_AUDIT first."
+            )
+
+        recorder = QueryShapeRecorder.load(path)
+        reported = 0
+        for shape, stats in sorted(
+            recorder.shapes.items(), key=lambda item: -item[1]["total_ms"]
+        ):
+            if stats["count"] < options["min_count"]:
+                continue
+            suggestion = suggest_index(shape)
+            covered_by = covering_index(shape, suggestion)
+            if options["missing_only"] and (covered_by or not suggestion):
+                continue
+
+            filters = ", ".join(f"{col} {op}" for col, op in shape.filters) or "-"
+            ordering = ", ".join(f"{col} {d}" for col, d in shape.ordering) or "-"
+            self.stdout.write(
+                f"{shape.table}: {stats['count']} queries, "
+                f"{stats['total_ms']:.1f} ms total"
+            )
+            self.stdout.write(f"    where:    {filters}")
+            self.stdout.write(f"    order by: {ordering}")
+            if covered_by:
+                self.stdout.write(f"    index:    served by {covered_by}")
+            elif suggestion:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"    index:    missing ({', '.join(suggestion)})"
+                    )
+                )
+
+            reported += 1
+            if reported >= options["limit"]:
+                break
+
+        if options["clear"]:
+            os.remove(path)
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.query_audit import critical_queries
+
+
+class Command(BaseCommand):
+    help = "Runs EXPLAIN on hot query paths and checks each uses its expected index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Execute the queries and report actual timings (PostgreSQL only).",
+        )
+        parser.add_argument(
+            "--strict",
+            action="store_true",
+            help="Exit with an error if any query does not use its expected index.",
+        )
+
+    def handle(self, *args, **options):
+        explain_options = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options = {"analyze": True, "buffers": True}
+
+        missing = []
+        for name, queryset, expected_index in critical_queries(connection.alias):
+            plan = queryset.explain(**explain_options)
+            if expected_index in plan:
+                self.stdout.write(self.style.SUCCESS(f"{name}: uses {expected_index}"))
+            else:
+                missing.append(name)
+                self.stdout.write(
+                    self.style.WARNING(f"{name}: does not use {expected_index}")
+                )
+            for line in plan.splitlines():
+                self.stdout.write(f"    {line}")
+
+        if missing and options["strict"]:
+            raise CommandError(f"Unexpected query plans: {', '.join(missing)}")
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from core.models import ReceiptBlob
+from core.services.finance.receipt_processing_service import (
+    ReceiptProcessingService,
+    missing_extractors,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates thumbnails and extracts text for receipt blobs that the "
+        "background pool has not processed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Also reprocess blobs whose last attempt failed.",
+        )
+
+    def handle(self, *args, **options):
+        missing = missing_extractors()
+        if missing:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Text extraction is limited; not installed: " + ", ".join(missing)
+                )
+            )
+
+        service = ReceiptProcessingService()
+        statuses = ["pending"]
+        if options["retry_failed"]:
+            statuses.append("failed")
+
+        counts = {}
+        blob_ids = ReceiptBlob.objects.filter(processing_status__in=statuses)
+        for blob_id in blob_ids.order_by("pk").values_list("pk", flat=True):
+            status = service.process(blob_id).processing_status
+            counts[status] = counts.get(status, 0) + 1
+
+        summary = ", ".join(
+            f"{count} {status}" for status, count in sorted(counts.items())
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Processed {sum(counts.values())} receipt(s)")
+            + (f": {summary}" if summary else "")
+        )
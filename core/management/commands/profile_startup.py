@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup import (
+    DEFERRED_MODULES,
+    deferred_imports,
+    profile_startup,
+    total_ms,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports the application in a fresh interpreter under -X importtime and "
+        "reports the slowest top-level imports. Fails when a module that should "
+        "be imported on first use is imported at startup"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=15)
+        parser.add_argument(
+            "--budget-ms",
+            type=float,
+            default=0,
+            help="Fail when the total import time exceeds this many milliseconds.",
+        )
+
+    def handle(self, *args, **options):
+        timings = profile_startup()
+        top = sorted(
+            (t for t in timings if t.depth == 0),
+            key=lambda t: t.cumulative_us,
+            reverse=True,
+        )[: options["limit"]]
+
+        self.stdout.write(f"{'module':<48} {'cumulative ms':>13} {'self ms':>9}")
+        for timing in top:
+            self.stdout.write(
+                f"{timing.module:<48} {timing.cumulative_us / 1000:>13.1f} "
+                f"{timing.self_us / 1000:>9.1f}"
+            )
+        total = total_ms(timings)
+        self.stdout.write(f"{'total':<48} {total:>13.1f}")
+
+        eager = deferred_imports(timings)
+        if eager:
+            names = ", ".join(t.module for t in eager)
+            raise CommandError(
+                f"Imported at startup: {names}. These are deferred to first use "
+                f"({', '.join(DEFERRED_MODULES)}); import them inside the code "
+                "that needs them."
+            )
+        if options["budget_ms"] and total > options["budget_ms"]:
+            raise CommandError(
+                f"Startup imports took {total:.0f} ms, over the "
+                f"{options['budget_ms']:.0f} ms budget"
+            )
+        self.stdout.write(self.style.SUCCESS("No deferred module imported at startup"))
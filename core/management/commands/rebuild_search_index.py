@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.global_search_service import GlobalSearchService
+from core.services.search_service import SearchService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the full-text search vectors of searchable models and the "
+        "global search index"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Model name to rebuild (e.g. client). Repeat for several; "
+            "defaults to all searchable models.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--global-only",
+            action="store_true",
+            help="Only rebuild the global search index.",
+        )
+
+    def handle(self, *args, **options):
+        counts = GlobalSearchService().rebuild(batch_size=options["batch_size"])
+        for entity_type, count in counts.items():
+            self.stdout.write(f"Indexed {count} {entity_type} row(s) for global search")
+        if options["global_only"]:
+            return
+
+        service = SearchService()
+        if not service.is_postgres():
+            self.stdout.write(
+                "Search vectors are only stored on PostgreSQL; nothing more to rebuild."
+            )
+            return
+
+        models = {m._meta.model_name: m for m in service.searchable_models()}
+        names = options["models"] or sorted(models)
+        unknown = set(names) - set(models)
+        if unknown:
+            raise CommandError(f"Not searchable: {', '.join(sorted(unknown))}")
+
+        for name in names:
+            count = service.rebuild(models[name], batch_size=options["batch_size"])
+            self.stdout.write(f"Indexed {count} {name} row(s)")
+
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt successfully!"))
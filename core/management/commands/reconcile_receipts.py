@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+
+from core.services.finance.receipt_service import ReceiptService
+
+
+class Command(BaseCommand):
+    help = (
+        "Links receipts uploaded before deduplication to content-addressed "
+        "blobs, merging files with identical bytes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without writing anything.",
+        )
+        parser.add_argument(
+            "--keep-duplicates",
+            action="store_true",
+            help="Do not delete files whose bytes were merged into another blob.",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Also delete blobs that no expense references.",
+        )
+
+    def handle(self, *args, **options):
+        service = ReceiptService()
+        dry_run = options["dry_run"]
+
+        stats = service.reconcile(
+            delete_duplicates=not options["keep_duplicates"], dry_run=dry_run
+        )
+        self.stdout.write(
+            f"Adopted {stats['adopted']} receipt(s), merged {stats['merged']} "
+            f"duplicate(s), deleted {stats['deleted']} redundant file(s)"
+        )
+        if stats["missing"]:
+            self.stdout.write(
+                self.style.WARNING(f"{stats['missing']} receipt file(s) are missing")
+            )
+
+        if options["prune"]:
+            pruned = service.prune(dry_run=dry_run)
+            self.stdout.write(f"Pruned {pruned} unreferenced blob(s)")
+
+        if dry_run:
+            self.stdout.write("Dry run: no changes were saved.")
+        else:
+            summary = service.summary()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{summary['blobs']} blob(s) back "
+                    f"{summary['linked_expenses']} expense receipt(s)"
+                )
+            )
@@ -0,0 +1,149 @@
+from contextlib import contextmanager
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import (
+    SCENARIOS,
+    BenchmarkRunner,
+    compare,
+    load_report,
+    over_budget,
+    report,
+    save_report,
+)
+from core.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the API and admin hot paths against the current database and "
+        "compares the results with a stored baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument(
+            "--user",
+            help="Run as this existing staff account. By default a temporary "
+            "superuser is created for the run and deleted afterwards.",
+        )
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Run only scenarios whose name starts with this (e.g. api.projects "
+            "or admin). Repeat for several.",
+        )
+        parser.add_argument("--output", help="Write the results to this JSON file.")
+        parser.add_argument("--baseline", help="Compare against this results file.")
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Write the results to the --baseline file instead of comparing.",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed latency and memory growth over the baseline, as a "
+            "fraction (default 0.2).",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when a regression is found or a scenario "
+            "misses its p95 budget.",
+        )
+
+    def handle(self, *args, **options):
+        if options["save_baseline"] and not options["baseline"]:
+            raise CommandError("--save-baseline needs --baseline")
+        scenarios = self.select(options["scenarios"])
+        with self.benchmark_user(options["user"]) as user:
+            self.benchmark(user, scenarios, options)
+
+    def benchmark(self, user, scenarios, options):
+        self.stdout.write(
+            f"{'scenario':<32} {'status':>6} {'p50':>9} {'p95':>9} {'p99':>9} "
+            f"{'queries':>7} {'peak KiB':>9}"
+        )
+
+        def progress(result):
+            self.stdout.write(
+                f"{result.name:<32} {result.status:>6} {result.p50_ms:>9.2f} "
+                f"{result.p95_ms:>9.2f} {result.p99_ms:>9.2f} "
+                f"{result.queries:>7} {result.peak_memory_kb:>9.1f}"
+            )
+
+        runner = BenchmarkRunner(
+            user,
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            scenarios=scenarios,
+        )
+        try:
+            results = runner.run(progress)
+        finally:
+            runner.client.logout()
+        current = report(results)
+
+        if options["output"]:
+            save_report(options["output"], current)
+        if options["save_baseline"]:
+            save_report(options["baseline"], current)
+            self.stdout.write(self.style.SUCCESS(f"Saved {options['baseline']}"))
+            return
+
+        failed = [result.name for result in results if result.status != 200]
+        if failed:
+            self.stdout.write(self.style.WARNING(f"Non-200: {', '.join(failed)}"))
+
+        problems = over_budget(results, scenarios)
+        if options["baseline"]:
+            regressions = compare(
+                load_report(options["baseline"]), current, options["tolerance"]
+            )
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS("No regressions against baseline"))
+            problems += regressions
+        for problem in problems:
+            self.stdout.write(self.style.ERROR(str(problem)))
+        if problems and options["fail_on_regression"]:
+            raise CommandError(
+                f"{len(problems)} regression(s) against the baseline or budgets"
+            )
+
+    def select(self, prefixes):
+        if not prefixes:
+            return SCENARIOS
+        scenarios = [
+            s for s in SCENARIOS if any(s.name.startswith(p) for p in prefixes)
+        ]
+        if not scenarios:
+            raise CommandError("No scenario matches the given --scenario")
+        return scenarios
+
+    @contextmanager
+    def benchmark_user(self, username=None):
+        """The ``--user`` account, or a superuser that only exists for the run."""
+        if username:
+            user = User.objects.filter(username=username).first()
+            if user is None:
+                raise CommandError(f"No user named {username!r}")
+            yield user
+            return
+
+        user = User(
+            username=f"benchmark-{uuid4().hex[:12]}",
+            is_staff=True,
+            is_superuser=True,
+            role="Admin",
+        )
+        user.set_unusable_password()
+        user.save()
+        try:
+            yield user
+        finally:
+            user.delete()
@@ -1,8 +1,12 @@
+import os
+from dataclasses import fields, replace
 from decimal import Decimal
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
 
 from core.models import Client, Expense, Income, Invoice, Project, User
+from core.seeding import SCALES, SeedScale, SyntheticDataGenerator
 from datetime import date, timedelta
 import random
 
@@ -10,7 +14,71 @@ import random
 class Command(BaseCommand):
     help = "Seeds the database with realistic initial data"
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SCALES),
+            help="Bulk-load a synthetic data set of this size instead of the "
+            "demo records (small: 10k tasks, medium: 100k tasks and incomes, "
+            "large: 1M incomes).",
+        )
+        for field in fields(SeedScale):
+            parser.add_argument(
+                f"--{field.name}",
+                type=int,
+                help=f"Number of {field.name} to generate; overrides --scale.",
+            )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed and scale give the same data.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes inserting chunks in parallel (PostgreSQL only; "
+            "SQLite always uses one).",
+        )
+        parser.add_argument(
+            "--no-index",
+            action="store_true",
+            help="Skip rebuilding the search index after a bulk load.",
+        )
+
+    def handle(self, *args, **options):
+        overrides = {
+            field.name: options[field.name]
+            for field in fields(SeedScale)
+            if options.get(field.name) is not None
+        }
+        if options.get("scale") or overrides:
+            self.seed_scale(options, overrides)
+            return
+        self.seed_demo()
+
+    def seed_scale(self, options, overrides):
+        scale = replace(SCALES[options.get("scale") or "small"], **overrides)
+
+        def progress(name, count):
+            self.stdout.write(f"  {name}: {count}")
+
+        counts = SyntheticDataGenerator(
+            scale,
+            seed=options["seed"],
+            chunk_size=options["chunk_size"],
+            workers=options["workers"],
+            progress=progress if options["verbosity"] > 1 else None,
+        ).run()
+        for name, count in counts.items():
+            self.stdout.write(f"Created {count} {name}")
+        if not options["no_index"]:
+            call_command("rebuild_search_index", stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS("Synthetic data seeded successfully!"))
+
+    def seed_demo(self):
         # Create Users
         admin = User.objects.create_user(
             username="admin",
@@ -28,7 +96,7 @@ class Command(BaseCommand):
             username="developer",
             email="dev@titansmanager.com",
             password="dev123",
-            role="Developer",
+            role="Employee",
         )
 
         # Create Clients
@@ -66,7 +134,7 @@ class Command(BaseCommand):
                     amount=Decimal(f"{random.randint(2000, 7000)}.00"),
                     date=date.today() - timedelta(days=random.randint(10, 30)),
                     due_date=date.today() + timedelta(days=random.randint(10, 30)),
-                    status=random.choice(["draft", "sent", "paid", "overdue"]),
+                    status=random.choice(["draft", "sent", "paid", "cancelled"]),
                 )
                 invoices.append(invoice)
 
@@ -79,16 +147,19 @@ class Command(BaseCommand):
                     client=invoice.client,
                     project=invoice.project,
                     invoice=invoice,
+                    income_type="project_payment",
                 )
 
         # Create Expenses
-        expense_categories = ["software", "hardware", "travel", "office_supplies"]
+        expense_categories = ["software", "hardware", "travel", "office"]
         payment_methods = ["credit_card", "bank_transfer", "cash"]
         vendors = ["Vendor A", "Vendor B", "Vendor C", "Vendor D"]
 
         for _ in range(10):
             Expense.objects.create(
-                title=random.choice(["Licenses", "Equipment", "Travel Expenses", "Office Supplies"]),
+                title=random.choice(
+                    ["Licenses", "Equipment", "Travel Expenses", "Office Supplies"]
+                ),
                 amount=Decimal(f"{random.randint(100, 1500)}.00"),
                 tax_amount=Decimal(f"{random.randint(10, 150)}.00"),
                 date=date.today() - timedelta(days=random.randint(1, 60)),
@@ -101,4 +172,6 @@ class Command(BaseCommand):
                 vendor=random.choice(vendors),
             )
 
-        self.stdout.write(self.style.SUCCESS("Database seeded successfully with realistic data!"))
+        self.stdout.write(
+            self.style.SUCCESS("Database seeded successfully with realistic data!")
+        )
@@ -0,0 +1,268 @@
+"""
+Application metrics, kept with ``prometheus_client``.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` in the environment (the Dockerfile sets
+it; ``settings.METRICS_DIR`` mirrors it), every process writes its values
+to files in that directory, and a scrape of any process reports the whole
+gunicorn worker pool: counters and histograms summed over every process
+that ever ran, gauges over the processes still running. The exposition is
+the OpenMetrics text format.
+"""
+
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from functools import wraps
+from typing import Callable, Dict, Iterable, List
+
+from django.conf import settings
+from django.db import connections
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.metrics_core import GaugeMetricFamily, Metric
+from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.multiprocess import mark_process_dead as _mark_dead
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST,
+    generate_latest,
+)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# This process's metrics; scrapes in multiprocess mode read the files instead
+REGISTRY = CollectorRegistry()
+
+_collectors: List[Callable] = []
+_samplers: List[Callable] = []
+_last_sample = 0.0
+
+
+def register_collector(collector: Callable) -> Callable:
+    """
+    Add ``collector(families)``, called at scrape time with the merged metric
+    families by name; it yields ``(name, documentation, labels, value)`` for
+    gauges to report alongside them.
+    """
+    _collectors.append(collector)
+    return collector
+
+
+def register_sampler(sampler: Callable) -> Callable:
+    """
+    Add ``sampler()``, called in each process before a scrape and every
+    ``METRICS_SAMPLE_INTERVAL`` seconds, to record state only that process
+    can see.
+    """
+    _samplers.append(sampler)
+    return sampler
+
+
+def sample() -> None:
+    global _last_sample
+    for sampler in _samplers:
+        sampler()
+    _last_sample = time.monotonic()
+
+
+def maybe_sample() -> None:
+    interval = getattr(settings, "METRICS_SAMPLE_INTERVAL", 1.0)
+    if _samplers and time.monotonic() - _last_sample >= interval:
+        sample()
+
+
+def collect() -> Dict[str, Metric]:
+    """Metric families of every process, merged, by name."""
+    sample()
+    directory = getattr(settings, "METRICS_DIR", "")
+    if directory:
+        source = CollectorRegistry()
+        MultiProcessCollector(source, path=directory)
+    else:
+        source = REGISTRY
+    families = {family.name: family for family in source.collect()}
+
+    for collector in _collectors:
+        for name, documentation, labels, value in list(collector(families)):
+            family = families.get(name)
+            if family is None:
+                family = families[name] = GaugeMetricFamily(name, documentation)
+            family.add_sample(name, labels, value)
+    return families
+
+
+class _Families:
+    def __init__(self, families: Iterable[Metric]):
+        self.families = list(families)
+
+    def collect(self):
+        return self.families
+
+
+def exposition() -> bytes:
+    families = sorted(collect().values(), key=lambda family: family.name)
+    return generate_latest(_Families(families))
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop an exited worker's gauges. Called from the gunicorn master only."""
+    directory = getattr(settings, "METRICS_DIR", "")
+    if directory:
+        _mark_dead(pid, directory)
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve a request, by route name.",
+    ["route", "method", "status"],
+    registry=REGISTRY,
+)
+SERVICE_LATENCY = Histogram(
+    "service_call_duration_seconds",
+    "Time spent in a service method.",
+    ["service", "method"],
+    registry=REGISTRY,
+)
+SERVICE_QUERIES = Histogram(
+    "service_call_queries",
+    "Database queries made by one service method call.",
+    ["service", "method"],
+    buckets=QUERY_BUCKETS,
+    registry=REGISTRY,
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "Lookups in application caches, by result.",
+    ["cache", "result"],
+    registry=REGISTRY,
+)
+QUEUE_DEPTH = Gauge(
+    "background_queue_depth",
+    "Jobs queued or running on in-process background pools.",
+    ["queue"],
+    multiprocess_mode="livesum",
+    registry=REGISTRY,
+)
+DB_CONNECTIONS_OPENED = Counter(
+    "database_connections_opened",
+    "New database connections outside a pool; low when connections are reused.",
+    ["alias"],
+    registry=REGISTRY,
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "database_pool_connections",
+    "Connections in the worker processes' pools, by state.",
+    ["alias", "state"],
+    multiprocess_mode="livesum",
+    registry=REGISTRY,
+)
+DB_POOL_CHECKOUTS = Counter(
+    "database_pool_checkouts",
+    "Connections handed out by the pool.",
+    ["alias"],
+    registry=REGISTRY,
+)
+DB_POOL_WAITS = Counter(
+    "database_pool_waits",
+    "Checkouts that had to wait for a free connection.",
+    ["alias"],
+    registry=REGISTRY,
+)
+DB_POOL_WAIT_SECONDS = Counter(
+    "database_pool_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["alias"],
+    registry=REGISTRY,
+)
+DB_POOL_ERRORS = Counter(
+    "database_pool_errors",
+    "Checkouts that failed, including timeouts.",
+    ["alias"],
+    registry=REGISTRY,
+)
+
+
+@register_collector
+def cache_hit_ratios(families):
+    totals = defaultdict(lambda: [0.0, 0.0])
+    family = families.get("cache_requests")
+    for sample in family.samples if family else ():
+        if sample.name.endswith("_total"):
+            cache = sample.labels["cache"]
+            totals[cache][0 if sample.labels["result"] == "hit" else 1] += sample.value
+    for cache, (hits, misses) in totals.items():
+        if hits + misses:
+            yield (
+                "cache_hit_ratio",
+                "Share of application cache lookups that hit.",
+                {"cache": cache},
+                hits / (hits + misses),
+            )
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def record_pool_stats(alias: str, stats: Dict) -> None:
+    """
+    Record ``psycopg_pool`` statistics: the gauges as they are now, the
+    counters as the deltas ``pop_stats()`` returns since its last call.
+    """
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    DB_POOL_CONNECTIONS.labels(alias=alias, state="in_use").set(size - available)
+    DB_POOL_CONNECTIONS.labels(alias=alias, state="idle").set(available)
+    DB_POOL_CONNECTIONS.labels(alias=alias, state="waiting").set(
+        stats.get("requests_waiting", 0)
+    )
+    DB_POOL_CHECKOUTS.labels(alias=alias).inc(stats.get("requests_num", 0))
+    DB_POOL_WAITS.labels(alias=alias).inc(stats.get("requests_queued", 0))
+    DB_POOL_WAIT_SECONDS.labels(alias=alias).inc(
+        stats.get("requests_wait_ms", 0) / 1000
+    )
+    DB_POOL_ERRORS.labels(alias=alias).inc(stats.get("requests_errors", 0))
+
+
+@register_sampler
+def database_pools():
+    for alias in connections:
+        # Pools Django has opened in this process, without creating any
+        pools = getattr(type(connections[alias]), "_connection_pools", {})
+        pool = pools.get(alias)
+        if pool is not None:
+            record_pool_stats(alias, pool.pop_stats())
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Record the latency and query count of each call to a service method.
+    ``BaseService`` applies this to the public methods of its subclasses.
+    """
+    method_name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        counter = _QueryCounter()
+        labels = {"service": type(self).__name__, "method": method_name}
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(counter))
+                return method(self, *args, **kwargs)
+        finally:
+            SERVICE_LATENCY.labels(**labels).observe(time.perf_counter() - started)
+            SERVICE_QUERIES.labels(**labels).observe(counter.count)
+
+    wrapper.instrumented = True
+    return wrapper
@@ -0,0 +1,172 @@
+import threading
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from core.metrics import REQUEST_LATENCY, maybe_sample
+from core.profiling import ProfileWriter, get_sampler
+from core.query_audit import QueryShapeRecorder
+
+
+class RequestMetricsMiddleware:
+    """
+    Records request latency per route name in ``REQUEST_LATENCY`` and
+    periodically samples the state only this process can see (its
+    connection pools), so any worker can serve ``/metrics`` for all of them.
+    Runs in sync and async middleware chains alike.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.record(request, response, started)
+        return response
+
+    def record(self, request, response, started: float) -> None:
+        match = getattr(request, "resolver_match", None)
+        REQUEST_LATENCY.labels(
+            route=match.view_name if match else "unmatched",
+            method=request.method,
+            status=response.status_code,
+        ).observe(time.perf_counter() - started)
+        maybe_sample()
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also runs in an async middleware chain. WhiteNoise is
+    sync-only, and a single sync middleware makes Django hand every request
+    under ASGI, static or not, to a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(
+                request.path_info
+            )
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opening the file stats the disk
+            return await sync_to_async(self.serve, thread_sensitive=False)(
+                static_file, request
+            )
+        return await self.get_response(request)
+
+
+class QueryShapeAuditMiddleware:
+    """
+    Records the shape of every query made while serving requests and appends
+    them to ``QUERY_SHAPE_AUDIT_FILE`` every ``QUERY_SHAPE_AUDIT_FLUSH_EVERY``
+    requests. Enabled with ``QUERY_SHAPE_AUDIT = True``; report with
+    ``manage.py audit_query_shapes``.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_SHAPE_AUDIT", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.recorder = QueryShapeRecorder()
+        self.path = settings.QUERY_SHAPE_AUDIT_FILE
+        self.flush_every = getattr(settings, "QUERY_SHAPE_AUDIT_FLUSH_EVERY", 100)
+        self._requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with connections["default"].execute_wrapper(self.recorder):
+            response = self.get_response(request)
+
+        with self._lock:
+            self._requests += 1
+            flush = self._requests >= self.flush_every
+            if flush:
+                self._requests = 0
+        if flush:
+            self.recorder.flush(self.path)
+        return response
+
+
+class SamplingProfilerMiddleware:
+    """
+    Samples the stacks and times the SQL of requests, keeping a profile for
+    those slower than ``PROFILING_SLOW_MS`` and for staff requests sent with
+    ``X-Profile: 1``. Profiles go to ``PROFILING_DIR``, which keeps the newest
+    ``PROFILING_MAX_PROFILES``. Enabled with ``PROFILING_ENABLED = True``;
+    see core/profiling.py.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "PROFILING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.sampler = get_sampler(
+            getattr(settings, "PROFILING_INTERVAL_MS", 10) / 1000
+        )
+        # The signal handler can only be installed from the main thread,
+        # which is where WSGI handlers load their middleware
+        if not self.sampler.installed and not self.sampler.install():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_ms = getattr(settings, "PROFILING_SLOW_MS", 1000)
+        self.writer = ProfileWriter(
+            settings.PROFILING_DIR, getattr(settings, "PROFILING_MAX_PROFILES", 100)
+        )
+
+    def __call__(self, request):
+        requested = request.headers.get("X-Profile") == "1"
+        if not requested and self.slow_ms <= 0:
+            return self.get_response(request)
+
+        session = self.sampler.start()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(session))
+                response = self.get_response(request)
+        finally:
+            self.sampler.stop(session)
+
+        duration_ms = session.elapsed_ms()
+        # Read after the view ran, so API token authentication has happened
+        user = getattr(request, "user", None)
+        by_staff = requested and user is not None and user.is_staff
+        if by_staff or (self.slow_ms > 0 and duration_ms >= self.slow_ms):
+            match = getattr(request, "resolver_match", None)
+            route = match.view_name if match else request.path
+            self.writer.write(session, f"{request.method} {route}", duration_ms)
+        return response
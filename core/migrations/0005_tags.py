@@ -0,0 +1,88 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:42
+
+from django.db import migrations, models
+
+
+def _parse(value):
+    if not value:
+        return set()
+    return {
+        " ".join(part.split()).lower()[:50] for part in value.split(",") if part.strip()
+    }
+
+
+def backfill_tags(apps, schema_editor):
+    """Create Tag rows and relations from the existing comma-separated strings."""
+    Tag = apps.get_model("core", "Tag")
+    Task = apps.get_model("core", "Task")
+    User = apps.get_model("core", "User")
+
+    sources = [
+        (Task, "tags", Task.normalized_tags.through, "task_id"),
+        (User, "skills", User.normalized_skills.through, "user_id"),
+    ]
+    parsed = []
+    names = set()
+    for model, field, through, column in sources:
+        rows = model.objects.exclude(**{f"{field}__isnull": True}).exclude(
+            **{field: ""}
+        )
+        for pk, value in rows.values_list("pk", field).iterator():
+            tags = _parse(value)
+            names |= tags
+            parsed.append((through, column, pk, tags))
+
+    Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list("name", "id"))
+
+    for through in {entry[0] for entry in parsed}:
+        links = [
+            through(**{column: pk, "tag_id": tag_ids[name]})
+            for model_through, column, pk, tags in parsed
+            if model_through is through
+            for name in tags
+        ]
+        through.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_task_assigned_to_nullable"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="normalized_tags",
+            field=models.ManyToManyField(
+                blank=True, editable=False, related_name="tasks", to="core.tag"
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="normalized_skills",
+            field=models.ManyToManyField(
+                blank=True, editable=False, related_name="users", to="core.tag"
+            ),
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
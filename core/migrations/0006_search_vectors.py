@@ -0,0 +1,62 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:43
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+SEARCH_TABLES = ["core_client", "core_expense", "core_project", "core_task"]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in SEARCH_TABLES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_search_gin "
+            f"ON {table} USING gin (search_vector)"
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in SEARCH_TABLES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_tags"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="client",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="expense",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:46
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+def create_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_searchentry_search_gin "
+        "ON core_searchentry USING gin (search_vector)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS core_searchentry_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_search_vectors"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        editable=False, null=True
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("client", "Client"),
+                            ("project", "Project"),
+                            ("task", "Task"),
+                            ("invoice", "Invoice"),
+                            ("expense", "Expense"),
+                            ("income", "Income"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("title", models.CharField(max_length=255)),
+                ("subtitle", models.CharField(blank=True, max_length=255)),
+                ("keywords", models.TextField(blank=True)),
+                ("body", models.TextField(blank=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "Search entries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("entity_type", "object_id"), name="unique_search_entry"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.5 on 2026-10-19 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_global_search_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="core_task_assigne_5f3995_idx",
+        ),
+        migrations.AddIndex(
+            model_name="income",
+            index=models.Index(
+                fields=["status", "date"], name="income_status_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="income",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["expected_date"],
+                name="income_pending_expected_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="invoice",
+            index=models.Index(fields=["date"], name="core_invoic_date_85ec84_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="invoice",
+            index=models.Index(
+                fields=["status", "date"], name="invoice_status_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="invoice",
+            index=models.Index(
+                condition=models.Q(("status", "sent")),
+                fields=["due_date"],
+                name="invoice_sent_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["assigned_to", "status", "due_date"],
+                name="task_assignee_status_due_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Columns searched with "^field" (istartswith) by admin autocomplete. Django
+# compiles that to UPPER("col"::text) LIKE UPPER('term%'), which can only use
+# an expression index with a pattern operator class.
+PREFIX_COLUMNS = [
+    ("core_user", "username"),
+    ("core_user", "first_name"),
+    ("core_user", "last_name"),
+    ("core_user", "email"),
+    ("core_invoice", "invoice_number"),
+]
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in PREFIX_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_{column}_prefix "
+            f"ON {table} (UPPER({column}::text) text_pattern_ops)"
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in PREFIX_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_{column}_prefix")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
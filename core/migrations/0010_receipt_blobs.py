@@ -0,0 +1,58 @@
+# Generated by Django 5.1.5 on 2026-10-19 13:14
+
+import core.custom_storage
+import core.models.finance.receipt_blob
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_autocomplete_prefix_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReceiptBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("sha256", models.CharField(max_length=64, unique=True)),
+                ("size", models.PositiveBigIntegerField()),
+                ("content_type", models.CharField(blank=True, max_length=100)),
+                (
+                    "file",
+                    models.FileField(
+                        max_length=255,
+                        storage=core.custom_storage.AzureReceiptStorage(),
+                        upload_to=core.models.finance.receipt_blob.ReceiptBlob.blob_upload_path,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="expense",
+            name="receipt_blob",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="expenses",
+                to="core.receiptblob",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.5 on 2026-10-19 13:17
+
+import core.custom_storage
+import core.models.finance.receipt_blob
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_receipt_blobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="receiptblob",
+            name="detected_amount",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=18, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="receiptblob",
+            name="extracted_text",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="receiptblob",
+            name="processed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="receiptblob",
+            name="processing_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("done", "Done"),
+                    ("unsupported", "Unsupported"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="receiptblob",
+            name="thumbnail",
+            field=models.FileField(
+                blank=True,
+                max_length=255,
+                storage=core.custom_storage.AzureReceiptStorage(),
+                upload_to=core.models.finance.receipt_blob.ReceiptBlob.blob_upload_path,
+            ),
+        ),
+    ]
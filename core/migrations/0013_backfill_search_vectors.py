@@ -0,0 +1,34 @@
+from django.apps import apps as global_apps
+from django.db import migrations
+
+SEARCH_MODELS = ["client", "expense", "project", "task"]
+
+
+def backfill_search_vectors(apps, schema_editor):
+    """
+    Fill the vectors added in 0006 for rows that existed before it, so they
+    are searchable without a manual ``rebuild_search_index``.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    from core.services.search_service import SearchService
+
+    service = SearchService()
+    for name in SEARCH_MODELS:
+        service.rebuild(
+            apps.get_model("core", name),
+            batch_size=5000,
+            weights=global_apps.get_model("core", name).search_weights,
+            using=schema_editor.connection.alias,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_revoked_tokens"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
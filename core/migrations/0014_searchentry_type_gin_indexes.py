@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# Global search always filters on one entity type. A GIN index per type
+# keeps a rare term's lookup to that type's postings instead of every
+# type's, which for a common prefix are most of the index.
+ENTITY_TYPES = ["client", "project", "task", "invoice", "expense", "income"]
+
+
+def create_type_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for entity_type in ENTITY_TYPES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS core_searchentry_{entity_type}_gin "
+            f"ON core_searchentry USING gin (search_vector) "
+            f"WHERE entity_type = '{entity_type}'"
+        )
+    schema_editor.execute("DROP INDEX IF EXISTS core_searchentry_search_gin")
+
+
+def drop_type_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_searchentry_search_gin "
+        "ON core_searchentry USING gin (search_vector)"
+    )
+    for entity_type in ENTITY_TYPES:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS core_searchentry_{entity_type}_gin"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0013_backfill_search_vectors"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_type_indexes, drop_type_indexes),
+    ]
@@ -1,3 +1,4 @@
+from .tag import Tag
 from .client import Client
 from .project import Project
 from .task import Task
@@ -5,8 +6,12 @@ from .user import User
 from .finance.expense import Expense
 from .finance.income import Income
 from .finance.invoice import Invoice
+from .finance.receipt_blob import ReceiptBlob
+from .search_entry import SearchEntry
+from .revoked_token import RevokedToken
 
 __all__ = [
+    "Tag",
     "Client",
     "Project",
     "Task",
@@ -14,4 +19,7 @@ __all__ = [
     "Expense",
     "Income",
     "Invoice",
+    "ReceiptBlob",
+    "SearchEntry",
+    "RevokedToken",
 ]
@@ -1,9 +1,10 @@
 from django.db import models
 
+from .mixins.searchable import SearchableMixin
 from .mixins.timestamp import TimestampMixin
 
 
-class Client(TimestampMixin):
+class Client(SearchableMixin, TimestampMixin):
     STATUS_CHOICES = [
         ("active", "Active"),
         ("inactive", "Inactive"),
@@ -42,6 +43,17 @@ class Client(TimestampMixin):
     billing_email = models.EmailField(blank=True, null=True)
     payment_terms = models.IntegerField(default=30, help_text="Payment terms in days")
 
+    search_weights = {
+        "name": "A",
+        "company": "A",
+        "email": "B",
+        "tax_number": "B",
+        "phone": "C",
+        "city": "C",
+        "address": "D",
+        "notes": "D",
+    }
+
     class Meta:
         ordering = ["name"]
         indexes = [
@@ -3,11 +3,12 @@ import datetime
 from django.db import models
 
 from ...custom_storage import AzureReceiptStorage
+from ..mixins.searchable import SearchableMixin
 from ..mixins.timestamp import TimestampMixin
 from . import CATEGORY_CHOICES
 
 
-class Expense(TimestampMixin):
+class Expense(SearchableMixin, TimestampMixin):
 
     PAYMENT_METHOD_CHOICES = [
         ("cash", "Cash"),
@@ -92,6 +93,16 @@ class Expense(TimestampMixin):
     # Metadata
     notes = models.TextField(blank=True, null=True)
 
+    search_weights = {
+        "title": "A",
+        "vendor": "A",
+        "invoice_number": "B",
+        "payment_reference": "B",
+        "category": "C",
+        "description": "C",
+        "notes": "D",
+    }
+
     class Meta:
         ordering = ["-date", "-created_at"]
         indexes = [
@@ -135,3 +146,13 @@ class Expense(TimestampMixin):
         blank=True,
         storage=AzureReceiptStorage(),
     )
+    # Set from ``receipt`` uploads by ReceiptService; ``receipt`` then names
+    # the blob's file
+    receipt_blob = models.ForeignKey(
+        "ReceiptBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="expenses",
+    )
@@ -78,6 +78,12 @@ class Income(TimestampMixin):
             models.Index(fields=["date"]),
             models.Index(fields=["status"]),
             models.Index(fields=["income_type"]),
+            models.Index(fields=["status", "date"], name="income_status_date_idx"),
+            models.Index(
+                fields=["expected_date"],
+                condition=models.Q(status="pending"),
+                name="income_pending_expected_idx",
+            ),
         ]
         verbose_name = "Income"
         verbose_name_plural = "Income"
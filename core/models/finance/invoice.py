@@ -41,6 +41,15 @@ class Invoice(TimestampMixin):
 
     class Meta:
         ordering = ["-date"]
+        indexes = [
+            models.Index(fields=["date"]),
+            models.Index(fields=["status", "date"], name="invoice_status_date_idx"),
+            models.Index(
+                fields=["due_date"],
+                condition=models.Q(status="sent"),
+                name="invoice_sent_due_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Invoice #{self.invoice_number} - {self.client.name}"
@@ -0,0 +1,56 @@
+from django.db import models
+
+from ...custom_storage import AzureReceiptStorage
+from ..mixins.timestamp import TimestampMixin
+
+
+class ReceiptBlob(TimestampMixin):
+    """
+    One stored receipt file, keyed by the SHA-256 of its bytes. Every
+    expense that uploads the same file references the same blob.
+
+    The thumbnail, text and amount are derived in the background by
+    ``ReceiptProcessingService`` once the blob is created.
+    """
+
+    PROCESSING_CHOICES = [
+        ("pending", "Pending"),
+        ("done", "Done"),
+        ("unsupported", "Unsupported"),
+        ("failed", "Failed"),
+    ]
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveBigIntegerField()
+    content_type = models.CharField(max_length=100, blank=True)
+
+    def blob_upload_path(instance, filename):
+        """
+        Generate the upload path for receipt blobs.
+        Format: receipts/blobs/<first two hash characters>/filename
+        """
+        return f"receipts/blobs/{instance.sha256[:2]}/{filename}"
+
+    file = models.FileField(
+        upload_to=blob_upload_path,
+        max_length=255,
+        storage=AzureReceiptStorage(),
+    )
+
+    thumbnail = models.FileField(
+        upload_to=blob_upload_path,
+        max_length=255,
+        storage=AzureReceiptStorage(),
+        blank=True,
+    )
+    extracted_text = models.TextField(blank=True)
+    detected_amount = models.DecimalField(
+        max_digits=18, decimal_places=2, null=True, blank=True
+    )
+    processing_status = models.CharField(
+        max_length=20, choices=PROCESSING_CHOICES, default="pending"
+    )
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.file.name} ({self.sha256[:12]})"
@@ -0,0 +1,31 @@
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+
+class SearchableMixin(models.Model):
+    """
+    Adds a weighted full-text search document to a model.
+
+    ``search_weights`` maps attribute paths (dotted for related objects, e.g.
+    ``"client.name"``) to Postgres weights ``"A"``-``"D"``. On Postgres the
+    document is stored in ``search_vector`` and kept current on save; other
+    backends search the same paths with ranked ``icontains`` lookups.
+    """
+
+    search_weights = {}
+
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def get_search_document(self):
+        """Return ``{weight: text}`` built from ``search_weights``."""
+        document = {}
+        for path, weight in self.search_weights.items():
+            value = self
+            for attr in path.split("."):
+                value = getattr(value, attr, None) if value is not None else None
+            if value:
+                document.setdefault(weight, []).append(str(value))
+        return {weight: " ".join(parts) for weight, parts in document.items()}
@@ -0,0 +1,39 @@
+class TagSyncMixin:
+    """
+    Keeps normalized Tag relations in step with comma-separated text fields.
+
+    Subclasses map each source field to its ManyToMany relation, e.g.
+    ``tag_fields = {"tags": "normalized_tags"}``. Relations are only rewritten
+    when the source value changed since the instance was loaded.
+    """
+
+    tag_fields = {}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tag_snapshot = {
+            source: getattr(instance, source)
+            for source in cls.tag_fields
+            if source in field_names
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or set(update_fields) & set(self.tag_fields):
+            self.sync_tags()
+
+    def sync_tags(self, force=False):
+        """Rewrite the Tag relations for any source field that changed."""
+        from core.models.tag import Tag
+
+        snapshot = getattr(self, "_tag_snapshot", {})
+        for source, relation in self.tag_fields.items():
+            value = getattr(self, source)
+            if not force and source in snapshot and snapshot[source] == value:
+                continue
+            getattr(self, relation).set(Tag.get_or_create_many(Tag.parse(value)))
+            snapshot[source] = value
+        self._tag_snapshot = snapshot
@@ -4,10 +4,11 @@ from django.db import models
 from django.utils import timezone
 
 from core.models import Client
+from core.models.mixins.searchable import SearchableMixin
 from core.models.mixins.timestamp import TimestampMixin
 
 
-class Project(TimestampMixin):
+class Project(SearchableMixin, TimestampMixin):
     STATUS_CHOICES = [
         ("planning", "Planning"),
         ("in_progress", "In Progress"),
@@ -69,6 +70,15 @@ class Project(TimestampMixin):
     documentation_url = models.URLField(blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
 
+    search_weights = {
+        "code": "A",
+        "name": "A",
+        "client.name": "B",
+        "manager.username": "C",
+        "description": "C",
+        "notes": "D",
+    }
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
@@ -103,7 +113,7 @@ class Project(TimestampMixin):
     @property
     def completion_percentage(self):
         """Calculate project completion percentage."""
-        completed_tasks = self.tasks.filter(status="Completed").count()
+        completed_tasks = self.tasks.filter(status="completed").count()
         total_tasks = self.tasks.count()
         if total_tasks == 0:
             return 0
@@ -137,7 +147,7 @@ class Project(TimestampMixin):
 
     def get_open_tasks_count(self):
         """Get count of open tasks."""
-        return self.tasks.exclude(status="Completed").count()
+        return self.tasks.exclude(status="completed").count()
 
     def get_project_duration(self):
         """Calculate project duration in days."""
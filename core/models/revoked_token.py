@@ -0,0 +1,27 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked JWT, or with ``user`` set, every token of that user issued
+    before ``revoked_at``. Rows are only needed until ``expires_at``, when
+    the tokens they cover have expired anyway.
+    """
+
+    jti = models.CharField(max_length=64, blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="revoked_tokens",
+    )
+    revoked_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        if self.user_id:
+            return f"Tokens of user {self.user_id} before {self.revoked_at}"
+        return f"Token {self.jti}"
@@ -0,0 +1,42 @@
+from django.db import models
+
+from .mixins.searchable import SearchableMixin
+
+
+class SearchEntry(SearchableMixin):
+    """
+    Denormalized row of the global search index, one per indexed object.
+
+    ``title`` carries the strongest weight, ``keywords`` holds related names
+    and references, ``body`` holds longer free text.
+    """
+
+    ENTITY_CHOICES = [
+        ("client", "Client"),
+        ("project", "Project"),
+        ("task", "Task"),
+        ("invoice", "Invoice"),
+        ("expense", "Expense"),
+        ("income", "Income"),
+    ]
+
+    entity_type = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    keywords = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    search_weights = {"title": "A", "keywords": "B", "body": "C"}
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "object_id"], name="unique_search_entry"
+            )
+        ]
+        verbose_name_plural = "Search entries"
+
+    def __str__(self):
+        return f"{self.get_entity_type_display()}: {self.title}"
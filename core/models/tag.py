@@ -0,0 +1,41 @@
+from typing import Iterable, List, Optional
+
+from django.db import models
+
+
+class Tag(models.Model):
+    """Normalized label shared by task tags and user skills."""
+
+    name = models.CharField(max_length=50, unique=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(str(name).split()).lower()[:50]
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> List[str]:
+        """Split a comma-separated string into sorted, unique, normalized names."""
+        if not value:
+            return []
+        if not isinstance(value, str):
+            value = ",".join(value)
+        return sorted(
+            {cls.normalize(part) for part in value.split(",") if part.strip()}
+        )
+
+    @classmethod
+    def get_or_create_many(cls, names: Iterable[str]) -> List["Tag"]:
+        """Return Tag rows for ``names``, creating any that are missing."""
+        names = sorted({cls.normalize(name) for name in names if str(name).strip()})
+        if not names:
+            return []
+        cls.objects.bulk_create(
+            [cls(name=name) for name in names], ignore_conflicts=True
+        )
+        return list(cls.objects.filter(name__in=names))
@@ -4,10 +4,12 @@ from django.db import models
 from django.utils import timezone
 
 from core.models import Project
+from core.models.mixins.searchable import SearchableMixin
+from core.models.mixins.tagged import TagSyncMixin
 from core.models.mixins.timestamp import TimestampMixin
 
 
-class Task(TimestampMixin):
+class Task(TagSyncMixin, SearchableMixin, TimestampMixin):
     STATUS_CHOICES = [
         ("pending", "Pending"),
         ("in_progress", "In Progress"),
@@ -45,7 +47,11 @@ class Task(TimestampMixin):
     # Relations
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="tasks")
     assigned_to = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="tasks"
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="tasks",
     )
     reviewer = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -79,6 +85,22 @@ class Task(TimestampMixin):
     tags = models.CharField(
         max_length=200, blank=True, null=True, help_text="Comma-separated tags"
     )
+    normalized_tags = models.ManyToManyField(
+        "Tag", related_name="tasks", blank=True, editable=False
+    )
+
+    tag_fields = {"tags": "normalized_tags"}
+
+    search_weights = {
+        "name": "A",
+        "tags": "B",
+        "project.name": "B",
+        "assigned_to.username": "C",
+        "assigned_to.first_name": "C",
+        "assigned_to.last_name": "C",
+        "description": "C",
+        "notes": "D",
+    }
 
     class Meta:
         ordering = ["-priority", "due_date"]
@@ -86,7 +108,10 @@ class Task(TimestampMixin):
             models.Index(fields=["status"]),
             models.Index(fields=["priority"]),
             models.Index(fields=["due_date"]),
-            models.Index(fields=["assigned_to"]),
+            models.Index(
+                fields=["assigned_to", "status", "due_date"],
+                name="task_assignee_status_due_idx",
+            ),
         ]
 
     def __str__(self):
@@ -3,8 +3,10 @@ from django.core.validators import RegexValidator
 from django.db import models
 from django.utils import timezone
 
+from core.models.mixins.tagged import TagSyncMixin
 
-class User(AbstractUser):
+
+class User(TagSyncMixin, AbstractUser):
     ROLE_CHOICES = [
         ("Admin", "Admin"),
         ("Manager", "Manager"),
@@ -72,6 +74,9 @@ class User(AbstractUser):
         null=True,
         help_text="Comma-separated list of skills",
     )
+    normalized_skills = models.ManyToManyField(
+        "Tag", related_name="users", blank=True, editable=False
+    )
     certifications = models.TextField(blank=True, null=True)
 
     # Work Schedule
@@ -87,6 +92,8 @@ class User(AbstractUser):
     login_attempts = models.IntegerField(default=0)
     last_login_attempt = models.DateTimeField(null=True, blank=True)
 
+    tag_fields = {"skills": "normalized_skills"}
+
     class Meta:
         ordering = ["username"]
         indexes = [
@@ -121,10 +128,10 @@ class User(AbstractUser):
         return self.subordinates.count()
 
     def get_current_tasks(self):
-        return self.tasks.exclude(status="Completed")
+        return self.tasks.exclude(status="completed")
 
     def get_completed_tasks(self):
-        return self.tasks.filter(status="Completed")
+        return self.tasks.filter(status="completed")
 
     def get_assigned_projects(self):
         return self.assigned_projects.all()
@@ -133,7 +140,7 @@ class User(AbstractUser):
         return self.managed_projects.all()
 
     def get_total_hours_worked(self, start_date=None, end_date=None):
-        tasks = self.tasks.filter(status="Completed")
+        tasks = self.tasks.filter(status="completed")
         if start_date:
             tasks = tasks.filter(completed_at__gte=start_date)
         if end_date:
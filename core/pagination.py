@@ -0,0 +1,120 @@
+import json
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+def _reltuples(queryset: QuerySet) -> Optional[int]:
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 until the table has been vacuumed or analyzed
+    if row is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+def _plan_rows(queryset: QuerySet) -> Optional[int]:
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    # psycopg decodes the json column; other adapters hand back text
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Planner estimate of ``queryset.count()``, or None when the database
+    cannot provide one. Unfiltered querysets read ``pg_class.reltuples``;
+    filtered ones use the row estimate of the top node of their plan.
+    """
+    if not isinstance(queryset, QuerySet):
+        return None
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    query = queryset.query
+    if query.is_sliced or query.distinct or query.combinator or query.group_by:
+        return None
+    if not query.has_filters():
+        return _reltuples(queryset)
+    return _plan_rows(queryset)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts planner estimates for large result sets.
+
+    When the estimate is below ``ESTIMATED_COUNT_THRESHOLD`` the exact
+    ``COUNT(*)`` is cheap and is used instead, so small or narrowly filtered
+    lists page exactly. Above it the page count is approximate: trailing
+    pages may come back short or empty.
+    """
+
+    is_estimated = False
+
+    @property
+    def threshold(self) -> int:
+        return getattr(settings, "ESTIMATED_COUNT_THRESHOLD", 100000)
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate >= self.threshold:
+            self.is_estimated = True
+            return estimate
+        return super().count
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page-number API pagination backed by ``EstimatedCountPaginator``.
+
+    Opt-in: only requests that pass ``page`` or ``page_size`` get a page
+    object; others keep the plain list the API has always returned.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        requested = {self.page_query_param, self.page_size_query_param}
+        if not requested & set(request.query_params):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.page.paginator.count,
+                "count_is_estimate": self.page.paginator.is_estimated,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count_is_estimate"] = {
+            "type": "boolean",
+            "example": False,
+        }
+        return response_schema
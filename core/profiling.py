@@ -0,0 +1,178 @@
+"""
+Sampling profiler for slow requests.
+
+A wall-clock interval timer (``SIGALRM``) interrupts the process every
+``PROFILING_INTERVAL_MS`` while at least one request is being profiled;
+the handler records the stack of each profiled request's thread. Nothing is
+armed between profiled requests, so an idle process pays nothing. Profiles
+are written as collapsed stacks, the input format of flamegraph.pl and
+speedscope, next to a JSON timeline of the request's SQL.
+"""
+
+import json
+import os
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+MAX_DEPTH = 128
+
+_PATH_MARKERS = ("site-packages" + os.sep, os.getcwd() + os.sep)
+_labels: Dict[object, str] = {}
+
+
+def _frame_label(code) -> str:
+    label = _labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        for marker in _PATH_MARKERS:
+            if marker in filename:
+                filename = filename.split(marker, 1)[1]
+                break
+        label = _labels[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+    return label
+
+
+def collapse(frame) -> str:
+    """The stack ending at ``frame``, outermost first, joined by ``;``."""
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class ProfileSession:
+    """Stack samples and SQL timings collected for one request."""
+
+    def __init__(self, thread_id: int):
+        self.thread_id = thread_id
+        self.started = time.perf_counter()
+        self.samples: Counter = Counter()
+        self.queries: List[Dict] = []
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def __call__(self, execute, sql, params, many, context):
+        """``connection.execute_wrapper`` timing each query of the request."""
+        start_ms = self.elapsed_ms()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "start_ms": round(start_ms, 3),
+                    "duration_ms": round(self.elapsed_ms() - start_ms, 3),
+                    "sql": sql,
+                    "alias": context["connection"].alias,
+                }
+            )
+
+
+class StackSampler:
+    """
+    Process-wide ``SIGALRM`` sampler. ``install()`` must run on the main
+    thread; sessions may then start and stop on any thread.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._sessions: Dict[int, ProfileSession] = {}
+        self._lock = threading.Lock()
+        self.installed = False
+
+    def install(self) -> bool:
+        if not hasattr(signal, "setitimer"):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        signal.signal(signal.SIGALRM, self._sample)
+        self.installed = True
+        return True
+
+    def _sample(self, signum, frame):
+        # Runs between bytecodes of the main thread: no locks, no I/O
+        frames = sys._current_frames()
+        for session in list(self._sessions.values()):
+            stack = frames.get(session.thread_id)
+            if stack is not None:
+                session.samples[collapse(stack)] += 1
+
+    def start(self) -> ProfileSession:
+        session = ProfileSession(threading.get_ident())
+        with self._lock:
+            self._sessions[session.thread_id] = session
+            if len(self._sessions) == 1:
+                signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        return session
+
+    def stop(self, session: ProfileSession) -> None:
+        with self._lock:
+            self._sessions.pop(session.thread_id, None)
+            if not self._sessions:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+class ProfileWriter:
+    """Writes profiles into ``directory``, keeping the newest ``max_profiles``."""
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def write(self, session: ProfileSession, label: str, duration_ms: float) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "-", label).strip("-")[:80] or "request"
+        stem = os.path.join(
+            self.directory,
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{slug}-{duration_ms:.0f}ms",
+        )
+        with open(f"{stem}.folded", "w", encoding="utf-8") as handle:
+            for stack, count in session.samples.most_common():
+                handle.write(f"{stack} {count}\n")
+        with open(f"{stem}.sql.json", "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "request": label,
+                    "duration_ms": round(duration_ms, 3),
+                    "samples": sum(session.samples.values()),
+                    "queries": session.queries,
+                },
+                handle,
+                indent=1,
+            )
+        self.prune()
+        return stem
+
+    def prune(self) -> None:
+        profiles = {}
+        for name in os.listdir(self.directory):
+            stem = name.split(".", 1)[0]
+            path = os.path.join(self.directory, name)
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            profiles.setdefault(stem, []).append((mtime, path))
+        ordered = sorted(profiles.values(), key=lambda files: max(files)[0])
+        for files in ordered[: max(len(ordered) - self.max_profiles, 0)]:
+            for _, path in files:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+
+
+_sampler: Optional[StackSampler] = None
+
+
+def get_sampler(interval: float) -> StackSampler:
+    global _sampler
+    if _sampler is None:
+        _sampler = StackSampler(interval)
+    return _sampler
@@ -0,0 +1,277 @@
+"""
+Query-shape auditing.
+
+Records which columns real ORM queries filter and order on, per table, so
+index decisions follow actual traffic rather than guesswork. Literal values
+are never recorded, only the shape of the statement.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.apps import apps
+from django.db import connections
+
+QueryShape = namedtuple("QueryShape", ["table", "filters", "ordering"])
+
+EQUALITY_OPERATORS = {"=", "IN", "IS"}
+
+_TABLE_RE = re.compile(r'\bFROM\s+"(?P<table>\w+)"', re.IGNORECASE)
+_PREDICATE_RE = re.compile(
+    r'"(?P<table>\w+)"\."(?P<column>\w+)"\s*'
+    r"(?P<op>=|<>|!=|<=|>=|<|>|\bIN\b|\bIS\b|\bLIKE\b|\bBETWEEN\b)",
+    re.IGNORECASE,
+)
+_ORDER_RE = re.compile(
+    r'"(?P<table>\w+)"\."(?P<column>\w+)"\s*(?P<direction>ASC|DESC)?', re.IGNORECASE
+)
+_CLAUSE_END = r"(?=\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|\bOFFSET\b|\bHAVING\b|$)"
+_WHERE_RE = re.compile(r"\bWHERE\b(?P<where>.*?)" + _CLAUSE_END, re.I | re.S)
+_ORDER_BY_RE = re.compile(
+    r"\bORDER BY\b(?P<order>.*?)(?=\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)",
+    re.I | re.S,
+)
+
+
+def _column_name(base_table: str, table: str, column: str) -> str:
+    return column if table == base_table else f"{table}.{column}"
+
+
+def parse_shape(sql: str) -> Optional[QueryShape]:
+    """
+    Reduce a SELECT statement to its table, filtered columns (with operator)
+    and ordering. Returns None for statements that are not plain SELECTs.
+    """
+    if not sql.lstrip().upper().startswith("SELECT"):
+        return None
+    table_match = _TABLE_RE.search(sql)
+    if table_match is None:
+        return None
+    table = table_match.group("table")
+
+    filters = set()
+    where = _WHERE_RE.search(sql)
+    if where:
+        for match in _PREDICATE_RE.finditer(where.group("where")):
+            op = match.group("op").upper().replace("!=", "<>")
+            filters.add(
+                (_column_name(table, match.group("table"), match.group("column")), op)
+            )
+
+    ordering = []
+    order_by = _ORDER_BY_RE.search(sql)
+    if order_by:
+        for match in _ORDER_RE.finditer(order_by.group("order")):
+            direction = (match.group("direction") or "ASC").upper()
+            ordering.append(
+                (
+                    _column_name(table, match.group("table"), match.group("column")),
+                    direction,
+                )
+            )
+
+    if not filters and not ordering:
+        return None
+    return QueryShape(table, tuple(sorted(filters)), tuple(ordering))
+
+
+def suggest_index(shape: QueryShape) -> List[str]:
+    """
+    Column order for an index serving ``shape``: equality columns first, then
+    the ordering columns, or else the first range column.
+    """
+    local = [(col, op) for col, op in shape.filters if "." not in col]
+    columns = [col for col, op in local if op in EQUALITY_OPERATORS]
+    ordering = [col for col, _ in shape.ordering if "." not in col]
+    if ordering:
+        trailing = ordering
+    else:
+        trailing = [col for col, op in local if op not in EQUALITY_OPERATORS][:1]
+    for column in trailing:
+        if column not in columns:
+            columns.append(column)
+    return columns
+
+
+def _model_for_table(table: str):
+    for model in apps.get_models():
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def _condition_columns(model, condition) -> set:
+    columns = set()
+    for child in getattr(condition, "children", []):
+        if isinstance(child, tuple):
+            field_name = child[0].split("__")[0]
+            columns.add(model._meta.get_field(field_name).column)
+        else:
+            columns |= _condition_columns(model, child)
+    return columns
+
+
+def declared_indexes(model) -> Dict[str, dict]:
+    """
+    Indexes the ORM creates for ``model``: ``Meta.indexes`` plus single-column
+    indexes from ``db_index``, ``unique`` and foreign keys. Each maps to its
+    ``columns`` and the columns fixed by a partial index ``condition``.
+    """
+    indexes = {}
+    for field in model._meta.local_fields:
+        if field.primary_key or not (field.db_index or field.unique):
+            continue
+        indexes[f"{field.column} (field)"] = {
+            "columns": [field.column],
+            "condition": set(),
+        }
+    for index in model._meta.indexes:
+        columns = [
+            model._meta.get_field(name.lstrip("-")).column for name in index.fields
+        ]
+        indexes[index.name] = {
+            "columns": columns,
+            "condition": _condition_columns(model, index.condition),
+        }
+    return indexes
+
+
+def covering_index(shape: QueryShape, suggestion: Optional[List[str]] = None):
+    """
+    Name of a declared index whose leading columns serve ``suggestion``,
+    treating columns pinned by a partial index condition as already matched.
+    """
+    model = _model_for_table(shape.table)
+    suggestion = suggest_index(shape) if suggestion is None else suggestion
+    if model is None or not suggestion:
+        return None
+    for name, index in declared_indexes(model).items():
+        remaining = [col for col in suggestion if col not in index["condition"]]
+        if remaining and index["columns"][: len(remaining)] == remaining:
+            return name
+    return None
+
+
+class QueryShapeRecorder:
+    """
+    ``connection.execute_wrapper`` that counts and times queries per shape.
+
+    Safe to share between threads; use :meth:`capture` around a block of
+    code or install it from middleware.
+    """
+
+    def __init__(self):
+        self.shapes: Dict[QueryShape, dict] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record(sql, (time.perf_counter() - start) * 1000)
+
+    def record(self, sql: str, duration_ms: float = 0.0) -> None:
+        shape = parse_shape(sql)
+        if shape is None:
+            return
+        with self._lock:
+            stats = self.shapes.setdefault(shape, {"count": 0, "total_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+
+    @contextmanager
+    def capture(self, using: str = "default"):
+        with connections[using].execute_wrapper(self):
+            yield self
+
+    def merge(self, rows: Iterable[dict]) -> None:
+        for row in rows:
+            shape = QueryShape(
+                row["table"],
+                tuple(tuple(item) for item in row["filters"]),
+                tuple(tuple(item) for item in row["ordering"]),
+            )
+            with self._lock:
+                stats = self.shapes.setdefault(shape, {"count": 0, "total_ms": 0.0})
+                stats["count"] += row["count"]
+                stats["total_ms"] += row["total_ms"]
+
+    def rows(self) -> List[dict]:
+        with self._lock:
+            items = list(self.shapes.items())
+        return [
+            {
+                "table": shape.table,
+                "filters": [list(item) for item in shape.filters],
+                "ordering": [list(item) for item in shape.ordering],
+                **stats,
+            }
+            for shape, stats in sorted(items, key=lambda item: -item[1]["total_ms"])
+        ]
+
+    def flush(self, path: str) -> int:
+        """Append the recorded shapes to ``path`` as JSON lines and reset."""
+        rows = self.rows()
+        with self._lock:
+            self.shapes = {}
+        if rows:
+            with open(path, "a", encoding="utf-8") as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + "\n")
+        return len(rows)
+
+    @classmethod
+    def load(cls, path: str) -> "QueryShapeRecorder":
+        recorder = cls()
+        with open(path, encoding="utf-8") as handle:
+            recorder.merge(json.loads(line) for line in handle if line.strip())
+        return recorder
+
+
+def _partial_or(partial_index: str, fallback_index: str, using: str) -> str:
+    # SQLite only matches a partial index condition against literal values,
+    # and Django binds parameters there; PostgreSQL queries are interpolated
+    # client-side, so the partial index applies.
+    if connections[using].vendor == "postgresql":
+        return partial_index
+    return fallback_index
+
+
+def critical_queries(using: str = "default"):
+    """
+    Hot query paths and the index each one is expected to use. Checked by the
+    ``check_query_plans`` command and the test suite.
+    """
+    from core.models import Task
+    from core.services.finance.income_service import IncomeService
+    from core.services.finance.invoice_service import InvoiceService
+    from core.services.user_service import ACTIVE_WORKLOAD_STATUSES
+
+    return [
+        (
+            "pending payments",
+            IncomeService().get_pending_payments().using(using),
+            _partial_or("income_pending_expected_idx", "income_status_date_idx", using),
+        ),
+        (
+            "overdue invoices",
+            InvoiceService().get_overdue_invoices().using(using),
+            _partial_or("invoice_sent_due_idx", "invoice_status_date_idx", using),
+        ),
+        (
+            "user workload",
+            Task.objects.using(using).filter(
+                assigned_to_id=1,
+                status__in=ACTIVE_WORKLOAD_STATUSES,
+                due_date__lt=date.today() + timedelta(days=7),
+            ),
+            "task_assignee_status_due_idx",
+        ),
+    ]
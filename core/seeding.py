@@ -0,0 +1,438 @@
+"""
+Synthetic data at benchmark scale.
+
+``SyntheticDataGenerator`` writes users, clients, projects, tasks (with a
+dependency DAG inside each project), invoices, incomes settling the paid
+invoices, and expenses including recurring series, all with ``bulk_create``
+in chunks. The large tables are split into chunks that worker processes
+insert in parallel, each over its own database connection.
+
+Every chunk draws from a ``random.Random`` seeded with the seed, the model
+and the chunk's first row, so the same seed, scale, chunk size and start
+date produce the same rows however many workers insert them. Bulk inserts
+skip model signals, so the search index is rebuilt separately
+(``manage.py rebuild_search_index``).
+"""
+
+import multiprocessing
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+
+from core.models import Client, Expense, Income, Invoice, Project, Task, User
+from core.models.finance import CATEGORY_CHOICES
+
+
+@dataclass(frozen=True)
+class SeedScale:
+    users: int
+    clients: int
+    projects: int
+    tasks: int
+    invoices: int
+    incomes: int
+    expenses: int
+
+
+SCALES = {
+    "small": SeedScale(
+        users=50,
+        clients=100,
+        projects=300,
+        tasks=10_000,
+        invoices=3_000,
+        incomes=10_000,
+        expenses=10_000,
+    ),
+    "medium": SeedScale(
+        users=200,
+        clients=1_000,
+        projects=3_000,
+        tasks=100_000,
+        invoices=30_000,
+        incomes=100_000,
+        expenses=100_000,
+    ),
+    "large": SeedScale(
+        users=500,
+        clients=1_000,
+        projects=5_000,
+        tasks=100_000,
+        invoices=300_000,
+        incomes=1_000_000,
+        expenses=500_000,
+    ),
+}
+
+VENDORS = ["Staples", "AWS", "GitHub", "Dell", "Air Canada", "WeWork", "Google"]
+SUBSCRIPTIONS = [
+    ("GitHub", "software", "monthly"),
+    ("AWS", "software", "monthly"),
+    ("WeWork", "rent", "monthly"),
+    ("Hydro One", "utilities", "monthly"),
+    ("Intact", "insurance", "quarterly"),
+    ("Google", "software", "yearly"),
+]
+RECURRENCE_DAYS = {"weekly": 7, "monthly": 30, "quarterly": 91, "yearly": 365}
+INDUSTRIES = ["Retail", "Finance", "Healthcare", "Education", "Logistics", "Media"]
+TASK_VERBS = ["Build", "Fix", "Review", "Design", "Document", "Migrate", "Test"]
+TASK_NOUNS = ["login flow", "invoice export", "dashboard", "API client", "report"]
+
+# What the chunk workers need of the rows they refer to: keys and the few
+# attributes dependent rows copy, never whole model instances
+ProjectRef = Tuple[int, int, date]  # pk, client_id, start_date
+InvoiceRef = Tuple[int, int, int, Decimal, date]  # pk, client, project, amount, date
+
+# Generator of the running stage, inherited by the forked workers
+_active: Optional["SyntheticDataGenerator"] = None
+
+
+def _run_chunk(job):
+    method, start, stop = job
+    return getattr(_active, method)(start, stop)
+
+
+def _choices(choices) -> List[str]:
+    return [value for value, _ in choices]
+
+
+class SyntheticDataGenerator:
+    """Generates a coherent data set of ``scale`` rows from ``seed``."""
+
+    def __init__(
+        self,
+        scale: SeedScale,
+        seed: int = 0,
+        chunk_size: int = 5000,
+        workers: int = 1,
+        progress: Optional[Callable[[str, int], None]] = None,
+        today: Optional[date] = None,
+    ):
+        self.scale = scale
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.progress = progress or (lambda model, count: None)
+        self.today = today or date.today()
+        self.user_ids: List[int] = []
+        self.client_ids: List[int] = []
+        self.projects: List[ProjectRef] = []
+        self.paid_invoices: List[InvoiceRef] = []
+
+    def rng(self, name: str, start: int = 0) -> random.Random:
+        return random.Random(f"{self.seed}:{name}:{start}")
+
+    @property
+    def parallel(self) -> bool:
+        # SQLite serialises writers: more processes would only queue on locks
+        return self.workers > 1 and connection.vendor != "sqlite"
+
+    def _days_ago(self, rng: random.Random, low: int, high: int) -> date:
+        return self.today - timedelta(days=rng.randint(low, high))
+
+    def _money(self, rng: random.Random, low: int, high: int) -> Decimal:
+        return Decimal(rng.randint(low * 100, high * 100)) / 100
+
+    def _stage(self, name: str, total: int) -> List:
+        """
+        Call the ``name`` method for each chunk of ``total`` rows, in worker
+        processes when ``parallel``. Returns the chunk results in row order.
+        """
+        global _active
+        jobs = [
+            (name, start, min(start + self.chunk_size, total))
+            for start in range(0, total, self.chunk_size)
+        ]
+        _active = self
+        try:
+            if self.parallel:
+                # Each forked worker must open a connection of its own
+                connections.close_all()
+                pool = multiprocessing.get_context("fork").Pool(self.workers)
+                try:
+                    results = self._collect(name, jobs, pool.imap(_run_chunk, jobs))
+                except BaseException:
+                    pool.terminate()
+                    raise
+                else:
+                    # Let the workers exit and close their connections cleanly
+                    pool.close()
+                finally:
+                    pool.join()
+            else:
+                results = self._collect(name, jobs, map(_run_chunk, jobs))
+        finally:
+            _active = None
+        return results
+
+    def _collect(self, name: str, jobs: List, results) -> List:
+        collected, done = [], 0
+        for (_, start, stop), result in zip(jobs, results):
+            collected.append(result)
+            done += stop - start
+            self.progress(name, done)
+        return collected
+
+    def run(self) -> Dict[str, int]:
+        self.user_ids = self.users()
+        self.client_ids = self.clients()
+        self.projects = self.project_refs()
+        tasks = sum(self._stage("tasks", self.scale.tasks))
+        self.paid_invoices = [
+            ref for refs in self._stage("invoices", self.scale.invoices) for ref in refs
+        ]
+        incomes = sum(self._stage("incomes", self.scale.incomes))
+        expenses = sum(self._stage("expenses", self.scale.expenses))
+        return {
+            "users": len(self.user_ids),
+            "clients": len(self.client_ids),
+            "projects": len(self.projects),
+            "tasks": tasks,
+            "invoices": self.scale.invoices,
+            "incomes": incomes,
+            "expenses": expenses,
+        }
+
+    # Small tables, inserted by this process
+
+    def _insert(self, model, rows: List) -> List:
+        created = []
+        for start in range(0, len(rows), self.chunk_size):
+            with transaction.atomic():
+                created.extend(
+                    model.objects.bulk_create(rows[start : start + self.chunk_size])
+                )
+            self.progress(str(model._meta.verbose_name_plural), len(created))
+        return created
+
+    def users(self) -> List[int]:
+        rng = self.rng("user")
+        password = make_password(None)
+        roles = _choices(User.ROLE_CHOICES)
+        departments = _choices(User.DEPARTMENT_CHOICES)
+        rows = [
+            User(
+                username=f"seed-user-{i}",
+                email=f"seed-user-{i}@example.com",
+                first_name=f"User{i}",
+                last_name=rng.choice(["Smith", "Chen", "Okafor", "Garcia", "Novak"]),
+                password=password,
+                role=rng.choice(roles),
+                department=rng.choice(departments),
+                hourly_rate=self._money(rng, 40, 150),
+            )
+            for i in range(self.scale.users)
+        ]
+        return [user.pk for user in self._insert(User, rows)]
+
+    def clients(self) -> List[int]:
+        rng = self.rng("client")
+        rows = [
+            Client(
+                name=f"Client {i}",
+                email=f"client-{i}@example.com",
+                company=f"{rng.choice(INDUSTRIES)} Co {i}",
+                industry=rng.choice(INDUSTRIES),
+                status=rng.choices(["active", "inactive", "prospect"], [8, 1, 1])[0],
+                payment_terms=rng.choice([15, 30, 45, 60]),
+            )
+            for i in range(self.scale.clients)
+        ]
+        return [client.pk for client in self._insert(Client, rows)]
+
+    def project_refs(self) -> List[ProjectRef]:
+        rng = self.rng("project")
+        statuses = _choices(Project.STATUS_CHOICES)
+        priorities = _choices(Project.PRIORITY_CHOICES)
+        rows = []
+        for i in range(self.scale.projects):
+            start = self._days_ago(rng, 0, 720)
+            rows.append(
+                Project(
+                    name=f"Project {i}",
+                    code=f"SEED{i:06d}",
+                    client_id=self.client_ids[i % len(self.client_ids)],
+                    manager_id=rng.choice(self.user_ids) if self.user_ids else None,
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    start_date=start,
+                    end_date=start + timedelta(days=rng.randint(30, 365)),
+                    budget=self._money(rng, 5_000, 250_000),
+                    hourly_rate=self._money(rng, 50, 200),
+                )
+            )
+        return [(p.pk, p.client_id, p.start_date) for p in self._insert(Project, rows)]
+
+    # Large tables, one call per chunk of rows [start, stop)
+
+    def tasks(self, start: int, stop: int) -> int:
+        """
+        Tasks come in contiguous runs per project, and a task depends on up
+        to two of the few tasks before it in the same project. Edges only
+        point backwards, so every project's dependency graph is acyclic.
+        """
+        rng = self.rng("task", start)
+        statuses = _choices(Task.STATUS_CHOICES)
+        priorities = _choices(Task.PRIORITY_CHOICES)
+        types = _choices(Task.TYPE_CHOICES)
+        per_project = max(self.scale.tasks // len(self.projects), 1)
+
+        rows = []
+        for i in range(start, stop):
+            project_id, _, started = self.projects[
+                min(i // per_project, len(self.projects) - 1)
+            ]
+            rows.append(
+                Task(
+                    name=f"{rng.choice(TASK_VERBS)} {rng.choice(TASK_NOUNS)} #{i}",
+                    project_id=project_id,
+                    assigned_to_id=rng.choice(self.user_ids) if self.user_ids else None,
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    task_type=rng.choice(types),
+                    due_date=started + timedelta(days=(i % per_project) * 3 + 1),
+                    estimated_hours=Decimal(rng.randint(1, 40)),
+                )
+            )
+
+        dependency = Task.dependencies.through
+        with transaction.atomic():
+            tasks = Task.objects.bulk_create(rows)
+            edges = []
+            for index, task in enumerate(tasks):
+                earlier = [
+                    other
+                    for other in tasks[max(index - 5, 0) : index]
+                    if other.project_id == task.project_id
+                ]
+                for other in rng.sample(earlier, min(len(earlier), rng.randint(0, 2))):
+                    edges.append(dependency(from_task_id=task.pk, to_task_id=other.pk))
+            dependency.objects.bulk_create(edges)
+        return len(tasks)
+
+    def invoices(self, start: int, stop: int) -> List[InvoiceRef]:
+        rng = self.rng("invoice", start)
+        rows = []
+        for i in range(start, stop):
+            project_id, client_id, _ = rng.choice(self.projects)
+            issued = self._days_ago(rng, 0, 720)
+            rows.append(
+                Invoice(
+                    # Outside the INV-<yyyymm>- sequence new invoices number from
+                    invoice_number=f"INV-S{i:08d}",
+                    client_id=client_id,
+                    project_id=project_id,
+                    date=issued,
+                    due_date=issued + timedelta(days=30),
+                    amount=self._money(rng, 500, 20_000),
+                    status=rng.choices(
+                        ["draft", "sent", "paid", "cancelled"], [1, 3, 6, 1]
+                    )[0],
+                )
+            )
+        with transaction.atomic():
+            invoices = Invoice.objects.bulk_create(rows)
+        return [
+            (i.pk, i.client_id, i.project_id, i.amount, i.date)
+            for i in invoices
+            if i.status == "paid"
+        ]
+
+    def incomes(self, start: int, stop: int) -> int:
+        rng = self.rng("income", start)
+        types = [
+            t for t in _choices(Income.INCOME_TYPE_CHOICES) if t != "project_payment"
+        ]
+        rows = []
+        for i in range(start, stop):
+            # The first incomes settle the paid invoices, one each; the rest
+            # are retainers and other payments without an invoice
+            if i < len(self.paid_invoices):
+                invoice_id, client_id, project_id, amount, issued = self.paid_invoices[
+                    i
+                ]
+                day = issued + timedelta(days=rng.randint(1, 40))
+                received, income_type = True, "project_payment"
+            else:
+                invoice_id = None
+                project_id, client_id, _ = rng.choice(self.projects)
+                amount = self._money(rng, 100, 15_000)
+                day = self._days_ago(rng, 0, 720)
+                received, income_type = rng.random() < 0.7, rng.choice(types)
+            tax_rate = Decimal(rng.choice([0, 5, 13]))
+            rows.append(
+                Income(
+                    amount=amount,
+                    date=day,
+                    expected_date=day + timedelta(days=rng.randint(0, 30)),
+                    received_date=day if received else None,
+                    client_id=client_id,
+                    project_id=project_id,
+                    invoice_id=invoice_id,
+                    status="received" if received else "pending",
+                    income_type=income_type,
+                    tax_rate=tax_rate,
+                    # Income.save() computes this, bulk_create does not call it
+                    tax_amount=amount * tax_rate / 100,
+                )
+            )
+        with transaction.atomic():
+            return len(Income.objects.bulk_create(rows))
+
+    def expenses(self, start: int, stop: int) -> int:
+        """
+        One-off purchases, with about one row in ten starting a recurring
+        series: a subscription billed at its frequency up to today.
+        """
+        rng = self.rng("expense", start)
+        categories = _choices(CATEGORY_CHOICES)
+        methods = _choices(Expense.PAYMENT_METHOD_CHOICES)
+        statuses = _choices(Expense.STATUS_CHOICES)
+        count = stop - start
+
+        rows = []
+        while len(rows) < count:
+            submitted_by = rng.choice(self.user_ids)
+            if rng.random() < 0.1:
+                vendor, category, frequency = rng.choice(SUBSCRIPTIONS)
+                first = self._days_ago(rng, 30, 720)
+                amount = self._money(rng, 20, 2_000)
+                step = timedelta(days=RECURRENCE_DAYS[frequency])
+                occurrences = min((self.today - first) // step + 1, count - len(rows))
+                rows.extend(
+                    Expense(
+                        title=f"{vendor} {frequency} subscription",
+                        amount=amount,
+                        date=first + step * n,
+                        category=category,
+                        payment_method="credit_card",
+                        status="paid",
+                        vendor=vendor,
+                        is_recurring=True,
+                        recurring_frequency=frequency,
+                        submitted_by_id=submitted_by,
+                    )
+                    for n in range(occurrences)
+                )
+                continue
+            vendor = rng.choice(VENDORS)
+            rows.append(
+                Expense(
+                    title=f"{vendor} purchase #{start + len(rows)}",
+                    amount=self._money(rng, 5, 5_000),
+                    tax_amount=self._money(rng, 0, 300),
+                    date=self._days_ago(rng, 0, 720),
+                    category=rng.choice(categories),
+                    payment_method=rng.choice(methods),
+                    status=rng.choice(statuses),
+                    vendor=vendor,
+                    submitted_by_id=submitted_by,
+                )
+            )
+        with transaction.atomic():
+            return len(Expense.objects.bulk_create(rows))
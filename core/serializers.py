@@ -1,6 +1,22 @@
+from django.urls import reverse
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
 
+from .authentication import StatelessJWTAuthentication, add_user_claims
 from .models import Client, Expense, Income, Invoice, Project, Task, User
+from .services.global_search_service import ENTITY_SPECS
+
+
+class LivenessSerializer(serializers.Serializer):
+    """
+    Serializer for the liveness endpoint.
+    """
+
+    status = serializers.CharField(read_only=True)
 
 
 class HealthCheckSerializer(serializers.Serializer):
@@ -9,7 +25,8 @@ class HealthCheckSerializer(serializers.Serializer):
     """
 
     status = serializers.CharField(read_only=True)
-    timestamp = serializers.DateTimeField(read_only=True)
+    checked_at = serializers.DateTimeField(read_only=True)
+    checks = serializers.DictField(child=serializers.DictField(), read_only=True)
     database = serializers.DictField(read_only=True)
     cache = serializers.BooleanField(read_only=True)
     version = serializers.CharField(read_only=True)
@@ -49,7 +66,7 @@ class ClientSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Client
-        fields = "__all__"
+        exclude = ["search_vector"]
         swagger_schema_fields = {
             "description": "Client information including projects and revenue"
         }
@@ -66,7 +83,7 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Project
-        fields = "__all__"
+        exclude = ["search_vector"]
         swagger_schema_fields = {
             "description": "Project details including status and progress"
         }
@@ -81,7 +98,7 @@ class TaskSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ["search_vector"]
         swagger_schema_fields = {
             "description": "Task information with assignments and tracking"
         }
@@ -111,7 +128,7 @@ class ExpenseSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Expense
-        fields = "__all__"
+        exclude = ["search_vector"]
         swagger_schema_fields = {"description": "Expense records with payment tracking"}
 
 
@@ -126,3 +143,68 @@ class InvoiceSerializer(serializers.ModelSerializer):
         model = Invoice
         fields = "__all__"
         swagger_schema_fields = {"description": "Invoice records with payment status"}
+
+
+class GlobalSearchQuerySerializer(serializers.Serializer):
+    """
+    Validates query parameters of the global search endpoint.
+    """
+
+    q = serializers.CharField(max_length=100, trim_whitespace=True)
+    types = serializers.CharField(required=False, allow_blank=True)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=20)
+
+    def validate_types(self, value):
+        types = [name.strip().lower() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(types) - set(ENTITY_SPECS))
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown type(s): {', '.join(unknown)}. "
+                f"Choose from: {', '.join(ENTITY_SPECS)}."
+            )
+        return types
+
+
+class GlobalSearchResultSerializer(serializers.Serializer):
+    """
+    Serializer for a single global search hit.
+    """
+
+    type = serializers.CharField(read_only=True)
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    subtitle = serializers.CharField(read_only=True)
+    rank = serializers.FloatField(read_only=True)
+    admin_url = serializers.SerializerMethodField()
+
+    class Meta:
+        swagger_schema_fields = {
+            "description": "Cross-entity search hit for typeahead lookups"
+        }
+
+    def get_admin_url(self, obj):
+        return reverse(f"admin:core_{obj['type']}_change", args=[obj["id"]])
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Token pair whose claims let ``StatelessJWTAuthentication`` serve reads
+    without loading the user. Refreshed access tokens copy them.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class RevocationAwareTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuses refresh tokens covered by a revocation, so a user whose claims
+    changed must log in again to get tokens describing them.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if StatelessJWTAuthentication.revocations.is_revoked(refresh):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        return super().validate(attrs)
@@ -0,0 +1,258 @@
+from bisect import bisect_right
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Tag, Task, User
+
+from .base import BaseService
+
+ACTIVE_TASK_STATUSES = ["pending", "in_progress", "review", "blocked"]
+PRIORITY_RANK = {"urgent": 0, "high": 1, "medium": 2, "low": 3}
+WORKDAYS_PER_WEEK = 5
+
+
+def _iter_bits(mask: int):
+    """Yield the index of every set bit in ``mask``."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def _workdays_between(start: date, end: date) -> int:
+    """Count Monday-Friday days in the inclusive range, at least one."""
+    if end < start:
+        return 1
+    days = (end - start).days + 1
+    full_weeks, remainder = divmod(days, 7)
+    workdays = full_weeks * WORKDAYS_PER_WEEK
+    for offset in range(remainder):
+        if (start + timedelta(days=offset)).weekday() < 5:
+            workdays += 1
+    return max(workdays, 1)
+
+
+class TaskAssignmentService(BaseService[Task]):
+    """Proposes assignees for unassigned tasks based on skills and capacity."""
+
+    def __init__(self):
+        super().__init__(Task)
+
+    @staticmethod
+    def parse_tags(value: Optional[str]) -> List[str]:
+        """Split a comma-separated tag/skill string into normalized names."""
+        return Tag.parse(value)
+
+    def get_unassigned_tasks(self):
+        return self.model_class.objects.filter(
+            assigned_to__isnull=True, status__in=ACTIVE_TASK_STATUSES
+        )
+
+    def get_candidates(self):
+        return User.objects.filter(is_active=True, status="active")
+
+    def propose_assignments(
+        self,
+        tasks: Optional[Iterable[Task]] = None,
+        candidates: Optional[Iterable[User]] = None,
+        today: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Propose an assignee for each task.
+
+        Tasks are handled earliest-due-date first. Each task goes to the
+        candidate with the largest skill overlap who still has enough capacity
+        before the due date, ties broken by the most remaining capacity.
+
+        Returns:
+            A list of dicts with ``task``, ``assignee`` (or None),
+            ``skill_match``, ``available_hours`` and ``reason`` keys.
+        """
+        today = today or timezone.now().date()
+        tasks = list(self.get_unassigned_tasks() if tasks is None else tasks)
+        users = list(self.get_candidates() if candidates is None else candidates)
+        if not tasks:
+            return []
+
+        vocabulary, user_masks, users_by_skill = self._build_skill_index(users)
+        all_users = (1 << len(users)) - 1
+        commitments = self._load_commitments(users)
+        newly_assigned = [Decimal("0")] * len(users)
+
+        ordered = sorted(
+            tasks,
+            key=lambda t: (t.due_date, PRIORITY_RANK.get(t.priority, 99), t.pk or 0),
+        )
+        proposals = []
+        for task in ordered:
+            tags = self.parse_tags(task.tags)
+            task_mask = 0
+            for tag in tags:
+                if tag in vocabulary:
+                    task_mask |= 1 << vocabulary[tag]
+
+            if tags and not task_mask:
+                proposals.append(
+                    self._proposal(task, None, 0, 0, "No user has the required skills")
+                )
+                continue
+
+            candidate_bits = all_users
+            if task_mask:
+                candidate_bits = 0
+                for bit in _iter_bits(task_mask):
+                    candidate_bits |= users_by_skill[bit]
+
+            needed = max(
+                Decimal(task.estimated_hours) - Decimal(task.actual_hours),
+                Decimal("0"),
+            )
+            workdays = _workdays_between(today, task.due_date)
+
+            best = self._best_candidate(
+                candidate_bits,
+                task_mask,
+                needed,
+                capacity_days=workdays,
+                due_date=task.due_date,
+                users=users,
+                user_masks=user_masks,
+                commitments=commitments,
+                newly_assigned=newly_assigned,
+            )
+            if best is None:
+                proposals.append(
+                    self._proposal(
+                        task,
+                        None,
+                        0,
+                        0,
+                        "No matching user has capacity before the due date",
+                    )
+                )
+                continue
+
+            index, score, available = best
+            newly_assigned[index] += needed
+            proposals.append(
+                self._proposal(
+                    task,
+                    users[index],
+                    score,
+                    available,
+                    "Matched on skills and capacity",
+                )
+            )
+
+        return proposals
+
+    @transaction.atomic
+    def apply_assignments(self, proposals: List[Dict[str, Any]]) -> int:
+        """Persist proposed assignees. Returns the number of tasks updated."""
+        assigned = []
+        for proposal in proposals:
+            if proposal["assignee"] is None:
+                continue
+            task = proposal["task"]
+            task.assigned_to = proposal["assignee"]
+            assigned.append(task)
+        self.model_class.objects.bulk_update(assigned, ["assigned_to"])
+        return len(assigned)
+
+    def auto_assign(
+        self, tasks: Optional[Iterable[Task]] = None
+    ) -> List[Dict[str, Any]]:
+        """Propose and apply assignments in one step."""
+        proposals = self.propose_assignments(tasks)
+        self.apply_assignments(proposals)
+        return proposals
+
+    def _best_candidate(
+        self,
+        candidate_bits: int,
+        task_mask: int,
+        needed: Decimal,
+        capacity_days: int,
+        due_date: date,
+        users: List[User],
+        user_masks: List[int],
+        commitments,
+        newly_assigned: List[Decimal],
+    ):
+        """Return ``(index, skill_match, available_hours)`` or None."""
+        best = None
+        for index in _iter_bits(candidate_bits):
+            available = (
+                Decimal(users[index].working_hours) / WORKDAYS_PER_WEEK * capacity_days
+                - self._committed_by(commitments, users[index].pk, due_date)
+                - newly_assigned[index]
+            )
+            if available < needed:
+                continue
+            score = (user_masks[index] & task_mask).bit_count()
+            if best is None or (score, available) > (best[1], best[2]):
+                best = (index, score, available)
+        return best
+
+    def _build_skill_index(self, users: List[User]):
+        """
+        Precompute skill bitsets: one bit per distinct skill, a skill mask per
+        user, and a mask of users per skill so candidates for a task come from
+        a few integer ORs instead of scanning every user.
+        """
+        vocabulary: Dict[str, int] = {}
+        user_masks = []
+        users_by_skill: Dict[int, int] = {}
+        for index, user in enumerate(users):
+            mask = 0
+            for skill in self.parse_tags(user.skills):
+                bit = vocabulary.setdefault(skill, len(vocabulary))
+                mask |= 1 << bit
+                users_by_skill[bit] = users_by_skill.get(bit, 0) | (1 << index)
+            user_masks.append(mask)
+        return vocabulary, user_masks, users_by_skill
+
+    def _load_commitments(self, users: List[User]):
+        """
+        Remaining hours of active work per user, as due dates and running
+        totals so the load due on or before a date is a single bisect.
+        """
+        rows = (
+            self.model_class.objects.filter(
+                assigned_to__in=users, status__in=ACTIVE_TASK_STATUSES
+            )
+            .order_by("assigned_to_id", "due_date")
+            .values_list(
+                "assigned_to_id", "due_date", "estimated_hours", "actual_hours"
+            )
+        )
+        grouped: Dict[int, tuple] = {}
+        for user_id, due_date, estimated, actual in rows:
+            dates, hours = grouped.setdefault(user_id, ([], []))
+            dates.append(due_date)
+            hours.append(max(Decimal(estimated) - Decimal(actual), Decimal("0")))
+        return {
+            user_id: (dates, list(accumulate(hours)))
+            for user_id, (dates, hours) in grouped.items()
+        }
+
+    @staticmethod
+    def _committed_by(commitments, user_id: int, due_date: date) -> Decimal:
+        due_dates, totals = commitments.get(user_id, ((), ()))
+        position = bisect_right(due_dates, due_date)
+        return totals[position - 1] if position else Decimal("0")
+
+    @staticmethod
+    def _proposal(task, assignee, skill_match, available_hours, reason):
+        return {
+            "task": task,
+            "assignee": assignee,
+            "skill_match": skill_match,
+            "available_hours": available_hours,
+            "reason": reason,
+        }
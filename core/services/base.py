@@ -1,23 +1,38 @@
+import inspect
 from typing import Generic, List, Optional, Type, TypeVar
 
 from django.db import transaction
 
+from core.metrics import instrumented
+
 T = TypeVar("T")
 
 
 class BaseService(Generic[T]):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every public service method reports its latency and query count
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(value):
+                continue
+            if not getattr(value, "instrumented", False):
+                setattr(cls, name, instrumented(value))
+
     def __init__(self, model_class: Type[T]):
         self.model_class = model_class
 
+    @instrumented
     def get_by_id(self, id: int) -> Optional[T]:
         try:
             return self.model_class.objects.get(pk=id)
         except self.model_class.DoesNotExist:
             return None
 
+    @instrumented
     def list_all(self) -> List[T]:
         return self.model_class.objects.all()
 
+    @instrumented
     @transaction.atomic
     def create(self, **kwargs) -> T:
         instance = self.model_class(**kwargs)
@@ -25,6 +40,7 @@ class BaseService(Generic[T]):
         instance.save()
         return instance
 
+    @instrumented
     @transaction.atomic
     def update(self, instance: T, **kwargs) -> T:
         for key, value in kwargs.items():
@@ -33,6 +49,7 @@ class BaseService(Generic[T]):
         instance.save()
         return instance
 
+    @instrumented
     @transaction.atomic
     def delete(self, instance: T) -> bool:
         instance.delete()
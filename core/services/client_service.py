@@ -4,6 +4,7 @@ from typing import Any, Dict
 from django.db.models import Sum
 from django.core.exceptions import ValidationError
 
+from core.db_routers import analytics_reads
 from core.models import Client
 
 from .base import BaseService
@@ -13,6 +14,7 @@ class ClientService(BaseService[Client]):
     def __init__(self):
         super().__init__(Client)
 
+    @analytics_reads()
     def get_financial_summary(self, client: Client) -> Dict[str, Any]:
         """Get client's financial summary"""
         incomes = client.incomes.all()
@@ -0,0 +1,173 @@
+import csv
+import io
+import zipfile
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from core.models import Expense
+
+
+class _ZipStream(io.RawIOBase):
+    """Write-only sink that hands ``zipfile`` output back in chunks."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class ReceiptArchiveService:
+    """
+    Streams the receipts of an expense queryset as a ZIP archive.
+
+    Receipt files are fetched ``RECEIPT_ARCHIVE_WORKERS`` at a time and each
+    is written to the archive as soon as it arrives, so neither the archive
+    nor the set of receipts is ever held in memory. Files shared by several
+    expenses are included once. ``manifest.csv``, written last, maps every
+    expense to its file in the archive.
+    """
+
+    chunk_size = 64 * 1024
+    manifest_name = "manifest.csv"
+    manifest_fields = [
+        "expense_id",
+        "date",
+        "title",
+        "vendor",
+        "category",
+        "amount",
+        "status",
+        "file",
+        "sha256",
+        "included",
+    ]
+
+    @property
+    def workers(self) -> int:
+        return max(getattr(settings, "RECEIPT_ARCHIVE_WORKERS", 4), 1)
+
+    def expenses(self, queryset: QuerySet) -> QuerySet:
+        return (
+            queryset.exclude(receipt="")
+            .exclude(receipt__isnull=True)
+            .select_related("receipt_blob")
+            .order_by("date", "pk")
+        )
+
+    def filename(self) -> str:
+        return f"receipts_{timezone.now():%Y%m%d_%H%M%S}.zip"
+
+    def _fetch(self, storage, name: str) -> Tuple[str, Optional[object]]:
+        try:
+            source = storage.open(name, "rb")
+            # Backends that download lazily (AzureFile) do so on first access
+            source.seek(0)
+            return name, source
+        except Exception:
+            # Reported in the manifest; the rest of the archive still streams
+            return name, None
+
+    def _fetched(self, files: Iterable[Tuple[object, str]]) -> Iterator[Tuple]:
+        """Open ``(storage, name)`` pairs concurrently, yielding in arrival order."""
+        limit = self.workers * 2
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="receipt-archive"
+        )
+        pending, ready = set(), []
+        try:
+            for storage, name in files:
+                pending.add(executor.submit(self._fetch, storage, name))
+                # Keep at most ``limit`` files open or in flight
+                if len(pending) >= limit:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    ready.extend(done)
+                    while ready:
+                        yield ready.pop().result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                ready.extend(done)
+                while ready:
+                    yield ready.pop().result()
+        finally:
+            # Stopped early (the client went away): don't wait for fetches
+            # still running, and close every file nobody will read
+            for future in [*ready, *pending]:
+                future.cancel()
+                future.add_done_callback(self._close_result)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _close_result(future) -> None:
+        if not future.cancelled():
+            _, source = future.result()
+            if source is not None:
+                source.close()
+
+    def _write(
+        self, archive: zipfile.ZipFile, sink: _ZipStream, name: str, source
+    ) -> Iterator[bytes]:
+        info = zipfile.ZipInfo(name, timezone.now().timetuple()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with archive.open(info, "w", force_zip64=True) as entry:
+            for chunk in iter(lambda: source.read(self.chunk_size), b""):
+                entry.write(chunk)
+                data = sink.drain()
+                if data:
+                    yield data
+
+    def stream(self, queryset: QuerySet) -> Iterator[bytes]:
+        rows: List[Dict] = []
+        files = {}
+        for expense in self.expenses(queryset).iterator(chunk_size=500):
+            name = expense.receipt.name
+            files.setdefault(name, expense.receipt.storage)
+            rows.append(self.manifest_row(expense))
+
+        sink = _ZipStream()
+        included = set()
+        with zipfile.ZipFile(sink, "w", compresslevel=1) as archive:
+            fetched = self._fetched((storage, name) for name, storage in files.items())
+            with closing(fetched):
+                for name, source in fetched:
+                    if source is None:
+                        continue
+                    with source:
+                        yield from self._write(archive, sink, name, source)
+                    included.add(name)
+
+            manifest = io.StringIO()
+            writer = csv.DictWriter(manifest, fieldnames=self.manifest_fields)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({**row, "included": row["file"] in included})
+            archive.writestr(self.manifest_name, manifest.getvalue())
+        yield sink.drain()
+
+    def manifest_row(self, expense: Expense) -> Dict:
+        blob = expense.receipt_blob
+        return {
+            "expense_id": expense.pk,
+            "date": expense.date,
+            "title": expense.title,
+            "vendor": expense.vendor,
+            "category": expense.category,
+            "amount": expense.amount,
+            "status": expense.status,
+            "file": expense.receipt.name,
+            "sha256": blob.sha256 if blob is not None else "",
+        }
@@ -0,0 +1,249 @@
+import io
+import logging
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+from PIL import Image, UnidentifiedImageError
+
+from core.metrics import QUEUE_DEPTH, register_collector
+from core.models import ReceiptBlob
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDF text and embedded scans are skipped without pypdf
+    PdfReader = None
+
+try:
+    import pytesseract
+except ImportError:  # image receipts get a thumbnail but no OCR text
+    pytesseract = None
+
+logger = logging.getLogger(__name__)
+
+
+def missing_extractors() -> List[str]:
+    """The text extraction tools this process cannot use."""
+    missing = []
+    if PdfReader is None:
+        missing.append("pypdf")
+    if pytesseract is None:
+        missing.append("pytesseract")
+    elif shutil.which(pytesseract.pytesseract.tesseract_cmd) is None:
+        missing.append("tesseract")
+    return missing
+
+
+def warn_missing_extractors() -> None:
+    missing = missing_extractors()
+    if missing:
+        logger.warning(
+            "Receipt text extraction is limited; not installed: %s",
+            ", ".join(missing),
+        )
+
+
+AMOUNT_PATTERN = re.compile(r"(?<![\d.,])(\d{1,3}(?:,\d{3})+|\d+)\.(\d{2})(?![\d.])")
+TOTAL_PATTERN = re.compile(
+    r"\b(grand\s+total|total\s+due|amount\s+due|balance\s+due|total)\b",
+    re.IGNORECASE,
+)
+
+
+def parse_amounts(text: str) -> List[Decimal]:
+    amounts = []
+    for whole, cents in AMOUNT_PATTERN.findall(text):
+        try:
+            amounts.append(Decimal(f"{whole.replace(',', '')}.{cents}"))
+        except InvalidOperation:
+            continue
+    return amounts
+
+
+def detect_amount(text: str) -> Optional[Decimal]:
+    """
+    Best guess at a receipt's total: the last amount on the last line that
+    mentions a total (subtotals excluded), else the largest amount found.
+    """
+    for line in reversed(text.splitlines()):
+        if "subtotal" in line.lower() or not TOTAL_PATTERN.search(line):
+            continue
+        amounts = parse_amounts(line)
+        if amounts:
+            return amounts[-1]
+    amounts = parse_amounts(text)
+    return max(amounts) if amounts else None
+
+
+@register_collector
+def pending_receipts(families):
+    try:
+        pending = ReceiptBlob.objects.filter(processing_status="pending").count()
+    except DatabaseError:
+        return
+    yield (
+        "background_queue_depth",
+        "Jobs queued or running on in-process background pools.",
+        {"queue": "receipt-processing-pending"},
+        pending,
+    )
+
+
+class ReceiptProcessingService:
+    """
+    Derives a JPEG thumbnail, text and a detected total for receipt blobs.
+
+    Work runs on a process-wide pool of ``RECEIPT_PROCESSING_WORKERS``
+    threads, so uploads return before it finishes. At most
+    ``RECEIPT_PROCESSING_QUEUE`` blobs wait for the pool; blobs turned away
+    stay ``pending`` for the ``process_receipts`` command. With no workers
+    configured, processing runs inline.
+    """
+
+    _executor = None
+    _slots = None
+    _lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        return getattr(settings, "RECEIPT_PROCESSING_WORKERS", 2)
+
+    @property
+    def thumbnail_size(self) -> int:
+        return getattr(settings, "RECEIPT_THUMBNAIL_SIZE", 320)
+
+    @property
+    def max_pdf_pages(self) -> int:
+        return getattr(settings, "RECEIPT_TEXT_MAX_PAGES", 5)
+
+    @classmethod
+    def _pool(cls, workers: int) -> Tuple[ThreadPoolExecutor, threading.Semaphore]:
+        # Created on first use, so forked web workers each get their own
+        with cls._lock:
+            if cls._executor is None:
+                warn_missing_extractors()
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="receipt-processing"
+                )
+                cls._slots = threading.BoundedSemaphore(
+                    workers + getattr(settings, "RECEIPT_PROCESSING_QUEUE", 32)
+                )
+            return cls._executor, cls._slots
+
+    def schedule(self, blob_id: int) -> None:
+        """Process ``blob_id`` once the current transaction commits."""
+        transaction.on_commit(lambda: self.enqueue(blob_id))
+
+    def enqueue(self, blob_id: int) -> bool:
+        """Hand ``blob_id`` to the pool; False when the queue is full."""
+        if self.workers <= 0:
+            self.process(blob_id)
+            return True
+
+        executor, slots = self._pool(self.workers)
+        if not slots.acquire(blocking=False):
+            logger.warning(
+                "Receipt processing queue full; blob %s left pending", blob_id
+            )
+            return False
+        QUEUE_DEPTH.labels(queue="receipt-processing").inc()
+        try:
+            executor.submit(self._run, blob_id, slots)
+        except RuntimeError:
+            # The pool is shutting down with the interpreter
+            QUEUE_DEPTH.labels(queue="receipt-processing").dec()
+            slots.release()
+            return False
+        return True
+
+    def _run(self, blob_id: int, slots: threading.Semaphore) -> None:
+        try:
+            self.process(blob_id)
+        except Exception:
+            logger.exception("Receipt processing failed for blob %s", blob_id)
+        finally:
+            QUEUE_DEPTH.labels(queue="receipt-processing").dec()
+            slots.release()
+            # Connections are per thread; don't leave this one open
+            connections.close_all()
+
+    def process(self, blob_id: int) -> ReceiptBlob:
+        blob = ReceiptBlob.objects.get(pk=blob_id)
+        try:
+            image, text = self.extract(blob)
+        except (UnidentifiedImageError, FileNotFoundError):
+            return self._finish(blob, "unsupported")
+        except Exception:
+            logger.exception("Could not read receipt blob %s", blob_id)
+            return self._finish(blob, "failed")
+
+        thumbnail = self.save_thumbnail(blob, image) if image is not None else ""
+        return self._finish(
+            blob,
+            "done",
+            thumbnail=thumbnail,
+            extracted_text=text,
+            detected_amount=detect_amount(text),
+        )
+
+    def _finish(self, blob: ReceiptBlob, status: str, **fields) -> ReceiptBlob:
+        fields.update(processing_status=status, processed_at=timezone.now())
+        # update() keeps the search and metrics signals out of a worker thread
+        ReceiptBlob.objects.filter(pk=blob.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(blob, name, value)
+        return blob
+
+    def is_pdf(self, blob: ReceiptBlob) -> bool:
+        return (
+            blob.content_type == "application/pdf"
+            or blob.file.name.lower().endswith(".pdf")
+        )
+
+    def extract(self, blob: ReceiptBlob) -> Tuple[Optional[Image.Image], str]:
+        """The preview image and text of ``blob``, either possibly empty."""
+        with blob.file.open("rb") as source:
+            if self.is_pdf(blob):
+                return self._extract_pdf(source)
+            image = Image.open(source)
+            image.load()
+        return image, self._ocr(image)
+
+    def _extract_pdf(self, source) -> Tuple[Optional[Image.Image], str]:
+        if PdfReader is None:
+            return None, ""
+        pages = PdfReader(source).pages[: self.max_pdf_pages]
+        text = "\n".join(page.extract_text() or "" for page in pages)
+
+        # Scanned PDFs are one image per page; use the first as the preview
+        image = None
+        if pages and pages[0].images:
+            image = pages[0].images[0].image
+        if not text.strip() and image is not None:
+            text = self._ocr(image)
+        return image, text
+
+    def _ocr(self, image: Image.Image) -> str:
+        if pytesseract is None:
+            return ""
+        try:
+            return pytesseract.image_to_string(image)
+        except pytesseract.TesseractNotFoundError:
+            return ""
+
+    def save_thumbnail(self, blob: ReceiptBlob, image: Image.Image) -> str:
+        """Store a compressed JPEG preview beside the blob's file."""
+        image = image.convert("RGB")
+        image.thumbnail((self.thumbnail_size, self.thumbnail_size))
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=70, optimize=True)
+        name = f"{os.path.splitext(blob.file.name)[0]}.thumb.jpg"
+        return blob.thumbnail.storage.save(name, ContentFile(buffer.getvalue()))
@@ -0,0 +1,200 @@
+import hashlib
+import os
+from typing import Dict, Iterator, Optional, Tuple
+
+from django.core.files import File
+from django.db import IntegrityError, transaction
+
+from core.models import Expense, ReceiptBlob
+from core.services.finance.receipt_processing_service import (
+    ReceiptProcessingService,
+)
+
+
+class ReceiptService:
+    """
+    Content-addressed receipt storage.
+
+    Each distinct file is uploaded once as a ``ReceiptBlob`` keyed by its
+    SHA-256; expenses reference blobs, and ``Expense.receipt`` names the
+    blob's file so existing URLs and downloads keep working.
+    """
+
+    chunk_size = 64 * 1024
+
+    def digest(self, file) -> str:
+        """
+        SHA-256 of ``file``, streamed in chunks. Files hashed while they were
+        uploaded (see core.upload_handlers) carry the digest already.
+        """
+        precomputed = getattr(file, "sha256", None)
+        if precomputed:
+            return precomputed
+        if not hasattr(file, "chunks"):
+            file = File(file)
+        hasher = hashlib.sha256()
+        for chunk in file.chunks(self.chunk_size):
+            hasher.update(chunk)
+        file.seek(0)
+        return hasher.hexdigest()
+
+    def find(self, digest: str) -> Optional[ReceiptBlob]:
+        return ReceiptBlob.objects.filter(sha256=digest).first()
+
+    def store(self, file) -> ReceiptBlob:
+        """Return the blob for ``file``'s bytes, uploading them only if new."""
+        digest = self.digest(file)
+        blob = self.find(digest)
+        if blob is not None:
+            return blob
+
+        # Lets the storage name the file without hashing it again
+        file.sha256 = digest
+        blob = ReceiptBlob(
+            sha256=digest,
+            size=file.size,
+            content_type=getattr(file, "content_type", None) or "",
+        )
+        blob.file.save(os.path.basename(file.name), file, save=False)
+        try:
+            with transaction.atomic():
+                blob.save()
+        except IntegrityError:
+            # A concurrent upload of the same bytes created the row first;
+            # content-hashed names mean both uploads wrote the same file
+            return ReceiptBlob.objects.get(sha256=digest)
+        ReceiptProcessingService().schedule(blob.pk)
+        return blob
+
+    def attach(self, expense: Expense, file) -> ReceiptBlob:
+        """Point ``expense`` at the blob for ``file``. Does not save it."""
+        blob = self.store(file)
+        expense.receipt_blob = blob
+        expense.receipt = blob.file.name
+        return blob
+
+    def read(self, expense: Expense) -> Tuple[str, int]:
+        """SHA-256 and size of ``expense``'s stored receipt; storage I/O only."""
+        name = expense.receipt.name
+        storage = expense.receipt.storage
+        with storage.open(name) as receipt:
+            digest = self.digest(receipt)
+        return digest, storage.size(name)
+
+    def link(
+        self, expense: Expense, digest: str, size: int
+    ) -> Tuple[ReceiptBlob, Optional[str]]:
+        """
+        Point ``expense`` at the blob for ``digest``, registering its receipt
+        file as that blob when the bytes are new. Database work only, in one
+        short transaction.
+
+        Returns the blob and, when another file already held the same bytes,
+        the name of the now redundant file.
+        """
+        name = expense.receipt.name
+        with transaction.atomic():
+            blob, created = ReceiptBlob.objects.get_or_create(
+                sha256=digest, defaults={"file": name, "size": size}
+            )
+            if created:
+                ReceiptProcessingService().schedule(blob.pk)
+            # update() skips the search and metrics signals; nothing they track changed
+            Expense.objects.filter(pk=expense.pk).update(
+                receipt_blob=blob, receipt=blob.file.name
+            )
+        duplicate = name if blob.file.name != name else None
+        return blob, duplicate
+
+    def adopt(self, expense: Expense) -> Tuple[ReceiptBlob, Optional[str]]:
+        """
+        Link an expense whose receipt predates blobs to the blob for its
+        bytes. The file is read before any transaction starts.
+        """
+        return self.link(expense, *self.read(expense))
+
+    def unlinked(self, batch_size: int = 100) -> Iterator[Expense]:
+        """
+        Expenses with a receipt but no blob, fetched a batch at a time so no
+        cursor stays open while their files are read.
+        """
+        pending = (
+            Expense.objects.filter(receipt_blob__isnull=True)
+            .exclude(receipt="")
+            .exclude(receipt__isnull=True)
+            .only("pk", "receipt")
+            .order_by("pk")
+        )
+        last_pk = 0
+        while True:
+            batch = list(pending.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                return
+            yield from batch
+            last_pk = batch[-1].pk
+
+    def reconcile(
+        self,
+        delete_duplicates: bool = True,
+        dry_run: bool = False,
+        batch_size: int = 100,
+    ):
+        """
+        Adopt every unlinked receipt, merging files with identical bytes
+        onto one blob and deleting the redundant copies.
+
+        Each expense is linked in its own transaction once its file has been
+        hashed, so no transaction waits on storage and a failure keeps the
+        work done before it. A dry run only reads.
+        """
+        stats = {"adopted": 0, "merged": 0, "deleted": 0, "missing": 0}
+        duplicates = []
+        # Blob file per digest as a dry run would have linked it
+        planned = {}
+
+        for expense in self.unlinked(batch_size):
+            try:
+                digest, size = self.read(expense)
+            except FileNotFoundError:
+                stats["missing"] += 1
+                continue
+            name = expense.receipt.name
+            if dry_run:
+                if digest not in planned:
+                    blob = self.find(digest)
+                    planned[digest] = blob.file.name if blob else name
+                duplicate = name if planned[digest] != name else None
+            else:
+                _, duplicate = self.link(expense, digest, size)
+            stats["adopted"] += 1
+            if duplicate:
+                stats["merged"] += 1
+                duplicates.append((expense.receipt.storage, duplicate))
+
+        if delete_duplicates and not dry_run:
+            for storage, name in duplicates:
+                if not Expense.objects.filter(receipt=name).exists():
+                    storage.delete(name)
+                    stats["deleted"] += 1
+        return stats
+
+    def prune(self, dry_run: bool = False) -> int:
+        """Delete blobs, and their files, that no expense references."""
+        orphans = ReceiptBlob.objects.filter(expenses__isnull=True)
+        count = 0
+        for blob in orphans.iterator():
+            count += 1
+            if not dry_run:
+                blob.file.delete(save=False)
+                if blob.thumbnail:
+                    blob.thumbnail.delete(save=False)
+                blob.delete()
+        return count
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "blobs": ReceiptBlob.objects.count(),
+            "linked_expenses": Expense.objects.filter(
+                receipt_blob__isnull=False
+            ).count(),
+        }
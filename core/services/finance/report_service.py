@@ -10,11 +10,14 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
+from core.db_routers import analytics_reads
+
 
 class FinancialReportService:
     def __init__(self):
         self.styles = getSampleStyleSheet()
 
+    @analytics_reads()
     def generate_financial_report(self, report_type, start_date, end_date, queryset):
         """Main method to generate financial reports"""
         buffer = BytesIO()
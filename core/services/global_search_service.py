@@ -0,0 +1,296 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchVector
+from django.db.models import Model, QuerySet
+
+from core.models import SearchEntry
+
+from .search_service import SearchService, related_paths
+
+# What each entity contributes to its SearchEntry. Paths are dotted for
+# related objects; ``select_related`` keeps rebuilds to one query per batch.
+ENTITY_SPECS = {
+    "client": {
+        "model": "core.Client",
+        "title": ("name",),
+        "subtitle": ("company",),
+        "keywords": ("company", "email", "tax_number"),
+        "body": ("city", "notes"),
+        "select_related": (),
+    },
+    "project": {
+        "model": "core.Project",
+        "title": ("code", "name"),
+        "subtitle": ("client.name",),
+        "keywords": ("client.name", "manager.username"),
+        "body": ("description",),
+        "select_related": ("client", "manager"),
+    },
+    "task": {
+        "model": "core.Task",
+        "title": ("name",),
+        "subtitle": ("project.name",),
+        "keywords": ("tags", "project.name", "assigned_to.username"),
+        "body": ("description",),
+        "select_related": ("project", "assigned_to"),
+    },
+    "invoice": {
+        "model": "core.Invoice",
+        "title": ("invoice_number",),
+        "subtitle": ("client.name",),
+        "keywords": ("client.name", "project.name"),
+        "body": ("notes",),
+        "select_related": ("client", "project"),
+    },
+    "expense": {
+        "model": "core.Expense",
+        "title": ("title",),
+        "subtitle": ("vendor",),
+        "keywords": ("vendor", "invoice_number", "payment_reference", "category"),
+        "body": ("description",),
+        "select_related": (),
+    },
+    "income": {
+        "model": "core.Income",
+        "title": ("payment_reference",),
+        "subtitle": ("client.name",),
+        "keywords": ("client.name", "project.name", "invoice.invoice_number"),
+        "body": ("description",),
+        "select_related": ("client", "project", "invoice"),
+    },
+}
+
+ENTRY_FIELDS = ["title", "subtitle", "keywords", "body", "updated_at"]
+ENTRY_PARTS = ("title", "subtitle", "keywords", "body")
+
+
+def _resolve(instance: Model, paths: Iterable[str]) -> str:
+    parts = []
+    for path in paths:
+        value = instance
+        for attr in path.split("."):
+            value = getattr(value, attr, None) if value is not None else None
+        if value:
+            parts.append(str(value))
+    return " ".join(parts)
+
+
+class GlobalSearchService:
+    """
+    Maintains the denormalized cross-entity search index and serves typeahead
+    queries against it.
+
+    Every indexed object has one SearchEntry row, so a search is a few
+    indexed queries per requested entity type, with no joins.
+    """
+
+    default_limit = 5
+    max_limit = 20
+    # Newest entries per entity type ranked, widening while some but not
+    # enough match, before falling back to every match
+    recent_windows = (200, 2000)
+
+    def __init__(self):
+        self.search_service = SearchService()
+
+    @staticmethod
+    def entity_types() -> List[str]:
+        return list(ENTITY_SPECS)
+
+    @staticmethod
+    def model_for(entity_type: str) -> Type[Model]:
+        return apps.get_model(ENTITY_SPECS[entity_type]["model"])
+
+    def indexed_models(self) -> Dict[Type[Model], str]:
+        return {self.model_for(name): name for name in ENTITY_SPECS}
+
+    def entity_type_for(self, model: Type[Model]) -> Optional[str]:
+        label = model._meta.label
+        for name, spec in ENTITY_SPECS.items():
+            if spec["model"] == label:
+                return name
+        return None
+
+    def dependencies(self) -> List[Tuple[Type[Model], str, str, Set[str]]]:
+        """
+        ``(related model, entity type, relation, fields)`` for every related
+        field copied into an entity's entry.
+        """
+        return [
+            (related, entity_type, relation, fields)
+            for entity_type, spec in ENTITY_SPECS.items()
+            for related, relation, fields in related_paths(
+                self.model_for(entity_type),
+                [path for part in ENTRY_PARTS for path in spec[part]],
+            )
+        ]
+
+    def reindex_dependents(self, instance: Model, changed: Set[str]) -> int:
+        """
+        Refresh the entries that copy any of the ``changed`` fields of
+        ``instance``, e.g. a client's projects and invoices after it is
+        renamed.
+        """
+        count = 0
+        for related, entity_type, relation, fields in self.dependencies():
+            if related is not type(instance) or not fields & changed:
+                continue
+            queryset = self.model_for(entity_type)._default_manager.filter(
+                **{relation: instance}
+            )
+            count += self._index_queryset(entity_type, queryset)
+        return count
+
+    def build_entry(self, entity_type: str, instance: Model) -> SearchEntry:
+        spec = ENTITY_SPECS[entity_type]
+        title = _resolve(instance, spec["title"]) or str(instance)
+        return SearchEntry(
+            entity_type=entity_type,
+            object_id=instance.pk,
+            title=title[:255],
+            subtitle=_resolve(instance, spec["subtitle"])[:255],
+            keywords=_resolve(instance, spec["keywords"]),
+            body=_resolve(instance, spec["body"]),
+        )
+
+    def index(self, instance: Model) -> None:
+        """Insert or refresh the entry for one object."""
+        entity_type = self.entity_type_for(type(instance))
+        if entity_type is None:
+            return
+        self._upsert([self.build_entry(entity_type, instance)])
+        self.refresh_vectors(
+            SearchEntry.objects.filter(entity_type=entity_type, object_id=instance.pk)
+        )
+
+    def remove(self, instance: Model) -> None:
+        entity_type = self.entity_type_for(type(instance))
+        if entity_type is not None:
+            SearchEntry.objects.filter(
+                entity_type=entity_type, object_id=instance.pk
+            ).delete()
+
+    def refresh_vectors(self, entries: QuerySet) -> None:
+        """
+        Recompute stored vectors from the entries' own columns, so a batch is
+        one UPDATE. No-op outside Postgres, where search falls back to
+        ``icontains``.
+        """
+        if not self.search_service.is_postgres(entries.db):
+            return
+        config = self.search_service.config
+        entries.update(
+            search_vector=SearchVector("title", weight="A", config=config)
+            + SearchVector("keywords", weight="B", config=config)
+            + SearchVector("body", weight="C", config=config)
+        )
+
+    def rebuild(
+        self, entity_types: Optional[Iterable[str]] = None, batch_size: int = 500
+    ) -> Dict[str, int]:
+        """
+        Re-create the entries of the given entity types (all by default) from
+        their source rows and drop entries whose object no longer exists.
+        """
+        counts = {}
+        for entity_type in entity_types or ENTITY_SPECS:
+            model = self.model_for(entity_type)
+            count = self._index_queryset(
+                entity_type, model._default_manager.all(), batch_size
+            )
+
+            SearchEntry.objects.filter(entity_type=entity_type).exclude(
+                object_id__in=model._default_manager.values("pk")
+            ).delete()
+            counts[entity_type] = count
+        return counts
+
+    def search(
+        self,
+        term: str,
+        entity_types: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[dict]]:
+        """
+        Prefix-match ``term`` against the index.
+
+        Returns up to ``limit`` best-ranked hits per entity type, grouped by
+        type. Each type first ranks its matches among its newest entries,
+        read through the ``(entity_type, object_id)`` index and widened over
+        ``recent_windows`` until ``limit`` of them match, so a one- or
+        two-letter prefix matching most of the index costs a bounded amount.
+        A term too rare to fill the widest window, or missing from the
+        narrowest one, ranks every match of the type instead, through the
+        type's own GIN index on Postgres.
+        """
+        limit = min(limit or self.default_limit, self.max_limit)
+        if not self.search_service.tokenize(term or ""):
+            return {}
+
+        results: Dict[str, List[dict]] = {}
+        for entity_type in entity_types or ENTITY_SPECS:
+            entries = SearchEntry.objects.filter(entity_type=entity_type)
+            for window in self.recent_windows:
+                newest = entries.order_by("-object_id").values("pk")[:window]
+                rows = self._ranked(entries.filter(pk__in=newest), term, limit)
+                if len(rows) >= limit or not rows:
+                    break
+            if len(rows) < limit:
+                rows = self._ranked(entries, term, limit)
+            hits = [
+                {
+                    "type": entity_type,
+                    "id": row["object_id"],
+                    "title": row["title"],
+                    "subtitle": row["subtitle"],
+                    "rank": row["search_rank"],
+                }
+                for row in rows
+            ]
+            if hits:
+                results[entity_type] = hits
+        return results
+
+    def _ranked(self, entries: QuerySet, term: str, limit: int) -> List[dict]:
+        return list(
+            self.search_service.search(entries, term, prefix=True)
+            .order_by("-search_rank", "pk")
+            .values("object_id", "title", "subtitle", "search_rank")[:limit]
+        )
+
+    def _index_queryset(
+        self, entity_type: str, queryset: QuerySet, batch_size: int = 500
+    ) -> int:
+        queryset = queryset.select_related(
+            *ENTITY_SPECS[entity_type]["select_related"]
+        ).order_by("pk")
+        count = 0
+        batch = []
+        for instance in queryset.iterator(chunk_size=batch_size):
+            batch.append(self.build_entry(entity_type, instance))
+            if len(batch) >= batch_size:
+                count += self._index_batch(entity_type, batch)
+                batch = []
+        return count + self._index_batch(entity_type, batch)
+
+    def _index_batch(self, entity_type: str, entries: List[SearchEntry]) -> int:
+        if not entries:
+            return 0
+        self._upsert(entries)
+        self.refresh_vectors(
+            SearchEntry.objects.filter(
+                entity_type=entity_type,
+                object_id__in=[entry.object_id for entry in entries],
+            )
+        )
+        return len(entries)
+
+    @staticmethod
+    def _upsert(entries: List[SearchEntry]) -> None:
+        SearchEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["entity_type", "object_id"],
+            update_fields=ENTRY_FIELDS,
+        )
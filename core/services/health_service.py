@@ -0,0 +1,193 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.models import ReceiptBlob
+
+
+class HealthService:
+    """
+    Readiness probes for the services a request depends on.
+
+    Probes run concurrently on a small dedicated pool and each reports its
+    latency; one that has not answered within ``HEALTH_PROBE_TIMEOUT``
+    seconds counts as failed, and is not started again until it returns.
+    Only database failures make the instance unready; cache and blob storage
+    failures mark it degraded.
+
+    With ``HEALTH_CHECK_INTERVAL`` above zero, a background thread refreshes
+    the result that often and requests read the latest snapshot, so probe
+    traffic does not grow with the number of callers.
+    """
+
+    _lock = threading.Lock()
+    _executor = None
+    _in_flight: Dict[str, object] = {}
+    _snapshot: Optional[Dict] = None
+    _refresher = None
+
+    @property
+    def timeout(self) -> float:
+        return getattr(settings, "HEALTH_PROBE_TIMEOUT", 2.0)
+
+    @property
+    def interval(self) -> float:
+        return getattr(settings, "HEALTH_CHECK_INTERVAL", 5.0)
+
+    def probes(self) -> List[Tuple[str, Callable[[], None], bool]]:
+        """``(name, probe, critical)`` for every dependency."""
+        # Analytics reads fall back to the primary when the replica is down
+        replica = getattr(settings, "DATABASE_REPLICA_ALIAS", "")
+        probes = [
+            (f"database:{alias}", self._database_probe(alias), alias != replica)
+            for alias in connections
+        ]
+        probes.append(("cache", self.probe_cache, False))
+        if getattr(settings, "HEALTH_CHECK_STORAGE", True):
+            probes.append(("storage", self.probe_storage, False))
+        return probes
+
+    def _database_probe(self, alias: str) -> Callable[[], None]:
+        def probe():
+            connection = connections[alias]
+            try:
+                # SET LOCAL ends with the transaction, so the timeout never
+                # follows the connection back into a pool or CONN_MAX_AGE reuse
+                with transaction.atomic(using=alias), connection.cursor() as cursor:
+                    if connection.vendor == "postgresql":
+                        cursor.execute(
+                            "SET LOCAL statement_timeout = %s",
+                            [int(self.timeout * 1000)],
+                        )
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+            finally:
+                # Probe threads are long-lived; honour CONN_MAX_AGE
+                connection.close_if_unusable_or_obsolete()
+
+        return probe
+
+    def probe_cache(self) -> None:
+        key = f"health-check:{uuid.uuid4().hex}"
+        cache.set(key, "ok", 10)
+        try:
+            if cache.get(key) != "ok":
+                raise RuntimeError("cache did not return the value it stored")
+        finally:
+            cache.delete(key)
+
+    def probe_storage(self) -> None:
+        storage = ReceiptBlob._meta.get_field("file").storage
+        client = getattr(storage, "client", None)
+        if client is not None and hasattr(client, "get_container_properties"):
+            client.get_container_properties(timeout=max(int(self.timeout), 1))
+        else:
+            storage.exists("")
+
+    @classmethod
+    def _pool(cls, workers: int) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="health-probe"
+            )
+        return cls._executor
+
+    @staticmethod
+    def _timed(probe: Callable[[], None]) -> Tuple[float, str]:
+        started = time.perf_counter()
+        try:
+            probe()
+            error = ""
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        return (time.perf_counter() - started) * 1000, error
+
+    def run(self) -> Dict:
+        """Run every probe now and return the combined result."""
+        probes = self.probes()
+        with self._lock:
+            executor = self._pool(len(probes))
+            futures = {}
+            for name, probe, _ in probes:
+                future = self._in_flight.get(name)
+                if future is None or future.done():
+                    future = executor.submit(self._timed, probe)
+                    self._in_flight[name] = future
+                futures[name] = future
+
+        wait(futures.values(), timeout=self.timeout)
+
+        checks = {}
+        for name, _, critical in probes:
+            future = futures[name]
+            if future.done():
+                latency, error = future.result()
+            else:
+                latency, error = self.timeout * 1000, "timed out"
+            checks[name] = {
+                "healthy": not error,
+                "critical": critical,
+                "latency_ms": round(latency, 2),
+                "error": error,
+            }
+
+        if any(c["critical"] and not c["healthy"] for c in checks.values()):
+            status = "unavailable"
+        elif all(c["healthy"] for c in checks.values()):
+            status = "ok"
+        else:
+            status = "degraded"
+        return {"status": status, "checks": checks, "checked_at": timezone.now()}
+
+    def _refresh_forever(self) -> None:
+        while True:
+            type(self)._snapshot = self.run()
+            time.sleep(self.interval)
+
+    def readiness(self) -> Dict:
+        """
+        The latest probe result. Probes run inline when background refresh
+        is disabled or its snapshot has gone stale.
+        """
+        snapshot = self.latest()
+        return self.run() if snapshot is None else snapshot
+
+    async def areadiness(self) -> Dict:
+        """``readiness`` for async views; only an inline run uses a thread."""
+        snapshot = self.latest()
+        if snapshot is None:
+            # Probes block on their own pool and open no connection here
+            snapshot = await sync_to_async(self.run, thread_sensitive=False)()
+        return snapshot
+
+    def latest(self) -> Optional[Dict]:
+        """
+        The background refresher's snapshot, starting the refresher if need
+        be; None when refresh is disabled or the snapshot has gone stale.
+        """
+        if self.interval <= 0:
+            return None
+
+        cls = type(self)
+        with self._lock:
+            if cls._refresher is None or not cls._refresher.is_alive():
+                cls._refresher = threading.Thread(
+                    target=self._refresh_forever, name="health-refresh", daemon=True
+                )
+                cls._refresher.start()
+
+        snapshot = cls._snapshot
+        max_age = self.interval * 3 + self.timeout
+        if snapshot is None or (
+            (timezone.now() - snapshot["checked_at"]).total_seconds() > max_age
+        ):
+            return None
+        return snapshot
@@ -0,0 +1,93 @@
+import hashlib
+from typing import Any, Callable, Iterable, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Model, QuerySet
+
+from core.metrics import record_cache_lookup
+
+VERSION_KEY = "metrics-version:{label}"
+
+
+class MetricsCacheService:
+    """
+    Caches summary metrics per filtered queryset.
+
+    Keys hash the queryset's SQL and parameters together with a version
+    counter for every model the metrics read, so saving or deleting any of
+    those models makes earlier entries unreachable.
+
+    Entries and counters live in the ``ADMIN_METRICS_CACHE_ALIAS`` cache. Only
+    a cache shared by every process (e.g. Redis) carries a bump to the other
+    workers and pods; with the default per-process cache they serve their own
+    entries until ``ADMIN_METRICS_CACHE_TTL`` expires. The TTL also bounds
+    staleness from writes that bypass signals, such as ``QuerySet.update()``.
+    """
+
+    key_prefix = "admin-metrics"
+
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, "ADMIN_METRICS_CACHE_TTL", 60)
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, "ADMIN_METRICS_CACHE_ALIAS", "default")]
+
+    @staticmethod
+    def version_key(label: str) -> str:
+        return VERSION_KEY.format(label=label)
+
+    def versions(self, labels: Iterable[str]) -> list:
+        labels = sorted(labels)
+        found = self.cache.get_many([self.version_key(label) for label in labels])
+        return [found.get(self.version_key(label), 0) for label in labels]
+
+    def bump(self, model: Type[Model]) -> None:
+        """Invalidate every cached metric that depends on ``model``."""
+        key = self.version_key(model._meta.label_lower)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, None)
+
+    def make_key(self, namespace: str, queryset: QuerySet, labels: Iterable[str]):
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            sql, params = "EMPTY", ()
+        fingerprint = repr((sql, params, self.versions(labels)))
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return f"{self.key_prefix}:{namespace}:{digest}"
+
+    def get_or_compute(
+        self,
+        namespace: str,
+        queryset: QuerySet,
+        compute: Callable[[QuerySet], dict],
+        depends_on: Iterable[str] = (),
+    ) -> dict:
+        """
+        Return cached metrics for ``queryset`` or compute and cache them.
+
+        ``depends_on`` lists extra model labels (``"core.income"``) the
+        metrics read besides the queryset's own model.
+        """
+        labels = set(depends_on) | {queryset.model._meta.label_lower}
+        key = self.make_key(namespace, queryset, labels)
+        metrics = self.cache.get(key)
+        record_cache_lookup(self.key_prefix, metrics is not None)
+        if metrics is None:
+            metrics = self.materialize(compute(queryset))
+            self.cache.set(key, metrics, self.timeout)
+        return metrics
+
+    def materialize(self, value: Any) -> Any:
+        """Evaluate lazy querysets so metrics can be cached and serialized."""
+        if isinstance(value, QuerySet):
+            return [self.materialize(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.materialize(item) for key, item in value.items()}
+        return value
@@ -7,6 +7,7 @@ from django.db import transaction
 from django.db.models import Sum
 from django.utils import timezone
 
+from core.db_routers import analytics_reads
 from core.models import Project, User
 
 from .base import BaseService
@@ -60,6 +61,7 @@ class ProjectService(BaseService[Project]):
         project.team_members.set(users)
         return project
 
+    @analytics_reads()
     def get_project_metrics(self, project: Project) -> Dict[str, Any]:
         """Calculate project metrics."""
         return {
@@ -73,6 +75,7 @@ class ProjectService(BaseService[Project]):
             ).count(),
         }
 
+    @analytics_reads()
     def get_financial_summary(self, project: Project) -> Dict[str, Decimal]:
         """Get project financial summary."""
         return {
@@ -0,0 +1,228 @@
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import (
+    Case,
+    F,
+    FloatField,
+    Model,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+
+from core.models.mixins.searchable import SearchableMixin
+
+# Postgres' default ts_rank weights for {D, C, B, A}, reused by the fallback
+WEIGHT_SCORES = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+
+def related_paths(
+    model: Type[Model], paths: Iterable[str]
+) -> List[Tuple[Type[Model], str, Set[str]]]:
+    """
+    ``(related model, relation, fields)`` for the dotted ``relation.field``
+    paths among ``paths``: the fields of other rows a document copies in.
+    """
+    fields_by_relation = defaultdict(set)
+    for path in paths:
+        relation, _, field = path.partition(".")
+        if field:
+            fields_by_relation[relation].add(field)
+    return [
+        (model._meta.get_field(relation).related_model, relation, fields)
+        for relation, fields in fields_by_relation.items()
+    ]
+
+
+class SearchService:
+    """Maintains and queries the weighted full-text index of searchable models."""
+
+    config = "english"
+
+    def is_postgres(self, using: str = "default") -> bool:
+        return connections[using].vendor == "postgresql"
+
+    @staticmethod
+    def is_searchable(model: Type[Model]) -> bool:
+        return issubclass(model, SearchableMixin)
+
+    @staticmethod
+    def tokenize(term: str) -> List[str]:
+        return re.findall(r"\w+", term.lower())
+
+    def vector_expression(
+        self, model: Type[Model], weights: Optional[Dict[str, str]] = None
+    ):
+        """
+        The search vector of ``model`` rows as a SQL expression, built from
+        ``weights`` (``model.search_weights`` by default). Related paths are
+        read through subqueries, so the expression also works in an UPDATE.
+        """
+        columns = defaultdict(list)
+        for path, weight in (weights or model.search_weights).items():
+            relation, _, field = path.partition(".")
+            if field:
+                foreign_key = model._meta.get_field(relation)
+                column = Subquery(
+                    foreign_key.related_model._default_manager.filter(
+                        pk=OuterRef(foreign_key.attname)
+                    )
+                    .order_by()
+                    .values(field)[:1]
+                )
+            else:
+                column = F(path)
+            columns[weight].append(column)
+
+        vector = None
+        for weight, parts in sorted(columns.items()):
+            part = SearchVector(*parts, weight=weight, config=self.config)
+            vector = part if vector is None else vector + part
+        return vector
+
+    def update_vectors(
+        self, queryset: QuerySet, weights: Optional[Dict[str, str]] = None
+    ) -> int:
+        """Recompute the stored vectors of ``queryset`` in one UPDATE."""
+        if not self.is_postgres(queryset.db):
+            return 0
+        return queryset.update(
+            search_vector=self.vector_expression(queryset.model, weights)
+        )
+
+    def update_index(self, instance: SearchableMixin) -> None:
+        """Recompute the stored search vector for one instance."""
+        self.update_vectors(
+            type(instance)
+            ._default_manager.using(instance._state.db or "default")
+            .filter(pk=instance.pk)
+        )
+
+    def rebuild(
+        self,
+        model: Type[Model],
+        batch_size: int = 500,
+        weights: Optional[Dict[str, str]] = None,
+        using: str = "default",
+    ) -> int:
+        """Recompute the search vector of every row of ``model``, one UPDATE per batch."""
+        if not self.is_postgres(using):
+            return 0
+        queryset = model._default_manager.using(using).order_by("pk")
+        count = 0
+        last_pk = None
+        while True:
+            batch = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            pks = list(batch.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                return count
+            count += self.update_vectors(queryset.filter(pk__in=pks), weights)
+            last_pk = pks[-1]
+
+    def dependencies(self) -> List[Tuple[Type[Model], Type[Model], str, Set[str]]]:
+        """
+        ``(related model, searchable model, relation, fields)`` for every
+        related field copied into a searchable model's document.
+        """
+        return [
+            (related, model, relation, fields)
+            for model in self.searchable_models()
+            for related, relation, fields in related_paths(model, model.search_weights)
+        ]
+
+    def reindex_dependents(self, instance: Model, changed: Set[str]) -> int:
+        """
+        Recompute the vectors that copy any of the ``changed`` fields of
+        ``instance``, e.g. a client's projects after it is renamed.
+        """
+        count = 0
+        for related, model, relation, fields in self.dependencies():
+            if related is not type(instance) or not fields & changed:
+                continue
+            count += self.update_vectors(
+                model._default_manager.using(instance._state.db or "default").filter(
+                    **{relation: instance}
+                )
+            )
+        return count
+
+    def build_query(self, term: str, prefix: bool = False) -> Optional[SearchQuery]:
+        if not prefix:
+            return SearchQuery(term, config=self.config, search_type="websearch")
+        tokens = self.tokenize(term)
+        if not tokens:
+            return None
+        raw = " & ".join(f"{token}:*" for token in tokens)
+        return SearchQuery(raw, config=self.config, search_type="raw")
+
+    def search(self, queryset: QuerySet, term: str, prefix: bool = False) -> QuerySet:
+        """
+        Filter ``queryset`` to rows matching ``term``, annotated with
+        ``search_rank`` and ordered best match first.
+
+        With ``prefix`` every word also matches as a prefix, for typeahead.
+        """
+        if not term or not term.strip():
+            return queryset
+        if self.is_postgres(queryset.db):
+            query = self.build_query(term, prefix=prefix)
+            if query is None:
+                return queryset.none()
+            return (
+                queryset.filter(search_vector=query)
+                .annotate(search_rank=SearchRank(F("search_vector"), query))
+                .order_by("-search_rank")
+            )
+        return self._fallback_search(queryset, term)
+
+    def _fallback_search(self, queryset: QuerySet, term: str) -> QuerySet:
+        """
+        Ranked ``icontains`` search for backends without tsvector support.
+        Every word must match some field; substring matching already covers
+        prefixes.
+        """
+        tokens = self.tokenize(term)
+        if not tokens:
+            return queryset.none()
+        fields = [
+            (path.replace(".", "__"), weight)
+            for path, weight in queryset.model.search_weights.items()
+        ]
+
+        condition = Q()
+        rank = Value(0.0, output_field=FloatField())
+        for token in tokens:
+            token_condition = Q()
+            for field, weight in fields:
+                match = Q(**{f"{field}__icontains": token})
+                token_condition |= match
+                rank = rank + Case(
+                    When(match, then=Value(WEIGHT_SCORES[weight])),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+            condition &= token_condition
+
+        return (
+            queryset.filter(condition)
+            .annotate(search_rank=rank)
+            .order_by("-search_rank")
+        )
+
+    def searchable_models(self) -> Iterable[Type[SearchableMixin]]:
+        """Models whose vectors are maintained per row on save."""
+        from django.apps import apps
+
+        # The global index maintains its own vectors in bulk
+        return [
+            model
+            for model in apps.get_app_config("core").get_models()
+            if self.is_searchable(model) and model._meta.model_name != "searchentry"
+        ]
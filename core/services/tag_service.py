@@ -0,0 +1,67 @@
+from typing import Iterable, List, Union
+
+from django.db.models import Count, QuerySet
+
+from core.models import Tag
+
+from .base import BaseService
+
+
+class TagService(BaseService[Tag]):
+    """Set queries over normalized task tags and user skills."""
+
+    def __init__(self):
+        super().__init__(Tag)
+
+    def _through(self, queryset: QuerySet, relation: str):
+        field = queryset.model._meta.get_field(relation)
+        return (
+            field.remote_field.through,
+            field.m2m_field_name(),
+            field.m2m_reverse_field_name(),
+        )
+
+    def _names(self, names: Union[str, Iterable[str]]) -> List[str]:
+        return self.model_class.parse(names)
+
+    def filter_any(
+        self, queryset: QuerySet, relation: str, names: Union[str, Iterable[str]]
+    ) -> QuerySet:
+        """Rows linked to at least one of ``names``."""
+        names = self._names(names)
+        if not names:
+            return queryset
+        through, source, target = self._through(queryset, relation)
+        matching = through.objects.filter(**{f"{target}__name__in": names}).values(
+            source
+        )
+        return queryset.filter(pk__in=matching)
+
+    def filter_all(
+        self, queryset: QuerySet, relation: str, names: Union[str, Iterable[str]]
+    ) -> QuerySet:
+        """Rows linked to every one of ``names``."""
+        names = self._names(names)
+        if not names:
+            return queryset
+        through, source, target = self._through(queryset, relation)
+        matching = (
+            through.objects.filter(**{f"{target}__name__in": names})
+            .values(source)
+            .annotate(matched=Count(target))
+            .filter(matched=len(names))
+            .values(source)
+        )
+        return queryset.filter(pk__in=matching)
+
+    def tasks_tagged(self, names, match_all: bool = False) -> QuerySet:
+        from core.models import Task
+
+        method = self.filter_all if match_all else self.filter_any
+        return method(Task.objects.all(), "normalized_tags", names)
+
+    def users_with_skills(self, names, match_all: bool = False) -> QuerySet:
+        from core.models import User
+
+        method = self.filter_all if match_all else self.filter_any
+        return method(User.objects.all(), "normalized_skills", names)
@@ -7,6 +7,8 @@ from core.models import Task, User
 
 from .base import BaseService
 
+ACTIVE_WORKLOAD_STATUSES = ["pending", "in_progress"]
+
 
 class UserService(BaseService[User]):
     def __init__(self):
@@ -15,7 +17,7 @@ class UserService(BaseService[User]):
     def get_user_workload(self, user: User) -> Dict[str, Any]:
         """Get user's current workload metrics"""
         active_tasks = Task.objects.filter(
-            assigned_to=user, status__in=["pending", "in_progress"]
+            assigned_to=user, status__in=ACTIVE_WORKLOAD_STATUSES
         )
 
         return {
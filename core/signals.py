@@ -0,0 +1,170 @@
+from django.apps import apps
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from core.authentication import StatelessJWTAuthentication
+from core.metrics import DB_CONNECTIONS_OPENED
+from core.models import Expense, User
+from core.services.finance.receipt_service import ReceiptService
+from core.services.global_search_service import GlobalSearchService
+from core.services.metrics_cache_service import MetricsCacheService
+from core.services.search_service import SearchService
+
+
+def update_search_index(sender, instance, raw=False, **kwargs):
+    """Keep the stored search vector of a searchable model current."""
+    if raw:
+        return
+    SearchService().update_index(instance)
+
+
+def update_global_search_entry(sender, instance, raw=False, **kwargs):
+    """Keep the object's row in the global search index current."""
+    if raw:
+        return
+    GlobalSearchService().index(instance)
+
+
+def remove_global_search_entry(sender, instance, **kwargs):
+    GlobalSearchService().remove(instance)
+
+
+def search_dependencies():
+    """Per-row and global index dependencies on fields of related models."""
+    return SearchService().dependencies() + GlobalSearchService().dependencies()
+
+
+def note_search_field_changes(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """Record which fields copied into other rows' search documents change."""
+    instance._search_field_changes = set()
+    if raw or instance.pk is None:
+        return
+    watched = set()
+    for related, _, _, fields in search_dependencies():
+        if related is sender:
+            watched |= fields
+    if update_fields is not None:
+        watched &= set(update_fields)
+    if not watched:
+        return
+    previous = sender._default_manager.filter(pk=instance.pk).values(*watched).first()
+    if previous:
+        instance._search_field_changes = {
+            field for field in watched if previous[field] != getattr(instance, field)
+        }
+
+
+def reindex_search_dependents(sender, instance, raw=False, **kwargs):
+    """Refresh the search documents that copy the fields that just changed."""
+    changed = getattr(instance, "_search_field_changes", None)
+    instance._search_field_changes = set()
+    if raw or not changed:
+        return
+    SearchService().reindex_dependents(instance, changed)
+    GlobalSearchService().reindex_dependents(instance, changed)
+
+
+def deduplicate_receipt_upload(sender, instance, raw=False, **kwargs):
+    """Store a newly uploaded receipt once per distinct file content."""
+    if raw or not instance.receipt or instance.receipt._committed:
+        return
+    ReceiptService().attach(instance, instance.receipt.file)
+
+
+def invalidate_summary_metrics(sender, raw=False, **kwargs):
+    """Make cached admin summary metrics that read ``sender`` stale."""
+    if raw:
+        return
+    MetricsCacheService().bump(sender)
+
+
+# User fields that API tokens describe or depend on
+TOKEN_FIELDS = ("role", "is_staff", "is_superuser", "is_active", "password")
+
+
+def revoke_tokens_on_access_change(
+    sender, instance, raw=False, update_fields=None, **kwargs
+):
+    """Revoke a user's API tokens once their claims or credentials change."""
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not set(update_fields) & set(TOKEN_FIELDS):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values(*TOKEN_FIELDS).first()
+    if previous and any(previous[f] != getattr(instance, f) for f in TOKEN_FIELDS):
+        StatelessJWTAuthentication.revocations.revoke_user(instance)
+
+
+def count_database_connection(sender, connection, **kwargs):
+    # With a pool, connection_created fires on every checkout; those are
+    # reported from the pool statistics instead.
+    if getattr(connection, "pool", None) is not None:
+        return
+    DB_CONNECTIONS_OPENED.labels(alias=connection.alias).inc()
+
+
+def connect_signals():
+    search_service = SearchService()
+    for model in search_service.searchable_models():
+        post_save.connect(
+            update_search_index,
+            sender=model,
+            dispatch_uid=f"search-index-{model._meta.label_lower}",
+        )
+
+    for model in GlobalSearchService().indexed_models():
+        label = model._meta.label_lower
+        post_save.connect(
+            update_global_search_entry,
+            sender=model,
+            dispatch_uid=f"global-search-index-{label}",
+        )
+        post_delete.connect(
+            remove_global_search_entry,
+            sender=model,
+            dispatch_uid=f"global-search-remove-{label}",
+        )
+
+    for related in {dependency[0] for dependency in search_dependencies()}:
+        label = related._meta.label_lower
+        pre_save.connect(
+            note_search_field_changes,
+            sender=related,
+            dispatch_uid=f"search-dependents-changes-{label}",
+        )
+        post_save.connect(
+            reindex_search_dependents,
+            sender=related,
+            dispatch_uid=f"search-dependents-reindex-{label}",
+        )
+
+    pre_save.connect(
+        deduplicate_receipt_upload,
+        sender=Expense,
+        dispatch_uid="expense-receipt-dedup",
+    )
+
+    pre_save.connect(
+        revoke_tokens_on_access_change,
+        sender=User,
+        dispatch_uid="user-token-revocation",
+    )
+
+    for model in apps.get_app_config("core").get_models():
+        label = model._meta.label_lower
+        post_save.connect(
+            invalidate_summary_metrics,
+            sender=model,
+            dispatch_uid=f"summary-metrics-save-{label}",
+        )
+        post_delete.connect(
+            invalidate_summary_metrics,
+            sender=model,
+            dispatch_uid=f"summary-metrics-delete-{label}",
+        )
+
+    connection_created.connect(
+        count_database_connection, dispatch_uid="database-connections-opened"
+    )
@@ -0,0 +1,78 @@
+"""
+Startup import profile.
+
+Every gunicorn worker (or, with ``--preload``, the master) imports the whole
+application before serving its first request. ``profile_startup`` runs that
+import in a fresh interpreter under ``python -X importtime`` and reports the
+slowest top-level imports. Modules listed in ``DEFERRED_MODULES`` are only
+needed by a few requests and are imported on first use; finding one of them
+in the profile means something started importing it eagerly again.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List
+
+# What a worker imports before its first request
+STARTUP_SCRIPT = (
+    "import django; django.setup(); "
+    "from django.core.wsgi import get_wsgi_application; get_wsgi_application(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns"
+)
+
+DEFERRED_MODULES = ("azure", "reportlab", "storages.backends.azure_storage")
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """The ``-X importtime`` lines of ``output``, in import order."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # The column header
+            continue
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append(
+            ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return timings
+
+
+def profile_startup(settings_module: str = "") -> List[ImportTiming]:
+    env = dict(os.environ)
+    env["DJANGO_SETTINGS_MODULE"] = settings_module or os.environ.get(
+        "DJANGO_SETTINGS_MODULE", "TitansManager.settings"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_ms(timings: Iterable[ImportTiming]) -> float:
+    return sum(t.cumulative_us for t in timings if t.depth == 0) / 1000
+
+
+def deferred_imports(
+    timings: Iterable[ImportTiming], modules: Iterable[str] = DEFERRED_MODULES
+) -> List[ImportTiming]:
+    """Imports of ``modules`` that happened at startup."""
+    modules = set(modules)
+    return [t for t in timings if t.module in modules]
@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .factories import ProjectFactory, TaskFactory, UserFactory
+
+
+class AutocompleteAdminTest(TestCase):
+    forms = [
+        ("admin:core_project_add", ["client", "manager", "team_members"]),
+        ("admin:core_task_add", ["project", "assigned_to"]),
+        ("admin:core_expense_add", ["submitted_by", "approved_by"]),
+        ("admin:core_income_add", ["client", "project", "invoice"]),
+        ("admin:core_invoice_add", ["client", "project"]),
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+
+    def _get(self, url, data=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, 200)
+        # Session bookkeeping varies between requests; count the page's own
+        return response, len(
+            [q for q in queries if q["sql"].startswith('SELECT "core_')]
+        )
+
+    def _autocomplete(self, model_name, field_name, term):
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "core",
+                "model_name": model_name,
+                "field_name": field_name,
+                "term": term,
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        return [result["text"] for result in response.json()["results"]]
+
+    def test_forms_do_not_render_related_tables(self):
+        projects = ProjectFactory.create_batch(5)
+        user_url = reverse("admin:core_user_change", args=[self.admin_user.pk])
+        urls = [(reverse(name), fields) for name, fields in self.forms]
+        urls.append((user_url, ["reports_to"]))
+
+        for url, fields in urls:
+            with self.subTest(url=url):
+                response = self._get(url)[0]
+                form = response.context["adminform"].form
+                for field in fields:
+                    self.assertIn("admin-autocomplete", str(form[field]), field)
+                for project in projects:
+                    self.assertNotContains(response, project.code)
+                    self.assertNotContains(response, project.client.name)
+
+    def test_user_autocomplete_matches_prefixes_only(self):
+        UserFactory(username="alice", first_name="Alice", last_name="Ng")
+        UserFactory(username="malik", first_name="Malik", last_name="Stone")
+
+        found = self._autocomplete("task", "assigned_to", "ali")
+
+        self.assertTrue(any("(alice)" in text for text in found))
+        self.assertFalse(any("(malik)" in text for text in found))
+
+    def test_searchable_autocomplete_uses_search_service(self):
+        project = ProjectFactory(name="Website redesign")
+        ProjectFactory(name="Mobile app")
+
+        found = self._autocomplete("task", "project", "webs")
+
+        self.assertEqual(found, [str(project)])
+
+    def test_list_filter_renders_only_the_selection(self):
+        task = TaskFactory()
+        others = ProjectFactory.create_batch(3)
+        url = reverse("admin:core_task_changelist")
+        params = {"project__id__exact": task.project.pk}
+
+        response, count = self._get(url, params)
+
+        self.assertContains(response, 'id="filter_project"')
+        self.assertContains(response, "admin/js/autocomplete.js")
+        self.assertContains(response, str(task.project))
+        for project in others:
+            self.assertNotContains(response, str(project))
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+        ProjectFactory.create_batch(10)
+        self.assertEqual(self._get(url, params)[1], count)
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Invoice
+from .factories import (
+    ExpenseFactory,
+    IncomeFactory,
+    ProjectFactory,
+    TaskFactory,
+    UserFactory,
+)
+
+
+def _invoice(project):
+    return Invoice.objects.create(
+        client=project.client,
+        project=project,
+        date="2025-01-01",
+        due_date="2025-01-31",
+        amount=Decimal("100.00"),
+    )
+
+
+def _rows():
+    """One project of a new client, with a task, income, invoice and expense."""
+    user = UserFactory()
+    project = ProjectFactory(manager=user)
+    TaskFactory(project=project, assigned_to=user, status="completed")
+    TaskFactory(project=project, assigned_to=user)
+    invoice = _invoice(project)
+    IncomeFactory(client=project.client, project=project, invoice=invoice)
+    ExpenseFactory()
+    return project
+
+
+class ChangelistQueryCountTest(TestCase):
+    changelists = ["client", "project", "task", "user", "income", "invoice", "expense"]
+
+    def setUp(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        # The first request stamps the session; the counts compare later ones
+        self.client.get(reverse("admin:index"))
+
+    def _query_count(self, model_name):
+        cache.clear()
+        url = reverse(f"admin:core_{model_name}_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        _rows()
+        baseline = {name: self._query_count(name) for name in self.changelists}
+
+        for _ in range(5):
+            _rows()
+
+        for name in self.changelists:
+            with self.subTest(changelist=name):
+                self.assertEqual(self._query_count(name), baseline[name])
+
+    def test_annotations_match_model_properties(self):
+        project = _rows()
+        response = self.client.get(reverse("admin:core_client_changelist"))
+        row = next(
+            obj
+            for obj in response.context["cl"].result_list
+            if obj.pk == project.client.pk
+        )
+
+        self.assertEqual(row.project_count, project.client.total_projects)
+        self.assertEqual(row.revenue_total, project.client.total_revenue)
+
+        response = self.client.get(reverse("admin:core_project_changelist"))
+        row = next(
+            obj for obj in response.context["cl"].result_list if obj.pk == project.pk
+        )
+        self.assertEqual(row.completed_task_count / row.task_count * 100, 50)
+        self.assertEqual(project.completion_percentage, 50)
+        self.assertContains(response, "50.0%")
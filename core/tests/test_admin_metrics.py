@@ -0,0 +1,142 @@
+from decimal import Decimal
+
+from django.contrib.admin.sites import site
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Client, Expense, Income, Invoice, Project, Task, User
+from core.services.metrics_cache_service import MetricsCacheService
+from .factories import (
+    ClientFactory,
+    ExpenseFactory,
+    IncomeFactory,
+    ProjectFactory,
+    TaskFactory,
+    UserFactory,
+)
+
+
+class SummaryMetricsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def _metrics(self, model):
+        return site._registry[model].get_cached_summary_metrics(
+            model._default_manager.all()
+        )
+
+    def test_each_admin_computes_metrics_in_one_query(self):
+        ProjectFactory()
+        TaskFactory()
+        for model in (Client, Project, Task, User, Income, Expense, Invoice):
+            with self.subTest(model=model.__name__), self.assertNumQueries(1):
+                self._metrics(model)
+
+    def test_client_totals_do_not_multiply_across_relations(self):
+        client = ClientFactory()
+        first = ProjectFactory(client=client)
+        ProjectFactory(client=client)
+        IncomeFactory(client=client, project=first, amount=Decimal("100.00"))
+        IncomeFactory(client=client, project=first, amount=Decimal("50.00"))
+
+        metrics = self._metrics(Client)
+
+        self.assertEqual(metrics["total_revenue"], Decimal("150.00"))
+        self.assertEqual(metrics["total_projects"], 2)
+        self.assertEqual(metrics["total_items"], Client.objects.count())
+
+    def test_user_task_metrics_and_breakdowns(self):
+        user = UserFactory(department="design")
+        TaskFactory(assigned_to=user, status="in_progress")
+        TaskFactory(assigned_to=user, status="completed")
+
+        metrics = self._metrics(User)
+
+        self.assertEqual(metrics["department_breakdown"]["design"], 1)
+        self.assertEqual(metrics["task_metrics"]["total_active_tasks"], 1)
+        self.assertGreaterEqual(metrics["task_metrics"]["users_with_tasks"], 1)
+
+    def test_finance_breakdown_by_status(self):
+        ExpenseFactory(amount=Decimal("20.00"), status="paid", category="travel")
+
+        metrics = self._metrics(Expense)
+
+        self.assertEqual(metrics["total_expenses"], Decimal("20.00"))
+        self.assertEqual(metrics["category_totals"]["travel"], Decimal("20.00"))
+        self.assertEqual(metrics["status_totals"]["paid"], Decimal("20.00"))
+
+    def test_metrics_are_cached_until_a_dependency_changes(self):
+        client = ClientFactory()
+        project = ProjectFactory(client=client)
+        self._metrics(Client)
+
+        with self.assertNumQueries(0):
+            self._metrics(Client)
+
+        IncomeFactory(client=client, project=project, amount=Decimal("10.00"))
+        with self.assertNumQueries(1):
+            metrics = self._metrics(Client)
+        self.assertEqual(metrics["total_revenue"], Decimal("10.00"))
+
+    def test_filters_get_separate_cache_entries(self):
+        ClientFactory(status="active")
+        ClientFactory(status="inactive")
+        admin = site._registry[Client]
+
+        active = admin.get_cached_summary_metrics(
+            Client.objects.filter(status="active")
+        )
+        everyone = admin.get_cached_summary_metrics(Client.objects.all())
+
+        self.assertEqual(active["total_items"], 1)
+        self.assertEqual(everyone["total_items"], 2)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "shared-metrics",
+            },
+        },
+        ADMIN_METRICS_CACHE_ALIAS="shared",
+    )
+    def test_metrics_use_the_configured_cache(self):
+        ClientFactory()
+        self._metrics(Client)
+
+        self.assertEqual(
+            caches["shared"].get(MetricsCacheService.version_key("core.client")), 1
+        )
+        self.assertIsNone(cache.get(MetricsCacheService.version_key("core.client")))
+
+
+class SummaryMetricsViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+
+    def test_changelist_renders_panel_inline(self):
+        response = self.client.get(reverse("admin:core_task_changelist"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("summary_metrics", response.context)
+        self.assertContains(response, "Total tasks")
+
+    @override_settings(ADMIN_METRICS_DEFERRED=True)
+    def test_deferred_panel_loads_from_json_endpoint(self):
+        ExpenseFactory(status="paid", amount=Decimal("5.00"))
+        ExpenseFactory(status="pending", amount=Decimal("7.00"))
+
+        response = self.client.get(
+            reverse("admin:core_expense_changelist"), {"status__exact": "paid"}
+        )
+        self.assertNotIn("summary_metrics", response.context)
+        url = response.context["summary_metrics_url"]
+        self.assertIn("status__exact=paid", url)
+
+        data = self.client.get(url).json()
+        self.assertEqual(Decimal(data["metrics"]["total_expenses"]), Decimal("5.00"))
+        self.assertIn(["Total expenses", "5.00"], data["rows"])
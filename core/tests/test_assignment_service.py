@@ -0,0 +1,146 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Task
+from core.services.assignment_service import TaskAssignmentService, _workdays_between
+from .factories import ProjectFactory, TaskFactory, UserFactory
+
+
+class TaskAssignmentServiceTest(TestCase):
+    def setUp(self):
+        self.service = TaskAssignmentService()
+        self.project = ProjectFactory()
+        # A Monday, so workday arithmetic is easy to follow
+        self.today = date(2025, 2, 3)
+        self.python_dev = UserFactory(skills="Python, Django", working_hours=40)
+        self.designer = UserFactory(skills="figma,css", working_hours=40)
+
+    def _task(self, **kwargs):
+        defaults = {
+            "project": self.project,
+            "assigned_to": None,
+            "due_date": self.today + timedelta(days=4),
+            "estimated_hours": Decimal("8"),
+        }
+        defaults.update(kwargs)
+        return TaskFactory(**defaults)
+
+    def _propose(self, tasks):
+        return self.service.propose_assignments(
+            tasks, candidates=[self.python_dev, self.designer], today=self.today
+        )
+
+    def test_parse_tags_normalizes(self):
+        self.assertEqual(
+            self.service.parse_tags(" Python,django , ,PYTHON"), ["django", "python"]
+        )
+        self.assertEqual(self.service.parse_tags(None), [])
+
+    def test_workdays_between_skips_weekends(self):
+        friday = date(2025, 2, 7)
+        self.assertEqual(_workdays_between(self.today, friday), 5)
+        self.assertEqual(_workdays_between(self.today, friday + timedelta(days=3)), 6)
+        self.assertEqual(_workdays_between(friday, self.today), 1)
+
+    def test_matches_on_skills(self):
+        backend = self._task(tags="python")
+        frontend = self._task(tags="CSS")
+
+        proposals = {p["task"].pk: p for p in self._propose([backend, frontend])}
+
+        self.assertEqual(proposals[backend.pk]["assignee"], self.python_dev)
+        self.assertEqual(proposals[backend.pk]["skill_match"], 1)
+        self.assertEqual(proposals[frontend.pk]["assignee"], self.designer)
+
+    def test_prefers_largest_skill_overlap(self):
+        generalist = UserFactory(skills="python", working_hours=40)
+        task = self._task(tags="python,django")
+
+        proposals = self.service.propose_assignments(
+            [task], candidates=[generalist, self.python_dev], today=self.today
+        )
+
+        self.assertEqual(proposals[0]["assignee"], self.python_dev)
+        self.assertEqual(proposals[0]["skill_match"], 2)
+
+    def test_unknown_skill_is_left_unassigned(self):
+        task = self._task(tags="cobol")
+
+        proposals = self._propose([task])
+
+        self.assertIsNone(proposals[0]["assignee"])
+
+    def test_respects_capacity_before_due_date(self):
+        # One workday at 40h/week gives 8 hours of capacity
+        first = self._task(tags="python", due_date=self.today, estimated_hours=6)
+        second = self._task(tags="python", due_date=self.today, estimated_hours=6)
+
+        proposals = self._propose([first, second])
+
+        self.assertEqual(proposals[0]["assignee"], self.python_dev)
+        self.assertIsNone(proposals[1]["assignee"])
+
+    def test_existing_workload_counts_against_capacity(self):
+        TaskFactory(
+            project=self.project,
+            assigned_to=self.python_dev,
+            due_date=self.today,
+            estimated_hours=Decimal("8"),
+        )
+        task = self._task(tags="python", due_date=self.today, estimated_hours=2)
+
+        proposals = self._propose([task])
+
+        self.assertIsNone(proposals[0]["assignee"])
+
+    def test_untagged_task_goes_to_least_loaded_user(self):
+        TaskFactory(
+            project=self.project,
+            assigned_to=self.python_dev,
+            due_date=self.today,
+            estimated_hours=Decimal("4"),
+        )
+        task = self._task(due_date=self.today, estimated_hours=2)
+
+        proposals = self._propose([task])
+
+        self.assertEqual(proposals[0]["assignee"], self.designer)
+
+    def test_auto_assign_persists_assignments(self):
+        task = self._task(tags="python", due_date=date.today() + timedelta(days=7))
+        self.python_dev.status = "active"
+        self.python_dev.save()
+        self.designer.status = "inactive"
+        self.designer.save()
+
+        proposals = self.service.auto_assign()
+
+        self.assertEqual(len(proposals), 1)
+        task.refresh_from_db()
+        self.assertEqual(task.assigned_to, self.python_dev)
+        self.assertFalse(Task.objects.filter(assigned_to__isnull=True).exists())
+
+    def test_admin_action_skips_closed_tasks(self):
+        self.python_dev.status = "active"
+        self.python_dev.save()
+        due = date.today() + timedelta(days=7)
+        open_task = self._task(tags="python", due_date=due)
+        done_task = self._task(tags="python", due_date=due, status="completed")
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+        self.client.post(
+            reverse("admin:core_task_changelist"),
+            {
+                "action": "auto_assign_tasks",
+                "_selected_action": [open_task.pk, done_task.pk],
+            },
+            secure=True,
+        )
+
+        open_task.refresh_from_db()
+        done_task.refresh_from_db()
+        self.assertEqual(open_task.assigned_to, self.python_dev)
+        self.assertIsNone(done_task.assigned_to)
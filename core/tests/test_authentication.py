@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import ClaimsUser, StatelessJWTAuthentication
+from core.models import User
+from core.serializers import ClaimsTokenObtainPairSerializer
+from .factories import UserFactory
+
+
+class StatelessJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        for reset in (
+            StatelessJWTAuthentication.revocations.reset,
+            StatelessJWTAuthentication.clear_cache,
+        ):
+            reset()
+            self.addCleanup(reset)
+        self.user = UserFactory(role="Manager")
+        self.refresh = ClaimsTokenObtainPairSerializer.get_token(self.user)
+        self.access = self.refresh.access_token
+
+    def _authenticate(self, token, method="get"):
+        request = getattr(APIRequestFactory(), method)(
+            "/api/projects/", HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def test_login_tokens_carry_the_user_claims(self):
+        self.user.set_password("secret")
+        self.user.save()
+
+        response = self.client.post(
+            reverse("token_obtain_pair"),
+            {"username": self.user.username, "password": "secret"},
+        )
+
+        access = AccessToken(response.json()["access"])
+        self.assertEqual(access["role"], "Manager")
+        self.assertTrue(access["is_manager"])
+
+    def test_reads_cost_no_queries(self):
+        self._authenticate(self.access)
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate(self.access)
+
+        self.assertIsInstance(user, ClaimsUser)
+        self.assertEqual((user.pk, user.role), (self.user.pk, "Manager"))
+        self.assertTrue(user.is_manager and user.is_authenticated)
+
+    def test_writes_and_older_tokens_load_the_user(self):
+        write_user, _ = self._authenticate(self.access, method="post")
+        legacy_user, _ = self._authenticate(AccessToken.for_user(self.user))
+
+        self.assertIsInstance(write_user, User)
+        self.assertIsInstance(legacy_user, User)
+
+    def test_decoded_tokens_are_reused(self):
+        with patch.object(
+            JWTAuthentication,
+            "get_validated_token",
+            wraps=JWTAuthentication().get_validated_token,
+        ) as decode:
+            self._authenticate(self.access)
+            self._authenticate(self.access)
+
+        self.assertEqual(decode.call_count, 1)
+
+    def test_revoked_tokens_are_refused(self):
+        StatelessJWTAuthentication.revocations.revoke_token(self.access)
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.access)
+
+    def test_changing_the_role_revokes_earlier_tokens(self):
+        self.access["iat"] -= 60
+        self.refresh["iat"] -= 60
+
+        self.user.role = "Employee"
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.access)
+        response = self.client.post(
+            reverse("token_refresh"), {"refresh": str(self.refresh)}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_unrelated_changes_keep_tokens_valid(self):
+        self.access["iat"] -= 60
+
+        self.user.first_name = "Renamed"
+        self.user.save()
+
+        user, _ = self._authenticate(self.access)
+        self.assertEqual(user.pk, self.user.pk)
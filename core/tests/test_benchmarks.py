@@ -0,0 +1,123 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from core.benchmarks import (
+    SCENARIOS,
+    BenchmarkRunner,
+    Scenario,
+    ScenarioResult,
+    compare,
+    over_budget,
+    percentile,
+)
+from core.models import User
+from core.seeding import SeedScale, SyntheticDataGenerator
+from .factories import UserFactory
+
+TINY = SeedScale(
+    users=3, clients=4, projects=5, tasks=30, invoices=12, incomes=20, expenses=15
+)
+
+
+class BenchmarkTest(TestCase):
+    def test_percentile_is_nearest_rank(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([5.0], 95), 5.0)
+
+    def test_compare_flags_slower_and_chattier_scenarios(self):
+        def result(p95, queries):
+            return {
+                "p50_ms": 10.0,
+                "p95_ms": p95,
+                "p99_ms": p95,
+                "queries": queries,
+                "peak_memory_kb": 100.0,
+            }
+
+        baseline = {"results": {"a": result(20.0, 4), "b": result(1.0, 3)}}
+        current = {"results": {"a": result(30.0, 5), "b": result(1.5, 3)}}
+
+        regressions = compare(baseline, current, tolerance=0.2)
+
+        self.assertEqual(
+            {(r.scenario, r.metric) for r in regressions},
+            {("a", "p95_ms"), ("a", "p99_ms"), ("a", "queries")},
+        )
+
+    def test_over_budget_flags_slow_scenarios(self):
+        def result(name, p95):
+            return ScenarioResult(name, "/", 200, 1, p95, p95, p95, p95, 1, 1.0)
+
+        scenarios = [
+            Scenario("fast", str, p95_budget_ms=50),
+            Scenario("slow", str, p95_budget_ms=50),
+            Scenario("free", str),
+        ]
+        results = [result("fast", 40.0), result("slow", 60.0), result("free", 900.0)]
+
+        self.assertEqual(
+            [(r.scenario, r.current) for r in over_budget(results, scenarios)],
+            [("slow", 60.0)],
+        )
+
+    def test_every_scenario_answers(self):
+        SyntheticDataGenerator(TINY, seed=1).run()
+        user = UserFactory(is_staff=True, is_superuser=True)
+
+        results = BenchmarkRunner(user, iterations=1, warmup=0).run()
+
+        self.assertEqual(len(results), len(SCENARIOS))
+        self.assertEqual(
+            [r.name for r in results if r.status != 200],
+            [],
+        )
+        self.assertTrue(all(r.queries > 0 for r in results))
+
+    def test_command_saves_and_compares_baseline(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "baseline.json")
+        options = ["--scenario=api.projects", "--iterations=1", f"--baseline={path}"]
+
+        call_command(
+            "run_benchmarks", *options, "--save-baseline", stdout=io.StringIO()
+        )
+        out = io.StringIO()
+        call_command("run_benchmarks", *options, stdout=out)
+
+        with open(path) as handle:
+            self.assertIn("api.projects.list", json.load(handle)["results"])
+        self.assertIn("api.projects.search", out.getvalue())
+
+    def test_command_leaves_no_benchmark_user_behind(self):
+        users = set(User.objects.values_list("pk", flat=True))
+
+        call_command(
+            "run_benchmarks",
+            "--scenario=api.projects.list",
+            "--iterations=1",
+            stdout=io.StringIO(),
+        )
+
+        self.assertEqual(set(User.objects.values_list("pk", flat=True)), users)
+        self.assertFalse(Session.objects.exists())
+
+    def test_command_runs_as_an_existing_user(self):
+        UserFactory(username="ops", is_staff=True, is_superuser=True)
+        options = ["--scenario=api.projects.list", "--iterations=1"]
+
+        call_command("run_benchmarks", *options, "--user=ops", stdout=io.StringIO())
+
+        with self.assertRaisesMessage(CommandError, "No user named 'nobody'"):
+            call_command("run_benchmarks", *options, "--user=nobody")
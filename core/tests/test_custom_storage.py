@@ -1,9 +1,19 @@
+import os
+import shutil
+import tempfile
 from datetime import UTC, datetime
 from unittest.mock import patch
 
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
 from django.test import TestCase, override_settings
 
-from core.custom_storage import AzureReceiptStorage
+from core.custom_storage import (
+    AzureReceiptStorage,
+    LocalDiskCache,
+    ReceiptStorageMixin,
+)
 
 
 @override_settings(
@@ -83,3 +93,131 @@ class AzureReceiptStorageTest(TestCase):
             # Base64 padding adds '=' to make length multiple of 4
             # 'testkey123' is 9 chars, so needs 2 padding chars
             self.assertEqual(storage.account_key, "testkey123==")
+
+    @override_settings(AZURE_CLIENT_OPTIONS={"max_block_size": 1024})
+    def test_client_options_reach_the_service_client(self):
+        with patch(
+            "storages.backends.azure_storage.BlobServiceClient"
+        ) as service_client:
+            AzureReceiptStorage().backend.service_client
+
+        self.assertEqual(service_client.call_args.kwargs["max_block_size"], 1024)
+
+
+class CachedFileSystemStorage(ReceiptStorageMixin, FileSystemStorage):
+    """Local stand-in for the blob backend."""
+
+
+class ReceiptStorageMixinTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.location = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        settings = override_settings(
+            RECEIPT_CACHE_DIR=self.cache_dir, RECEIPT_CACHE_MAX_BYTES=1024
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.storage = CachedFileSystemStorage(location=self.location)
+
+    def test_identical_content_is_stored_once(self):
+        with patch.object(
+            FileSystemStorage, "_save", wraps=self.storage._save
+        ) as save, patch.object(
+            FileSystemStorage, "exists", wraps=self.storage.exists
+        ) as exists:
+            first = self.storage.save("receipts/bill.pdf", ContentFile(b"same"))
+            second = self.storage.save("receipts/bill.pdf", ContentFile(b"same"))
+
+        self.assertEqual(first, second)
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(exists.call_count, 2)
+        self.assertRegex(first, r"^receipts/bill_[0-9a-f]{16}\.pdf$")
+
+    def test_different_content_gets_a_different_name(self):
+        first = self.storage.save("bill.pdf", ContentFile(b"one"))
+        second = self.storage.save("bill.pdf", ContentFile(b"two"))
+
+        self.assertNotEqual(first, second)
+
+    def test_hashed_name_respects_max_length(self):
+        name = self.storage.save(
+            "receipts/a_very_long_receipt_file_name.pdf",
+            ContentFile(b"x"),
+            max_length=40,
+        )
+        self.assertLessEqual(len(name), 40)
+        self.assertTrue(name.endswith(".pdf"))
+
+    def test_reads_are_served_from_the_disk_cache(self):
+        name = self.storage.save("bill.pdf", ContentFile(b"cached"))
+        os.remove(self.storage.path(name))
+
+        with self.storage.open(name) as receipt:
+            self.assertEqual(receipt.read(), b"cached")
+
+    def test_cache_miss_fetches_once(self):
+        name = self.storage.save("bill.pdf", ContentFile(b"fetch me"))
+        self.storage.disk_cache.discard(name)
+
+        with patch.object(
+            CachedFileSystemStorage, "_fetch", wraps=self.storage._fetch
+        ) as fetch:
+            for _ in range(2):
+                with self.storage.open(name) as receipt:
+                    self.assertEqual(receipt.read(), b"fetch me")
+
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        disk_cache = LocalDiskCache(self.cache_dir, max_bytes=10)
+        disk_cache.put("a", ContentFile(b"aaaa"))
+        disk_cache.put("b", ContentFile(b"bbbb"))
+        os.utime(disk_cache.path("a"), (0, 0))
+        os.utime(disk_cache.path("b"), (1, 1))
+        self.assertIsNotNone(disk_cache.get("a"))  # refreshes "a"
+
+        disk_cache.put("c", ContentFile(b"cccc"))
+
+        self.assertIsNotNone(disk_cache.get("a"))
+        self.assertIsNone(disk_cache.get("b"))
+        self.assertIsNotNone(disk_cache.get("c"))
+
+    def test_fills_within_the_bound_do_not_walk_the_cache(self):
+        disk_cache = LocalDiskCache(self.cache_dir, max_bytes=100)
+
+        with patch("core.custom_storage.os.walk", wraps=os.walk) as walk:
+            for name in "abcdefgh":
+                disk_cache.put(name, ContentFile(b"0123456789"))
+            self.assertEqual(walk.call_count, 1)
+
+            disk_cache.put("i", ContentFile(b"0123456789" * 3))
+            self.assertEqual(walk.call_count, 2)
+
+        cached = [name for name in "abcdefghi" if os.path.exists(disk_cache.path(name))]
+        self.assertIn("i", cached)
+        self.assertLessEqual(len(cached), 8)
+
+    def test_urls_are_cached_until_near_expiry(self):
+        with patch.object(FileSystemStorage, "url", return_value="/r/1") as url:
+            self.storage.url("bill.pdf")
+            self.storage.url("bill.pdf")
+        self.assertEqual(url.call_count, 1)
+
+        self.storage.expiration_secs = self.storage.url_refresh_margin
+        cache.clear()
+        with patch.object(FileSystemStorage, "url", return_value="/r/1") as url:
+            self.storage.url("bill.pdf")
+            self.storage.url("bill.pdf")
+        self.assertEqual(url.call_count, 2)
+
+    def test_delete_drops_cached_copies(self):
+        name = self.storage.save("bill.pdf", ContentFile(b"gone"))
+        self.storage.url(name)
+
+        self.storage.delete(name)
+
+        self.assertIsNone(self.storage.disk_cache.get(name))
+        self.assertIsNone(cache.get(self.storage.url_cache_key(name)))
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from django.db import DatabaseError, connections
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core.db_routers import ReplicaRouter, analytics_reads, in_analytics
+from core.models import Expense, Income
+from core.services.client_service import ClientService
+from .factories import ClientFactory, ExpenseFactory, IncomeFactory, UserFactory
+
+
+@override_settings(
+    DATABASE_REPLICA_ALIAS="replica",
+    DATABASE_REPLICA_MAX_LAG=10,
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL=60,
+)
+class ReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        ReplicaRouter.monitor.reset()
+        self.addCleanup(ReplicaRouter.monitor.reset)
+        self.router = ReplicaRouter()
+
+    def _route(self, lag=0.0):
+        with patch.object(ReplicaRouter.monitor, "lag", return_value=lag):
+            return self.router.db_for_read(Income)
+
+    def test_only_marked_reads_go_to_the_replica(self):
+        self.assertIsNone(self._route())
+        with analytics_reads():
+            self.assertEqual(self._route(), "replica")
+            self.assertEqual(Income.objects.all().db, "replica")
+        self.assertEqual(Income.objects.all().db, "default")
+
+    def test_writes_stay_on_the_primary(self):
+        with analytics_reads():
+            self.assertEqual(self.router.db_for_write(Income), "default")
+        self.assertFalse(self.router.allow_migrate("replica", "core"))
+
+    def test_lagging_replica_falls_back_until_rechecked(self):
+        with analytics_reads():
+            self.assertEqual(self._route(lag=30), "default")
+            # Still the cached answer within the check interval
+            self.assertEqual(self._route(lag=0), "default")
+            with override_settings(DATABASE_REPLICA_LAG_CHECK_INTERVAL=0):
+                self.assertEqual(self._route(lag=0), "replica")
+
+    def test_unreachable_replica_falls_back(self):
+        with analytics_reads(), patch.object(
+            ReplicaRouter.monitor, "lag", side_effect=DatabaseError("down")
+        ), self.assertLogs("core.db_routers", "WARNING"):
+            self.assertEqual(self.router.db_for_read(Income), "default")
+
+    def test_reads_inside_a_primary_transaction_stay_there(self):
+        connection = connections["default"]
+        with analytics_reads(), patch.object(connection, "in_atomic_block", True):
+            self.assertEqual(self._route(), "default")
+
+    @override_settings(DATABASE_REPLICA_ALIAS="")
+    def test_without_a_replica_routing_is_untouched(self):
+        with analytics_reads():
+            self.assertIsNone(self._route())
+            self.assertIsNone(self.router.db_for_write(Income))
+
+
+class AnalyticsMarkerTest(TestCase):
+    def _reads(self, call):
+        """``(model, marked)`` for every read routed while ``call`` runs."""
+        reads = []
+
+        def record(router, model, **hints):
+            reads.append((model, in_analytics()))
+
+        with patch.object(ReplicaRouter, "db_for_read", autospec=True) as route:
+            route.side_effect = record
+            call()
+        return reads
+
+    def test_financial_summary_is_marked(self):
+        client = ClientFactory()
+        IncomeFactory(client=client)
+
+        reads = self._reads(lambda: ClientService().get_financial_summary(client))
+
+        self.assertTrue(reads)
+        self.assertTrue(all(marked for _, marked in reads))
+        self.assertFalse(in_analytics())
+
+    def test_admin_export_is_marked(self):
+        ExpenseFactory()
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+        reads = self._reads(
+            lambda: self.client.get(reverse("admin:core_expense-export-csv"))
+        )
+
+        expense_reads = [marked for model, marked in reads if model is Expense]
+        self.assertTrue(expense_reads)
+        self.assertTrue(all(expense_reads))
@@ -0,0 +1,168 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import SearchEntry
+from core.services.global_search_service import GlobalSearchService
+from core.views import GlobalSearchView
+from .factories import ClientFactory, IncomeFactory, ProjectFactory, UserFactory
+
+
+class GlobalSearchServiceTest(TestCase):
+    def setUp(self):
+        self.service = GlobalSearchService()
+
+    def test_saving_indexes_entry_with_related_names(self):
+        client = ClientFactory(name="Acme Corp")
+        project = ProjectFactory(name="Portal", code="P-1", client=client)
+
+        entry = SearchEntry.objects.get(entity_type="project", object_id=project.pk)
+
+        self.assertEqual(entry.title, "P-1 Portal")
+        self.assertEqual(entry.subtitle, "Acme Corp")
+        self.assertIn("Acme Corp", entry.keywords)
+
+    def test_renaming_a_related_object_refreshes_dependent_entries(self):
+        client = ClientFactory(name="Acme Corp")
+        project = ProjectFactory(client=client)
+        IncomeFactory(client=client, project=project)
+
+        client.name = "Globex"
+        client.save()
+
+        self.assertEqual(
+            set(
+                SearchEntry.objects.filter(
+                    entity_type__in=["project", "income"]
+                ).values_list("subtitle", flat=True)
+            ),
+            {"Globex"},
+        )
+        self.assertEqual(
+            [hit["id"] for hit in self.service.search("globex")["project"]],
+            [project.pk],
+        )
+
+    def test_unrelated_changes_leave_dependents_alone(self):
+        client = ClientFactory(name="Acme Corp")
+        ProjectFactory(client=client)
+
+        client.notes = "Prefers email"
+        with patch.object(GlobalSearchService, "_index_queryset") as reindex:
+            client.save()
+
+        reindex.assert_not_called()
+
+    def test_deleting_removes_entry(self):
+        project = ProjectFactory()
+        IncomeFactory(client=project.client, project=project)
+        self.assertTrue(SearchEntry.objects.filter(entity_type="income").exists())
+
+        project.client.delete()
+
+        self.assertFalse(SearchEntry.objects.exists())
+
+    def test_search_groups_by_type_with_per_type_limit(self):
+        client = ClientFactory(name="Acme")
+        for number in range(3):
+            ProjectFactory(name=f"Acme project {number}", client=client)
+
+        results = self.service.search("acm", limit=2)
+
+        self.assertEqual([hit["id"] for hit in results["client"]], [client.pk])
+        self.assertEqual(len(results["project"]), 2)
+
+    def test_search_returns_the_best_ranked_matches(self):
+        client = ClientFactory(name="Globex")
+        for number in range(30):
+            ProjectFactory(
+                name=f"Site {number}", description="Acme mention", client=client
+            )
+        best = ProjectFactory(name="Acme portal", client=client)
+
+        results = self.service.search("acm", entity_types=["project"], limit=1)
+
+        self.assertEqual([hit["id"] for hit in results["project"]], [best.pk])
+
+    def test_common_prefixes_rank_the_newest_entries(self):
+        client = ClientFactory(name="Globex")
+        oldest = ProjectFactory(name="Acme portal", client=client)
+        for number in range(3):
+            ProjectFactory(name=f"Site {number}", description="Acme", client=client)
+        self.service.recent_windows = (3,)
+
+        with self.assertNumQueries(1):
+            results = self.service.search("a", entity_types=["project"], limit=2)
+
+        self.assertEqual(len(results["project"]), 2)
+        self.assertNotIn(oldest.pk, [hit["id"] for hit in results["project"]])
+
+    def test_rare_terms_rank_every_match(self):
+        client = ClientFactory(name="Globex")
+        oldest = ProjectFactory(name="Acme portal", client=client)
+        for number in range(3):
+            ProjectFactory(name=f"Site {number}", client=client)
+        self.service.recent_windows = (2, 3)
+
+        with self.assertNumQueries(2):
+            results = self.service.search("acm", entity_types=["project"])
+
+        self.assertEqual([hit["id"] for hit in results["project"]], [oldest.pk])
+
+    def test_partly_matching_windows_widen(self):
+        client = ClientFactory(name="Globex")
+        ProjectFactory(name="Acme portal", client=client)
+        ProjectFactory(name="Site 0", client=client)
+        ProjectFactory(name="Acme site", client=client)
+        self.service.recent_windows = (2, 3)
+
+        with self.assertNumQueries(2):
+            results = self.service.search("acm", entity_types=["project"], limit=2)
+
+        self.assertEqual(len(results["project"]), 2)
+
+    def test_search_filters_types(self):
+        ProjectFactory(name="Acme site", client=ClientFactory(name="Acme"))
+
+        results = self.service.search("acme", entity_types=["client"])
+
+        self.assertEqual(list(results), ["client"])
+
+    def test_rebuild_restores_missing_and_drops_stale_entries(self):
+        client = ClientFactory(name="Acme")
+        SearchEntry.objects.all().delete()
+        SearchEntry.objects.create(entity_type="client", object_id=999, title="Gone")
+
+        counts = self.service.rebuild(["client"])
+
+        self.assertEqual(counts, {"client": 1})
+        self.assertEqual(
+            list(SearchEntry.objects.values_list("object_id", flat=True)), [client.pk]
+        )
+
+
+class GlobalSearchViewTest(TestCase):
+    def _get(self, params):
+        request = APIRequestFactory().get("/api/search/", params)
+        force_authenticate(request, user=UserFactory())
+        return GlobalSearchView.as_view()(request)
+
+    def test_returns_grouped_hits(self):
+        client = ClientFactory(name="Acme")
+
+        response = self._get({"q": "acm", "types": "client,project"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+        hit = response.data["results"]["client"][0]
+        self.assertEqual(hit["id"], client.pk)
+        self.assertEqual(
+            hit["admin_url"], f"/titans-admin/core/client/{client.pk}/change/"
+        )
+
+    def test_rejects_unknown_type(self):
+        response = self._get({"q": "acme", "types": "client,widget"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("types", response.data)
@@ -0,0 +1,95 @@
+import threading
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.services.health_service import HealthService
+
+
+def _failing():
+    raise ConnectionError("connection refused")
+
+
+@override_settings(
+    HEALTH_CHECK_INTERVAL=0, HEALTH_PROBE_TIMEOUT=0.5, HEALTH_CHECK_STORAGE=True
+)
+class HealthCheckTest(TestCase):
+    def setUp(self):
+        for attribute in ("_executor", "_snapshot", "_refresher"):
+            patcher = patch.object(HealthService, attribute, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(HealthService, "_in_flight", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(HealthService, "probe_storage", lambda self: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_liveness_does_no_io(self):
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("health-live"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_readiness_reports_each_probe(self):
+        response = self.client.get(reverse("health-ready"))
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["status"], "ok")
+        self.assertEqual(body["database"], {"default": "healthy"})
+        self.assertTrue(body["cache"])
+        self.assertEqual(set(body["checks"]), {"database:default", "cache", "storage"})
+        self.assertIn("latency_ms", body["checks"]["cache"])
+
+    def test_unreachable_database_makes_instance_unready(self):
+        with patch.object(
+            HealthService, "_database_probe", lambda self, alias: _failing
+        ):
+            response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, 503)
+        body = response.json()
+        self.assertEqual(body["status"], "unavailable")
+        self.assertIn("connection refused", body["checks"]["database:default"]["error"])
+
+    def test_slow_storage_only_degrades(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        with patch.object(HealthService, "probe_storage", lambda self: release.wait(5)):
+            first = self.client.get(reverse("health-ready")).json()
+            # The hung probe is not started a second time
+            second = self.client.get(reverse("health-ready")).json()
+
+        self.assertEqual(first["status"], "degraded")
+        self.assertEqual(first["checks"]["storage"]["error"], "timed out")
+        self.assertEqual(second["checks"]["storage"]["error"], "timed out")
+        self.assertEqual(HealthService._executor._work_queue.qsize(), 0)
+
+    @override_settings(HEALTH_CHECK_INTERVAL=5)
+    def test_readiness_serves_the_background_snapshot(self):
+        HealthService._refresher = Mock(is_alive=Mock(return_value=True))
+        HealthService._snapshot = {
+            "status": "ok",
+            "checks": {"cache": {"healthy": True}},
+            "checked_at": timezone.now(),
+        }
+
+        with patch.object(HealthService, "run") as run:
+            result = HealthService().readiness()
+
+        run.assert_not_called()
+        self.assertIs(result, HealthService._snapshot)
+
+    async def test_probes_answer_through_asgi(self):
+        live = await self.async_client.get(reverse("health-live"))
+        ready = await self.async_client.get(reverse("health-ready"))
+
+        self.assertEqual(live.json(), {"status": "ok"})
+        self.assertEqual(ready.status_code, 200)
+        self.assertEqual(ready.json()["database"], {"default": "healthy"})
@@ -0,0 +1,238 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest.mock import Mock, patch
+
+from asgiref.sync import iscoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from core.metrics import (
+    CONTENT_TYPE,
+    REGISTRY,
+    collect,
+    exposition,
+    mark_process_dead,
+)
+from core.middleware import RequestMetricsMiddleware
+from core.services.project_service import ProjectService
+from .factories import ProjectFactory, TaskFactory, UserFactory
+
+# What a gunicorn worker does with its metrics, in a process of its own
+WORKER_SCRIPT = """
+from prometheus_client import Counter, Gauge
+lookups = Counter("cache_requests", "", ["cache", "result"])
+lookups.labels("receipts", "hit").inc(3)
+lookups.labels("receipts", "miss").inc()
+Gauge("background_queue_depth", "", ["queue"], multiprocess_mode="livesum").labels(
+    "receipt-processing"
+).set(7)
+print(__import__("os").getpid())
+"""
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class MultiProcessTest(TestCase):
+    def test_workers_are_merged_through_files(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        worker = subprocess.run(
+            [sys.executable, "-c", WORKER_SCRIPT],
+            env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": directory},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        with override_settings(METRICS_DIR=directory):
+            merged = collect()
+            # Gauges of exited workers are dropped, counters are kept
+            mark_process_dead(int(worker.stdout))
+            after = collect()
+
+        def value(families, name, sample, **labels):
+            return next(
+                s.value
+                for s in families[name].samples
+                if s.name == sample and s.labels == labels
+            )
+
+        self.assertEqual(
+            value(
+                merged,
+                "cache_requests",
+                "cache_requests_total",
+                cache="receipts",
+                result="hit",
+            ),
+            3,
+        )
+        self.assertEqual(
+            value(merged, "cache_hit_ratio", "cache_hit_ratio", cache="receipts"),
+            0.75,
+        )
+        self.assertEqual(
+            value(
+                merged,
+                "background_queue_depth",
+                "background_queue_depth",
+                queue="receipt-processing",
+            ),
+            7,
+        )
+        self.assertFalse(
+            [
+                s
+                for s in after["background_queue_depth"].samples
+                if s.labels.get("queue") == "receipt-processing"
+            ]
+        )
+        self.assertIn("cache_requests", after)
+
+
+class InstrumentationTest(TestCase):
+    def test_requests_are_timed_per_route(self):
+        self.client.get(reverse("health-live"))
+
+        self.assertGreater(
+            _sample(
+                "http_request_duration_seconds_count",
+                route="health-live",
+                method="GET",
+                status="200",
+            ),
+            0,
+        )
+
+    async def test_async_requests_are_timed(self):
+        async def view(request):
+            request.resolver_match = Mock(view_name="async-view")
+            return HttpResponse(status=204)
+
+        middleware = RequestMetricsMiddleware(view)
+        response = await middleware(RequestFactory().get("/"))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assertEqual(response.status_code, 204)
+        self.assertGreater(
+            _sample(
+                "http_request_duration_seconds_count",
+                route="async-view",
+                method="GET",
+                status="204",
+            ),
+            0,
+        )
+
+    def test_service_methods_record_query_counts(self):
+        project = ProjectFactory()
+        TaskFactory(project=project)
+        labels = {"service": "ProjectService", "method": "get_project_metrics"}
+        calls = _sample("service_call_queries_count", **labels)
+        queries = _sample("service_call_queries_sum", **labels)
+
+        ProjectService().get_project_metrics(project)
+
+        self.assertEqual(_sample("service_call_queries_count", **labels), calls + 1)
+        self.assertGreater(_sample("service_call_queries_sum", **labels), queries)
+
+    def test_exposition_is_openmetrics(self):
+        text = exposition().decode()
+
+        self.assertIn("# TYPE http_request_duration_seconds histogram", text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+
+class MetricsEndpointTest(TestCase):
+    @override_settings(METRICS_TOKEN="s3cret")
+    def test_token_is_required_when_configured(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 401)
+
+        response = self.client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], CONTENT_TYPE)
+
+    def test_without_a_token_only_internal_networks_may_scrape(self):
+        self.assertEqual(
+            self.client.get("/metrics", REMOTE_ADDR="10.1.2.3").status_code, 200
+        )
+        self.assertEqual(
+            self.client.get("/metrics", REMOTE_ADDR="203.0.113.7").status_code, 403
+        )
+        # Behind a proxy the peer address says nothing about the client
+        self.assertEqual(
+            self.client.get(
+                "/metrics",
+                REMOTE_ADDR="10.1.2.3",
+                HTTP_X_FORWARDED_FOR="203.0.113.7",
+            ).status_code,
+            403,
+        )
+
+    def test_cache_hit_ratio_is_reported(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        for _ in range(2):
+            self.client.get(reverse("admin:core_expense_changelist"))
+
+        response = self.client.get("/metrics")
+
+        self.assertIn(b'cache_hit_ratio{cache="admin-metrics"}', response.content)
+
+
+class DatabaseMetricsTest(TestCase):
+    def test_new_connections_are_counted(self):
+        before = _sample("database_connections_opened_total", alias="default")
+
+        connection_created.send(sender=None, connection=connections["default"])
+
+        self.assertEqual(
+            _sample("database_connections_opened_total", alias="default"), before + 1
+        )
+
+    def test_pool_checkouts_are_not_counted_as_new_connections(self):
+        connection = Mock(alias="default", pool=Mock())
+        before = _sample("database_connections_opened_total", alias="default")
+
+        connection_created.send(sender=None, connection=connection)
+
+        self.assertEqual(
+            _sample("database_connections_opened_total", alias="default"), before
+        )
+
+    def test_pool_statistics_are_sampled(self):
+        pool = Mock()
+        pool.pop_stats.return_value = {
+            "pool_size": 4,
+            "pool_available": 1,
+            "requests_waiting": 2,
+            "requests_num": 10,
+            "requests_queued": 3,
+            "requests_wait_ms": 1500,
+        }
+        wrapper = type(connections["default"])
+        before = _sample("database_pool_checkouts_total", alias="default")
+
+        with patch.object(wrapper, "_connection_pools", {"default": pool}, create=True):
+            collect()
+
+        self.assertEqual(
+            _sample("database_pool_checkouts_total", alias="default"), before + 10
+        )
+        self.assertEqual(
+            _sample("database_pool_connections", alias="default", state="in_use"), 3
+        )
+        self.assertEqual(
+            _sample("database_pool_connections", alias="default", state="waiting"), 2
+        )
+        self.assertGreaterEqual(
+            _sample("database_pool_wait_seconds_total", alias="default"), 1.5
+        )
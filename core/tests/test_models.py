@@ -32,11 +32,9 @@ class ProjectModelTest(TestCase):
         TaskFactory.create_batch(
             2,
             project=self.project,
-            status="Completed",  # Changed to match model's choice
-        )
-        TaskFactory.create_batch(
-            2, project=self.project, status="Pending"  # Changed to match model's choice
+            status="completed",
         )
+        TaskFactory.create_batch(2, project=self.project, status="pending")
 
         self.assertEqual(self.project.completion_percentage, 50)
 
@@ -180,18 +178,18 @@ class UserModelTest(TestCase):
         # Create completed tasks with different hours
         TaskFactory(
             assigned_to=user,
-            status="Completed",
+            status="completed",
             actual_hours=Decimal("4.5"),
             completed_at=now,
         )
         TaskFactory(
             assigned_to=user,
-            status="Completed",
+            status="completed",
             actual_hours=Decimal("3.5"),
             completed_at=now,
         )
         # Create a pending task (shouldn't be counted)
-        TaskFactory(assigned_to=user, status="Pending", actual_hours=Decimal("2.0"))
+        TaskFactory(assigned_to=user, status="pending", actual_hours=Decimal("2.0"))
 
         total_hours = user.get_total_hours_worked(
             start_date=start_datetime, end_date=end_datetime
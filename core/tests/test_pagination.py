@@ -0,0 +1,90 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import Expense
+from core.pagination import EstimatedCountPaginator, estimate_count
+from core.views import ExpenseViewSet
+from .factories import ExpenseFactory, UserFactory
+
+
+def _count_queries(queries):
+    return [q["sql"] for q in queries if "COUNT(*)" in q["sql"]]
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    def setUp(self):
+        ExpenseFactory.create_batch(3, amount=Decimal("1.00"))
+
+    def test_no_estimate_outside_postgres(self):
+        self.assertIsNone(estimate_count(Expense.objects.all()))
+        self.assertIsNone(estimate_count([1, 2, 3]))
+
+    def test_exact_count_without_estimate(self):
+        paginator = EstimatedCountPaginator(Expense.objects.all(), 2)
+
+        self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.is_estimated)
+        self.assertEqual(paginator.num_pages, 2)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_large_estimate_replaces_count(self):
+        with patch("core.pagination.estimate_count", return_value=5000):
+            paginator = EstimatedCountPaginator(Expense.objects.all(), 100)
+            with CaptureQueriesContext(connection) as queries:
+                count = paginator.count
+
+        self.assertEqual(count, 5000)
+        self.assertTrue(paginator.is_estimated)
+        self.assertEqual(len(queries), 0)
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=1000)
+    def test_small_estimate_falls_back_to_exact_count(self):
+        with patch("core.pagination.estimate_count", return_value=10):
+            paginator = EstimatedCountPaginator(Expense.objects.all(), 100)
+            self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.is_estimated)
+
+
+class EstimatedCountWiringTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        ExpenseFactory.create_batch(2)
+
+    def test_finance_changelist_counts_once(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:core_expense_changelist"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(_count_queries(queries)), 1)
+        self.assertIsNone(response.context["cl"].full_result_count)
+
+    def test_api_lists_stay_plain_without_page_params(self):
+        request = APIRequestFactory().get("/api/expenses/")
+        force_authenticate(request, user=UserFactory())
+
+        response = ExpenseViewSet.as_view({"get": "list"})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 2)
+
+    def test_api_reports_estimated_count(self):
+        request = APIRequestFactory().get("/api/expenses/", {"page": 1})
+        force_authenticate(request, user=UserFactory())
+
+        with patch("core.pagination.estimate_count", return_value=10**6):
+            response = ExpenseViewSet.as_view({"get": "list"})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 10**6)
+        self.assertTrue(response.data["count_is_estimate"])
+        self.assertEqual(len(response.data["results"]), 2)
@@ -0,0 +1,92 @@
+import json
+import os
+import shutil
+import signal
+import tempfile
+import time
+
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core import profiling
+from core.middleware import SamplingProfilerMiddleware
+from core.profiling import ProfileSession, ProfileWriter
+from .factories import UserFactory
+
+
+def slow_view(request):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    return HttpResponse("ok")
+
+
+def fast_view(request):
+    return HttpResponse("ok")
+
+
+class SamplingProfilerTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        previous = signal.getsignal(signal.SIGALRM)
+        self.addCleanup(signal.signal, signal.SIGALRM, previous)
+        self.addCleanup(setattr, profiling, "_sampler", None)
+        profiling._sampler = None
+        settings = override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SLOW_MS=20,
+            PROFILING_INTERVAL_MS=1,
+            PROFILING_DIR=self.directory,
+            PROFILING_MAX_PROFILES=2,
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def _request(self, view, user=None, **headers):
+        request = RequestFactory().get("/report/", **headers)
+        if user is not None:
+            request.user = user
+        return SamplingProfilerMiddleware(view)(request)
+
+    def _profiles(self):
+        return sorted(os.listdir(self.directory))
+
+    def test_slow_request_writes_stacks_and_sql(self):
+        self._request(slow_view)
+
+        folded, timeline = self._profiles()
+        self.assertTrue(folded.endswith(".folded"))
+        with open(os.path.join(self.directory, folded)) as handle:
+            self.assertIn("slow_view", handle.read())
+        with open(os.path.join(self.directory, timeline)) as handle:
+            data = json.load(handle)
+        self.assertEqual(data["request"], "GET /report/")
+        self.assertEqual(data["queries"][0]["sql"], "SELECT 1")
+        self.assertGreater(data["samples"], 0)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+
+    def test_fast_request_leaves_nothing(self):
+        self._request(fast_view)
+
+        self.assertEqual(self._profiles(), [])
+
+    @override_settings(PROFILING_SLOW_MS=0)
+    def test_profile_header_is_honoured_for_staff_only(self):
+        self._request(fast_view, user=UserFactory(), HTTP_X_PROFILE="1")
+        self.assertEqual(self._profiles(), [])
+
+        self._request(fast_view, user=UserFactory(is_staff=True), HTTP_X_PROFILE="1")
+        self.assertEqual(len(self._profiles()), 2)
+
+    def test_directory_is_bounded(self):
+        writer = ProfileWriter(self.directory, max_profiles=2)
+        for index in range(4):
+            writer.write(ProfileSession(0), f"GET /page-{index}/", 1500)
+
+        stems = {name.split(".", 1)[0] for name in self._profiles()}
+        self.assertEqual(len(stems), 2)
+        self.assertTrue(all("page-2" in s or "page-3" in s for s in stems))
@@ -0,0 +1,64 @@
+from django.db import connection
+from django.test import TestCase
+
+from core.models import Income
+from core.query_audit import (
+    QueryShape,
+    QueryShapeRecorder,
+    covering_index,
+    critical_queries,
+    parse_shape,
+    suggest_index,
+)
+from core.services.finance.income_service import IncomeService
+from .factories import IncomeFactory
+
+
+class QueryShapeTest(TestCase):
+    def test_parse_shape_extracts_filters_and_ordering(self):
+        queryset = IncomeService().get_pending_payments()
+
+        shape = parse_shape(str(queryset.query))
+
+        self.assertEqual(shape.table, "core_income")
+        self.assertEqual(shape.filters, (("status", "="),))
+        self.assertEqual(shape.ordering, (("expected_date", "ASC"),))
+
+    def test_parse_shape_ignores_writes(self):
+        self.assertIsNone(parse_shape('UPDATE "core_income" SET "status" = %s'))
+
+    def test_suggestion_puts_equality_before_range(self):
+        shape = QueryShape("core_invoice", (("due_date", "<"), ("status", "=")), ())
+        self.assertEqual(suggest_index(shape), ["status", "due_date"])
+
+    def test_partial_index_condition_counts_as_covered(self):
+        shape = QueryShape(
+            "core_income", (("status", "="),), (("expected_date", "ASC"),)
+        )
+        self.assertEqual(covering_index(shape), "income_pending_expected_idx")
+
+        unindexed = QueryShape("core_income", (("payment_reference", "="),), ())
+        self.assertIsNone(covering_index(unindexed))
+
+    def test_recorder_counts_queries_and_round_trips(self):
+        IncomeFactory(status="pending")
+        recorder = QueryShapeRecorder()
+
+        with recorder.capture():
+            list(Income.objects.filter(status="pending").order_by("expected_date"))
+            list(Income.objects.filter(status="received").order_by("expected_date"))
+
+        rows = recorder.rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["count"], 2)
+
+        restored = QueryShapeRecorder()
+        restored.merge(rows)
+        self.assertEqual(restored.rows()[0]["count"], 2)
+
+
+class QueryPlanRegressionTest(TestCase):
+    def test_hot_queries_use_their_indexes(self):
+        for name, queryset, expected_index in critical_queries(connection.alias):
+            with self.subTest(name):
+                self.assertIn(expected_index, queryset.explain())
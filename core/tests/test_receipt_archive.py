@@ -0,0 +1,146 @@
+import csv
+import io
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import date
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import Expense, ReceiptBlob
+from core.services.finance.receipt_archive_service import ReceiptArchiveService
+from core.services.finance.receipt_processing_service import (
+    ReceiptProcessingService,
+)
+from core.views.finance.expense_views import ExpenseViewSet
+from .factories import ExpenseFactory, UserFactory
+from .test_receipt_service import LocalReceiptStorage
+
+
+def _unzip(chunks):
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+class _SlowStorage:
+    """Opens in-memory files; ``slow`` blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.opened = []
+
+    def open(self, name, mode="rb"):
+        if name == "slow":
+            self.release.wait(5)
+        source = io.BytesIO(name.encode())
+        self.opened.append(source)
+        return source
+
+
+def _manifest(archive):
+    with archive.open("manifest.csv") as manifest:
+        return list(csv.DictReader(io.TextIOWrapper(manifest, "utf-8")))
+
+
+@override_settings(RECEIPT_CACHE_MAX_BYTES=0, RECEIPT_ARCHIVE_WORKERS=2)
+class ReceiptArchiveTest(TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.storage = LocalReceiptStorage(location=self.location)
+        for field in (
+            Expense._meta.get_field("receipt"),
+            ReceiptBlob._meta.get_field("file"),
+        ):
+            patcher = patch.object(field, "storage", self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(ReceiptProcessingService, "schedule")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        def upload(content, name="bill.pdf"):
+            return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+        self.january = ExpenseFactory(date=date(2025, 1, 10), receipt=upload(b"a"))
+        self.shared = ExpenseFactory(date=date(2025, 1, 20), receipt=upload(b"a"))
+        self.february = ExpenseFactory(
+            date=date(2025, 2, 5), receipt=upload(b"b" * 200000, "scan.pdf")
+        )
+        ExpenseFactory(date=date(2025, 1, 15), receipt=None)
+
+    def test_archive_holds_each_file_once_with_a_manifest(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+        response = self.client.post(
+            reverse("admin:core_expense_changelist"),
+            {
+                "action": "download_receipts",
+                "_selected_action": [
+                    self.january.pk,
+                    self.shared.pk,
+                    self.february.pk,
+                ],
+            },
+        )
+
+        self.assertEqual(response["Content-Type"], "application/zip")
+        archive = _unzip(response.streaming_content)
+        files = sorted(name for name in archive.namelist() if name != "manifest.csv")
+        self.assertEqual(
+            files, sorted({self.january.receipt.name, self.february.receipt.name})
+        )
+        self.assertEqual(archive.read(self.february.receipt.name), b"b" * 200000)
+
+        rows = _manifest(archive)
+        self.assertEqual(
+            [int(row["expense_id"]) for row in rows],
+            [self.january.pk, self.shared.pk, self.february.pk],
+        )
+        self.assertEqual(rows[0]["file"], rows[1]["file"])
+        self.assertTrue(all(row["included"] == "True" for row in rows))
+
+    def test_missing_files_are_flagged_in_the_manifest(self):
+        self.storage.delete(self.february.receipt.name)
+
+        archive = _unzip(ReceiptArchiveService().stream(Expense.objects.all()))
+
+        rows = {int(row["expense_id"]): row for row in _manifest(archive)}
+        self.assertEqual(rows[self.february.pk]["included"], "False")
+        self.assertNotIn(self.february.receipt.name, archive.namelist())
+
+    def test_stopping_early_closes_files_without_waiting(self):
+        storage = _SlowStorage()
+        names = ["slow", "a", "b", "c", "d", "e"]
+        fetched = ReceiptArchiveService()._fetched((storage, n) for n in names)
+
+        _, first = next(fetched)
+        first.close()
+        started = time.monotonic()
+        fetched.close()
+
+        self.assertLess(time.monotonic() - started, 1)
+        storage.release.set()
+        deadline = time.monotonic() + 5
+        while not all(f.closed for f in storage.opened) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(all(f.closed for f in storage.opened))
+        self.assertLess(len(storage.opened), len(names))
+
+    def test_api_streams_filtered_expenses(self):
+        request = APIRequestFactory().get(
+            "/api/expenses/receipts-archive/",
+            {"date_after": "2025-02-01"},
+        )
+        force_authenticate(request, user=UserFactory())
+
+        response = ExpenseViewSet.as_view({"get": "receipts_archive"})(request)
+
+        self.assertEqual(response.status_code, 200)
+        rows = _manifest(_unzip(response.streaming_content))
+        self.assertEqual([int(row["expense_id"]) for row in rows], [self.february.pk])
@@ -0,0 +1,144 @@
+import io
+import shutil
+import tempfile
+import threading
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+from reportlab.pdfgen import canvas
+
+from core.models import Expense, ReceiptBlob
+from core.services.finance import receipt_processing_service
+from core.services.finance.receipt_processing_service import (
+    ReceiptProcessingService,
+    detect_amount,
+)
+from .factories import ExpenseFactory
+from .test_receipt_service import LocalReceiptStorage
+
+
+def _png(size=(1200, 1600)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "white").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class DetectAmountTest(TestCase):
+    def test_prefers_the_total_line(self):
+        text = "Coffee 4.50\nSubtotal 12.00\nTax 1.56\nTOTAL $13.56\nCash 20.00"
+        self.assertEqual(detect_amount(text), Decimal("13.56"))
+
+    def test_falls_back_to_the_largest_amount(self):
+        self.assertEqual(detect_amount("Item 1,204.10\nItem 3.99"), Decimal("1204.10"))
+
+    def test_no_amount(self):
+        self.assertIsNone(detect_amount("Thank you for shopping"))
+
+
+@override_settings(RECEIPT_CACHE_MAX_BYTES=0, RECEIPT_PROCESSING_WORKERS=0)
+class ReceiptProcessingTest(TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.storage = LocalReceiptStorage(location=self.location)
+        for field in (
+            Expense._meta.get_field("receipt"),
+            ReceiptBlob._meta.get_field("file"),
+            ReceiptBlob._meta.get_field("thumbnail"),
+        ):
+            patcher = patch.object(field, "storage", self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _expense(self, content, name, content_type):
+        with self.captureOnCommitCallbacks(execute=True):
+            expense = ExpenseFactory(
+                receipt=SimpleUploadedFile(name, content, content_type=content_type)
+            )
+        expense.receipt_blob.refresh_from_db()
+        return expense.receipt_blob
+
+    def test_image_upload_gets_a_thumbnail_beside_it(self):
+        blob = self._expense(_png(), "scan.png", "image/png")
+
+        self.assertEqual(blob.processing_status, "done")
+        self.assertTrue(blob.thumbnail.name.startswith(blob.file.name[:-4] + ".thumb"))
+        with self.storage.open(blob.thumbnail.name) as thumbnail:
+            image = Image.open(thumbnail)
+            self.assertEqual(image.format, "JPEG")
+            self.assertLessEqual(max(image.size), 320)
+
+    def test_pdf_without_pypdf_is_done_without_artifacts(self):
+        with patch.object(receipt_processing_service, "PdfReader", None):
+            blob = self._expense(b"%PDF-1.4 bill", "bill.pdf", "application/pdf")
+
+        self.assertEqual(blob.processing_status, "done")
+        self.assertFalse(blob.thumbnail)
+        self.assertEqual(blob.extracted_text, "")
+
+    def test_pdf_text_and_total_are_extracted(self):
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer)
+        pdf.drawString(72, 720, "Office supplies")
+        pdf.drawString(72, 700, "Total 42.50")
+        pdf.save()
+
+        blob = self._expense(buffer.getvalue(), "bill.pdf", "application/pdf")
+
+        self.assertEqual(blob.processing_status, "done")
+        self.assertIn("Office supplies", blob.extracted_text)
+        self.assertEqual(blob.detected_amount, Decimal("42.50"))
+
+    def test_missing_extractors_are_reported(self):
+        with patch.object(receipt_processing_service, "PdfReader", None), patch.object(
+            receipt_processing_service, "pytesseract", None
+        ), self.assertLogs(receipt_processing_service.logger, "WARNING") as logs:
+            receipt_processing_service.warn_missing_extractors()
+
+        self.assertIn("not installed: pypdf, pytesseract", logs.output[0])
+
+    def test_unreadable_file_is_unsupported(self):
+        blob = self._expense(b"not an image", "note.jpg", "image/jpeg")
+
+        self.assertEqual(blob.processing_status, "unsupported")
+
+    def test_command_processes_pending_blobs(self):
+        with patch.object(ReceiptProcessingService, "enqueue"):
+            blob = self._expense(_png((40, 40)), "scan.png", "image/png")
+        self.assertEqual(blob.processing_status, "pending")
+        out = StringIO()
+
+        call_command("process_receipts", stdout=out)
+
+        blob.refresh_from_db()
+        self.assertEqual(blob.processing_status, "done")
+        self.assertIn("Processed 1 receipt(s): 1 done", out.getvalue())
+
+
+@override_settings(RECEIPT_PROCESSING_WORKERS=1, RECEIPT_PROCESSING_QUEUE=0)
+class ReceiptProcessingPoolTest(TestCase):
+    def setUp(self):
+        for attribute in ("_executor", "_slots"):
+            patcher = patch.object(ReceiptProcessingService, attribute, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_full_queue_leaves_blobs_pending(self):
+        started, release = threading.Event(), threading.Event()
+
+        def process(blob_id):
+            started.set()
+            release.wait(5)
+
+        service = ReceiptProcessingService()
+        with patch.object(service, "process", side_effect=process):
+            self.assertTrue(service.enqueue(1))
+            started.wait(5)
+            self.assertFalse(service.enqueue(2))
+            release.set()
+            service._executor.shutdown(wait=True)
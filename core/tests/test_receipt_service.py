@@ -0,0 +1,173 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import StopFutureHandlers
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.custom_storage import ReceiptStorageMixin
+from core.models import Expense, ReceiptBlob
+from core.services.finance.receipt_service import ReceiptService
+from core.upload_handlers import HashingMemoryFileUploadHandler
+from .factories import ExpenseFactory, UserFactory
+
+
+class LocalReceiptStorage(ReceiptStorageMixin, FileSystemStorage):
+    """Local stand-in for the blob backend."""
+
+
+@override_settings(RECEIPT_CACHE_MAX_BYTES=0)
+class ReceiptServiceTest(TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.storage = LocalReceiptStorage(location=self.location)
+        for field in (
+            Expense._meta.get_field("receipt"),
+            ReceiptBlob._meta.get_field("file"),
+        ):
+            patcher = patch.object(field, "storage", self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _upload(self, content=b"%PDF-1.4 bill", name="bill.pdf"):
+        return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+    def _write(self, name, content):
+        path = os.path.join(self.location, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(content)
+
+    def test_identical_uploads_share_one_blob(self):
+        with patch.object(FileSystemStorage, "_save", wraps=self.storage._save) as save:
+            first = ExpenseFactory(vendor="Acme", receipt=self._upload())
+            second = ExpenseFactory(vendor="Other", receipt=self._upload())
+
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(ReceiptBlob.objects.count(), 1)
+        self.assertEqual(first.receipt_blob, second.receipt_blob)
+        self.assertEqual(first.receipt.name, second.receipt.name)
+        self.assertEqual(
+            first.receipt_blob.sha256, hashlib.sha256(b"%PDF-1.4 bill").hexdigest()
+        )
+        with first.receipt.open() as receipt:
+            self.assertEqual(receipt.read(), b"%PDF-1.4 bill")
+
+    def test_different_uploads_get_their_own_blobs(self):
+        ExpenseFactory(receipt=self._upload(b"one"))
+        ExpenseFactory(receipt=self._upload(b"two"))
+
+        self.assertEqual(ReceiptBlob.objects.count(), 2)
+
+    def test_upload_handler_hashes_while_streaming(self):
+        handler = HashingMemoryFileUploadHandler()
+        handler.activated = True
+        with self.assertRaises(StopFutureHandlers):
+            handler.new_file("receipt", "bill.pdf", "application/pdf", 8)
+        handler.receive_data_chunk(b"%PDF", 0)
+        handler.receive_data_chunk(b"-1.4", 4)
+
+        uploaded = handler.file_complete(8)
+
+        self.assertEqual(uploaded.sha256, hashlib.sha256(b"%PDF-1.4").hexdigest())
+        self.assertEqual(ReceiptService().digest(uploaded), uploaded.sha256)
+
+    def test_reconcile_merges_existing_duplicates(self):
+        self._write("receipts/2025/01/acme/bill.pdf", b"same bytes")
+        self._write("receipts/2025/02/acme/bill_20250201.pdf", b"same bytes")
+        self._write("receipts/2025/02/other/note.pdf", b"other bytes")
+        first = ExpenseFactory(receipt="receipts/2025/01/acme/bill.pdf")
+        second = ExpenseFactory(receipt="receipts/2025/02/acme/bill_20250201.pdf")
+        third = ExpenseFactory(receipt="receipts/2025/02/other/note.pdf")
+        out = StringIO()
+
+        call_command("reconcile_receipts", stdout=out)
+
+        self.assertIn("Adopted 3 receipt(s), merged 1 duplicate(s)", out.getvalue())
+        for expense in (first, second, third):
+            expense.refresh_from_db()
+        self.assertEqual(ReceiptBlob.objects.count(), 2)
+        self.assertEqual(first.receipt_blob, second.receipt_blob)
+        self.assertEqual(second.receipt.name, "receipts/2025/01/acme/bill.pdf")
+        self.assertFalse(self.storage.exists("receipts/2025/02/acme/bill_20250201.pdf"))
+        self.assertNotEqual(third.receipt_blob, first.receipt_blob)
+
+    def test_reconcile_dry_run_changes_nothing(self):
+        self._write("receipts/a.pdf", b"same")
+        self._write("receipts/b.pdf", b"same")
+        ExpenseFactory(receipt="receipts/a.pdf")
+        ExpenseFactory(receipt="receipts/b.pdf")
+
+        out = StringIO()
+        call_command("reconcile_receipts", "--dry-run", stdout=out)
+
+        self.assertIn("Adopted 2 receipt(s), merged 1 duplicate(s)", out.getvalue())
+        self.assertEqual(ReceiptBlob.objects.count(), 0)
+        self.assertTrue(self.storage.exists("receipts/b.pdf"))
+
+    def test_reconcile_keeps_links_made_before_a_failure(self):
+        self._write("receipts/a.pdf", b"first")
+        self._write("receipts/b.pdf", b"second")
+        first = ExpenseFactory(receipt="receipts/a.pdf")
+        ExpenseFactory(receipt="receipts/b.pdf")
+        service = ReceiptService()
+        read = service.read
+
+        with patch.object(
+            service, "read", side_effect=[read(first), OSError("storage down")]
+        ):
+            with self.assertRaises(OSError):
+                service.reconcile(batch_size=1)
+
+        first.refresh_from_db()
+        self.assertIsNotNone(first.receipt_blob)
+        self.assertEqual(ReceiptBlob.objects.count(), 1)
+
+    def test_prune_removes_unreferenced_blobs(self):
+        expense = ExpenseFactory(receipt=self._upload())
+        name = expense.receipt.name
+        expense.delete()
+
+        self.assertEqual(ReceiptService().prune(), 1)
+        self.assertFalse(ReceiptBlob.objects.exists())
+        self.assertFalse(self.storage.exists(name))
+
+    async def test_receipt_redirects_to_the_cached_storage_url(self):
+        expense = await sync_to_async(ExpenseFactory)(receipt=self._upload())
+        blob = await ReceiptBlob.objects.aget()
+        token = AccessToken.for_user(await sync_to_async(UserFactory)())
+        url = reverse("expense-receipt", args=[expense.pk])
+
+        response = await self.async_client.get(
+            url, headers={"Authorization": f"Bearer {token}"}
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], self.storage.url(blob.file.name))
+        self.assertIsNotNone(
+            await cache.aget(self.storage.url_cache_key(blob.file.name))
+        )
+
+    async def test_receipt_requires_a_token_and_a_receipt(self):
+        expense = await sync_to_async(ExpenseFactory)()
+        token = AccessToken.for_user(await sync_to_async(UserFactory)())
+        url = reverse("expense-receipt", args=[expense.pk])
+
+        anonymous = await self.async_client.get(url)
+        missing = await self.async_client.get(
+            url, headers={"Authorization": f"Bearer {token}"}
+        )
+
+        self.assertEqual(anonymous.status_code, 401)
+        self.assertEqual(missing.status_code, 404)
@@ -0,0 +1,170 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgresDatabaseWrapper,
+)
+from django.db.models.sql import UpdateQuery
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import Client, Expense, Project, Task
+from core.services.search_service import SearchService
+from core.views import ExpenseViewSet
+from .factories import (
+    ClientFactory,
+    ExpenseFactory,
+    ProjectFactory,
+    TaskFactory,
+    UserFactory,
+)
+
+
+def _count_rows(queryset, weights=None):
+    return queryset.count()
+
+
+class SearchServiceTest(TestCase):
+    def setUp(self):
+        self.service = SearchService()
+
+    def test_search_document_uses_weights_and_relations(self):
+        client = ClientFactory(name="Acme Corp")
+        project = ProjectFactory(
+            name="Portal", code="P-1", client=client, description="Customer portal"
+        )
+
+        document = project.get_search_document()
+
+        self.assertEqual(document["A"], "P-1 Portal")
+        self.assertEqual(document["B"], "Acme Corp")
+        self.assertIn("Customer portal", document["C"])
+
+    def test_fallback_search_ranks_by_weight(self):
+        in_description = ProjectFactory(name="Website", description="acme redesign")
+        in_name = ProjectFactory(name="Acme rollout")
+
+        results = list(self.service.search(Project.objects.all(), "acme"))
+
+        self.assertEqual(results, [in_name, in_description])
+        self.assertGreater(results[0].search_rank, results[1].search_rank)
+
+    def test_fallback_search_requires_every_word(self):
+        match = ClientFactory(name="Acme", company="Widgets Inc")
+        ClientFactory(name="Acme Two", company="Gadgets")
+
+        results = self.service.search(Client.objects.all(), "acme widgets")
+
+        self.assertEqual(list(results), [match])
+
+    def test_blank_term_returns_queryset_unchanged(self):
+        ClientFactory()
+        self.assertEqual(self.service.search(Client.objects.all(), "  ").count(), 1)
+
+    def test_prefix_query_is_sanitized(self):
+        query = self.service.build_query("acm!e co", prefix=True)
+        self.assertEqual(query.source_expressions[1].value, "acm:* & e:* & co:*")
+        self.assertIsNone(self.service.build_query("!!", prefix=True))
+
+    def test_update_index_is_skipped_without_postgres(self):
+        client = ClientFactory()
+        with self.assertNumQueries(0):
+            self.service.update_index(client)
+
+    def test_update_index_runs_on_save_for_postgres(self):
+        with patch.object(SearchService, "update_index") as update_index:
+            client = ClientFactory()
+        update_index.assert_called_once_with(client)
+
+    def test_renaming_a_related_object_reindexes_dependents(self):
+        client = ClientFactory(name="Acme Corp")
+        project = ProjectFactory(client=client)
+        ProjectFactory()
+
+        client.name = "Globex"
+        with patch.object(SearchService, "reindex_dependents") as reindex:
+            client.save()
+        reindex.assert_called_once_with(client, {"name"})
+
+        with patch.object(
+            SearchService, "update_vectors", side_effect=_count_rows
+        ) as update_vectors:
+            self.assertEqual(self.service.reindex_dependents(client, {"name"}), 1)
+            self.assertEqual(self.service.reindex_dependents(client, {"notes"}), 0)
+        (queryset,), _ = update_vectors.call_args
+        self.assertEqual(list(queryset), [project])
+
+    def test_vectors_are_updated_in_one_statement(self):
+        settings_dict = {
+            **connection.settings_dict,
+            "ENGINE": "django.db.backends.postgresql",
+        }
+        postgres = PostgresDatabaseWrapper(settings_dict, alias="postgres")
+        query = Task.objects.filter(project_id=1).query.chain(UpdateQuery)
+        query.add_update_values({"search_vector": self.service.vector_expression(Task)})
+
+        sql, _ = query.get_compiler(connection=postgres).as_sql()
+
+        self.assertTrue(sql.startswith('UPDATE "core_task" SET "search_vector"'))
+        self.assertIn("to_tsvector", sql)
+        self.assertIn('FROM "core_project"', sql)
+
+    def test_rebuild_updates_in_batches(self):
+        ClientFactory.create_batch(3)
+
+        with patch.object(
+            SearchService, "is_postgres", return_value=True
+        ), patch.object(
+            SearchService, "update_vectors", side_effect=_count_rows
+        ) as update_vectors:
+            self.assertEqual(self.service.rebuild(Client, batch_size=2), 3)
+        self.assertEqual(update_vectors.call_count, 2)
+
+
+class RankedSearchFilterTest(TestCase):
+    def test_api_search_is_ranked(self):
+        user = UserFactory()
+        ExpenseFactory(title="Laptop", description="staples order")
+        best = ExpenseFactory(title="Staples", vendor="Staples")
+
+        request = APIRequestFactory().get("/api/expenses/", {"search": "staples"})
+        force_authenticate(request, user=user)
+        response = ExpenseViewSet.as_view({"get": "list"})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]["id"], best.id)
+        self.assertNotIn("search_vector", response.data[0])
+
+    def test_admin_search_keeps_rank_ordering(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        ClientFactory(name="Other", notes="acme mention")
+        best = ClientFactory(name="Acme")
+        url = reverse("admin:core_client_changelist")
+
+        response = self.client.get(url, {"q": "acme"}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].result_list[0], best)
+
+        response = self.client.get(url, {"q": "acme", "o": "1"}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["cl"].result_list), 2)
+
+    def test_admin_changelists_search(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+        project = ProjectFactory(name="Acme portal")
+        TaskFactory(project=project, name="Acme launch")
+        ExpenseFactory(title="Acme hosting")
+
+        for model_name in ("client", "project", "task", "expense"):
+            with self.subTest(changelist=model_name):
+                response = self.client.get(
+                    reverse(f"admin:core_{model_name}_changelist"),
+                    {"q": "acme"},
+                    secure=True,
+                )
+                self.assertEqual(response.status_code, 200)
+
+    def test_expense_is_searchable(self):
+        self.assertTrue(SearchService.is_searchable(Expense))
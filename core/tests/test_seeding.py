@@ -0,0 +1,98 @@
+import io
+from datetime import date
+
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase
+
+from core.models import Client, Expense, Income, Invoice, Project, Task, User
+from core.seeding import SeedScale, SyntheticDataGenerator
+
+TINY = SeedScale(
+    users=3, clients=4, projects=5, tasks=40, invoices=12, incomes=20, expenses=60
+)
+
+
+class SyntheticDataTest(TestCase):
+    def _generate(self, seed=7, **kwargs):
+        return SyntheticDataGenerator(
+            TINY, seed=seed, chunk_size=8, today=date(2025, 6, 30), **kwargs
+        ).run()
+
+    def test_counts_and_references_are_consistent(self):
+        counts = self._generate()
+
+        self.assertEqual(counts["tasks"], 40)
+        self.assertEqual(Task.objects.count(), 40)
+        self.assertEqual(Income.objects.count(), 20)
+        self.assertEqual(Expense.objects.count(), 60)
+        for income in Income.objects.exclude(invoice=None).select_related("invoice"):
+            self.assertEqual(income.invoice.status, "paid")
+            self.assertEqual(income.amount, income.invoice.amount)
+            self.assertEqual(income.client_id, income.invoice.client_id)
+            self.assertEqual(income.income_type, "project_payment")
+
+    def test_task_dependencies_form_a_dag_within_projects(self):
+        self._generate()
+        edges = Task.dependencies.through.objects.all()
+
+        self.assertTrue(edges.exists())
+        self.assertFalse(
+            edges.exclude(from_task__project=F("to_task__project")).exists()
+        )
+        # Every edge points to an earlier task, so no cycle is possible
+        self.assertFalse(edges.filter(to_task__pk__gte=F("from_task__pk")).exists())
+
+    def test_recurring_expenses_come_in_series(self):
+        self._generate()
+        recurring = Expense.objects.filter(is_recurring=True)
+
+        self.assertTrue(recurring.exists())
+        self.assertFalse(recurring.filter(recurring_frequency="none").exists())
+        series = recurring.values_list("title", "submitted_by", "amount").distinct()
+        self.assertLess(series.count(), recurring.count())
+
+    def test_same_seed_gives_same_data(self):
+        def snapshot():
+            return (
+                list(
+                    Invoice.objects.order_by("invoice_number").values_list(
+                        "invoice_number", "amount", "status"
+                    )
+                ),
+                list(Expense.objects.order_by("pk").values_list("title", "date")),
+                list(Task.objects.order_by("pk").values_list("name", "due_date")),
+            )
+
+        self._generate(seed=3)
+        first = snapshot()
+        for model in (Income, Invoice, Task, Expense, Project, Client, User):
+            model.objects.all().delete()
+        self._generate(seed=3)
+
+        self.assertEqual(snapshot(), first)
+
+    def test_seed_data_scale_overrides(self):
+        call_command(
+            "seed_data",
+            "--scale=small",
+            "--users=2",
+            "--clients=2",
+            "--projects=2",
+            "--tasks=5",
+            "--invoices=0",
+            "--incomes=4",
+            "--expenses=3",
+            "--workers=4",
+            stdout=io.StringIO(),
+        )
+
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertEqual(Income.objects.count(), 4)
+
+    def test_demo_data_uses_valid_choices(self):
+        call_command("seed_data", stdout=io.StringIO())
+
+        for model in (User, Invoice, Income, Expense):
+            for instance in model.objects.all():
+                instance.full_clean(exclude=["password", "receipt"])
@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django_session_timeout.middleware import SESSION_TIMEOUT_KEY
+
+from .factories import UserFactory
+
+
+@override_settings(SESSION_EXPIRE_AFTER_LAST_ACTIVITY_GRACE_PERIOD=60)
+class SessionActivityTest(TestCase):
+    def setUp(self):
+        self.client.force_login(UserFactory(is_staff=True, is_superuser=True))
+
+    def _session_writes(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("admin:index"), secure=True)
+        self.assertEqual(response.status_code, 200)
+        return [
+            q["sql"]
+            for q in queries
+            if "django_session" in q["sql"]
+            and q["sql"].lstrip().upper().startswith(("INSERT", "UPDATE"))
+        ]
+
+    def test_page_views_within_the_interval_do_not_write_the_session(self):
+        self._session_writes()  # stamps the first activity
+
+        self.assertEqual(self._session_writes(), [])
+        self.assertEqual(self._session_writes(), [])
+
+    def test_activity_is_recorded_once_the_interval_has_passed(self):
+        self._session_writes()
+        stamped = self.client.session[SESSION_TIMEOUT_KEY]
+
+        with patch("time.time", return_value=stamped + 61):
+            writes = self._session_writes()
+
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(self.client.session[SESSION_TIMEOUT_KEY], stamped + 61)
+
+    @override_settings(SESSION_EXPIRE_SECONDS=120)
+    def test_idle_sessions_still_expire(self):
+        self._session_writes()
+        stamped = self.client.session[SESSION_TIMEOUT_KEY]
+
+        with patch("time.time", return_value=stamped + 121):
+            response = self.client.get(reverse("admin:index"), secure=True)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn(SESSION_TIMEOUT_KEY, self.client.session)
@@ -0,0 +1,41 @@
+import io
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from core.custom_storage import AzureReceiptStorage
+from core.startup import deferred_imports, parse_importtime, total_ms
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   reportlab.lib
+import time:       300 |        420 | reportlab
+import time:        50 |         50 | json
+"""
+
+
+class StartupProfileTest(SimpleTestCase):
+    def test_importtime_output_is_parsed(self):
+        timings = parse_importtime("noise\\n" + OUTPUT)
+
+        self.assertEqual(
+            [(t.module, t.depth) for t in timings],
+            [("reportlab.lib", 1), ("reportlab", 0), ("json", 0)],
+        )
+        self.assertEqual(total_ms(timings), 0.47)
+        self.assertEqual([t.module for t in deferred_imports(timings)], ["reportlab"])
+
+    def test_receipt_storage_defers_the_azure_sdk(self):
+        storage = AzureReceiptStorage()
+
+        self.assertNotIn("backend", storage.__dict__)
+        self.assertEqual(
+            storage.deconstruct(), ("core.custom_storage.AzureReceiptStorage", (), {})
+        )
+
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        out = io.StringIO()
+
+        call_command("profile_startup", "--limit=3", stdout=out)
+
+        self.assertIn("No deferred module imported at startup", out.getvalue())
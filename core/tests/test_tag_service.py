@@ -0,0 +1,99 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.filters import TaskFilter, UserFilter
+from core.models import Tag, Task, User
+from core.services.tag_service import TagService
+from .factories import TaskFactory, UserFactory
+
+
+class TagModelTest(TestCase):
+    def test_parse_normalizes_and_deduplicates(self):
+        self.assertEqual(
+            Tag.parse(" Python ,django,PYTHON,, Machine  Learning"),
+            ["django", "machine learning", "python"],
+        )
+        self.assertEqual(Tag.parse(["Go", "go"]), ["go"])
+        self.assertEqual(Tag.parse(None), [])
+
+    def test_get_or_create_many_reuses_existing(self):
+        existing = Tag.objects.create(name="python")
+        tags = Tag.get_or_create_many(["Python", "Rust"])
+
+        self.assertEqual(len(tags), 2)
+        self.assertIn(existing, tags)
+        self.assertEqual(Tag.objects.count(), 2)
+
+
+class TagSyncTest(TestCase):
+    def test_task_tags_are_synced_on_save(self):
+        task = TaskFactory(tags="Backend, API")
+        self.assertEqual(
+            list(task.normalized_tags.values_list("name", flat=True)),
+            ["api", "backend"],
+        )
+
+        task = Task.objects.get(pk=task.pk)
+        task.tags = "api"
+        task.save()
+        self.assertEqual(
+            list(task.normalized_tags.values_list("name", flat=True)), ["api"]
+        )
+
+    def test_unchanged_tags_skip_sync(self):
+        task = Task.objects.get(pk=TaskFactory(tags="api").pk)
+        with CaptureQueriesContext(connection) as queries:
+            task.save()
+        tag_queries = [
+            q["sql"]
+            for q in queries.captured_queries
+            if "core_tag" in q["sql"] or "normalized_tags" in q["sql"]
+        ]
+        self.assertEqual(tag_queries, [])
+
+    def test_user_skills_are_synced(self):
+        user = UserFactory(skills="Python,SQL")
+        user = User.objects.get(pk=user.pk)
+        user.skills = ""
+        user.save()
+        self.assertFalse(user.normalized_skills.exists())
+
+
+class TagServiceTest(TestCase):
+    def setUp(self):
+        self.service = TagService()
+        self.both = TaskFactory(tags="python,django")
+        self.python = TaskFactory(tags="python")
+        self.other = TaskFactory(tags="pythonic")
+
+    def test_filter_any_has_no_substring_matches(self):
+        tasks = self.service.tasks_tagged("python")
+        self.assertCountEqual(tasks, [self.both, self.python])
+
+    def test_filter_any_of_several(self):
+        tasks = self.service.tasks_tagged("django,pythonic")
+        self.assertCountEqual(tasks, [self.both, self.other])
+
+    def test_filter_all(self):
+        tasks = self.service.tasks_tagged(["Django", "Python"], match_all=True)
+        self.assertCountEqual(tasks, [self.both])
+
+    def test_users_with_skills(self):
+        dev = UserFactory(skills="python, react")
+        UserFactory(skills="react")
+
+        users = self.service.users_with_skills("python,react", match_all=True)
+        self.assertCountEqual(users, [dev])
+
+    def test_task_filter(self):
+        filtered = TaskFilter({"tags_all": "python,django"}, Task.objects.all()).qs
+        self.assertCountEqual(filtered, [self.both])
+
+        filtered = TaskFilter({"tags_any": "django"}, Task.objects.all()).qs
+        self.assertCountEqual(filtered, [self.both])
+
+    def test_user_filter(self):
+        dev = UserFactory(skills="go")
+        filtered = UserFilter({"skills_any": "Go"}, User.objects.all()).qs
+        self.assertCountEqual(filtered, [dev])
@@ -0,0 +1,94 @@
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Project, Task
+from .factories import ProjectFactory, TaskFactory, UserFactory
+
+
+class PaginatedTaskInlineTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin_user = UserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(self.admin_user)
+        # The first request stamps the session; the counts compare later ones
+        self.client.get(reverse("admin:index"))
+        self.project = ProjectFactory()
+        TaskFactory.create_batch(25, project=self.project)
+        self.url = reverse("admin:core_project_change", args=[self.project.pk])
+
+    def _formset(self, response):
+        (inline_admin_formset,) = response.context["inline_admin_formsets"]
+        return inline_admin_formset.formset
+
+    def test_change_form_renders_one_page(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        formset = self._formset(response)
+        self.assertEqual(len(formset.forms), 20)
+        self.assertEqual(formset.page.paginator.count, 25)
+        self.assertContains(response, "task_page=2")
+        self.assertContains(response, 'name="tasks-0-assigned_to"')
+        self.assertIn("admin-autocomplete", str(formset.forms[0]["assigned_to"]))
+
+    def test_pages_do_not_overlap(self):
+        first = self._formset(self.client.get(self.url))
+        second = self._formset(self.client.get(self.url, {"task_page": 2}))
+
+        pks = [form.instance.pk for form in first.forms + second.forms]
+        self.assertEqual(len(second.forms), 5)
+        self.assertCountEqual(pks, self.project.tasks.values_list("pk", flat=True))
+
+    def test_query_count_does_not_grow_with_tasks(self):
+        with CaptureQueriesContext(connection) as before:
+            self.client.get(self.url)
+        TaskFactory.create_batch(25, project=self.project)
+        with CaptureQueriesContext(connection) as after:
+            self.client.get(self.url)
+
+        self.assertEqual(len(after), len(before))
+
+    def test_chunk_endpoint_renders_inline_fragment(self):
+        url = reverse("admin:core_project_inline_page", args=[self.project.pk, "tasks"])
+
+        response = self.client.get(url, {"task_page": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'id="tasks-paginated"')
+        self.assertContains(response, 'name="tasks-TOTAL_FORMS" value="5"', html=False)
+        self.assertEqual(
+            self.client.get(
+                reverse("admin:core_project_inline_page", args=[self.project.pk, "x"])
+            ).status_code,
+            404,
+        )
+
+    def test_bound_formset_saves_the_posted_rows(self):
+        admin = site._registry[Project]
+        request = RequestFactory().get(self.url, {"task_page": 2})
+        request.user = self.admin_user
+        (inline,) = admin.get_inline_instances(request, self.project)
+        formset_class = inline.get_formset(request, self.project)
+        task = self.project.tasks.order_by("pk").last()
+
+        data = {
+            "tasks-TOTAL_FORMS": "1",
+            "tasks-INITIAL_FORMS": "1",
+            "tasks-0-id": str(task.pk),
+            "tasks-0-project": str(self.project.pk),
+            "tasks-0-name": "Renamed",
+            "tasks-0-status": task.status,
+            "tasks-0-priority": task.priority,
+            "tasks-0-due_date": task.due_date.isoformat(),
+            "tasks-0-estimated_hours": "1",
+        }
+        formset = formset_class(data, instance=self.project, prefix="tasks")
+
+        self.assertTrue(formset.is_valid(), formset.errors)
+        formset.save()
+        self.assertEqual(Task.objects.get(pk=task.pk).name, "Renamed")
+        self.assertEqual(self.project.tasks.count(), 25)
@@ -3,7 +3,9 @@ from rest_framework.routers import DefaultRouter
 
 from .views import (
     ClientViewSet,
+    ExpenseReceiptView,
     ExpenseViewSet,
+    GlobalSearchView,
     IncomeViewSet,
     InvoiceViewSet,
     ProjectViewSet,
@@ -21,5 +23,11 @@ router.register(r"expenses", ExpenseViewSet)
 router.register(r"invoices", InvoiceViewSet)
 
 urlpatterns = [
+    path("search/", GlobalSearchView.as_view(), name="global-search"),
+    path(
+        "expenses/<int:pk>/receipt/",
+        ExpenseReceiptView.as_view(),
+        name="expense-receipt",
+    ),
     path("", include(router.urls)),
 ]
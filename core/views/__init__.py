@@ -3,8 +3,10 @@ from .clients.client_views import ClientViewSet
 from .finance.expense_views import ExpenseViewSet
 from .finance.income_views import IncomeViewSet
 from .finance.invoice_views import InvoiceViewSet
+from .finance.receipt_views import ExpenseReceiptView
 from .projects.project_views import ProjectViewSet
-from .system.health_views import HealthCheckView
+from .search.search_views import GlobalSearchView
+from .system.health_views import HealthCheckView, LivenessView
 from .tasks.task_views import TaskViewSet
 
 __all__ = [
@@ -13,7 +15,10 @@ __all__ = [
     "ClientViewSet",
     "TaskViewSet",
     "ExpenseViewSet",
+    "ExpenseReceiptView",
     "IncomeViewSet",
     "InvoiceViewSet",
     "HealthCheckView",
+    "LivenessView",
+    "GlobalSearchView",
 ]
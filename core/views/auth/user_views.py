@@ -3,6 +3,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils.decorators import method_decorator
 
+from core.filters import UserFilter
 from core.models import User
 from core.serializers import UserSerializer
 from core.services.user_service import UserService
@@ -16,7 +17,7 @@ class UserViewSet(BaseViewSet):
     service_class = UserService
     search_fields = ["username", "email", "first_name", "last_name", "employee_id"]
     ordering_fields = ["username", "date_joined", "last_login"]
-    filterset_fields = ["role", "department", "status"]
+    filterset_class = UserFilter
 
     def get_queryset(self):
         return self.queryset.select_related("reports_to")
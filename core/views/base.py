@@ -1,16 +1,18 @@
 from django.core.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
+from core.filters import RankedSearchFilter
+
 
 class BaseViewSet(viewsets.ModelViewSet):
     """Base ViewSet providing common functionality"""
 
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, RankedSearchFilter, OrderingFilter]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
@@ -1,17 +1,21 @@
 from django.core.exceptions import ValidationError
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from core.filters import ExpenseFilter
 from core.models import Expense
+from core.pagination import EstimatedCountPagination
 from core.serializers import ExpenseSerializer
 from core.services.finance.expense_service import ExpenseService
+from core.services.finance.receipt_archive_service import ReceiptArchiveService
 from core.views.base import BaseViewSet
 
 
 class ExpenseViewSet(BaseViewSet):
     queryset = Expense.objects.all()
+    pagination_class = EstimatedCountPagination
     serializer_class = ExpenseSerializer
     service_class = ExpenseService
     filterset_class = ExpenseFilter
@@ -32,3 +36,14 @@ class ExpenseViewSet(BaseViewSet):
             return Response(self.get_serializer(approved_expense).data)
         except ValidationError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=["get"], url_path="receipts-archive")
+    def receipts_archive(self, request):
+        """Stream the receipts of the filtered expenses as a ZIP archive"""
+        service = ReceiptArchiveService()
+        response = StreamingHttpResponse(
+            service.stream(self.filter_queryset(self.get_queryset())),
+            content_type="application/zip",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{service.filename()}"'
+        return response
@@ -1,4 +1,5 @@
 from core.models import Income
+from core.pagination import EstimatedCountPagination
 from core.serializers import IncomeSerializer
 from core.services.finance.income_service import IncomeService
 from core.views.base import BaseViewSet
@@ -6,6 +7,7 @@ from core.views.base import BaseViewSet
 
 class IncomeViewSet(BaseViewSet):
     queryset = Income.objects.all()
+    pagination_class = EstimatedCountPagination
     serializer_class = IncomeSerializer
     service_class = IncomeService
     search_fields = ["payment_reference", "description"]
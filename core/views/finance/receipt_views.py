@@ -0,0 +1,51 @@
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponseRedirect, JsonResponse
+from django.views import View
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.authentication import StatelessJWTAuthentication
+from core.models import Expense
+
+
+class ExpenseReceiptView(View):
+    """
+    Redirects to a signed, expiring URL for an expense's receipt, so the
+    client downloads it from blob storage directly.
+
+    Async: under ASGI the lookups and the signing wait without holding a
+    worker thread, which matters when many clients open receipts at once.
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request, pk):
+        try:
+            authenticated = await sync_to_async(
+                StatelessJWTAuthentication().authenticate
+            )(request)
+        except AuthenticationFailed as exc:
+            return JsonResponse({"detail": str(exc.detail)}, status=401)
+        if authenticated is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=401,
+            )
+
+        expense = (
+            await Expense.objects.select_related("receipt_blob")
+            .only("receipt", "receipt_blob__file")
+            .filter(pk=pk)
+            .afirst()
+        )
+        if expense is None:
+            raise Http404("No expense matches the given query.")
+        receipt = expense.receipt_blob.file if expense.receipt_blob else expense.receipt
+        if not receipt:
+            raise Http404("The expense has no receipt.")
+
+        storage = receipt.storage
+        if hasattr(storage, "aurl"):
+            url = await storage.aurl(receipt.name)
+        else:
+            url = await sync_to_async(storage.url, thread_sensitive=False)(receipt.name)
+        return HttpResponseRedirect(url)
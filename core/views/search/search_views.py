@@ -0,0 +1,41 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.serializers import GlobalSearchQuerySerializer, GlobalSearchResultSerializer
+from core.services.global_search_service import GlobalSearchService
+
+
+class GlobalSearchView(APIView):
+    """
+    Typeahead search across clients, projects, tasks, invoices, expenses and
+    income.
+
+    Query parameters: ``q`` (every word matches as a prefix), optional
+    ``types`` (comma-separated) and ``limit`` (hits per type, max 20).
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = GlobalSearchResultSerializer
+
+    def get(self, request):
+        params = GlobalSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data["q"]
+
+        grouped = GlobalSearchService().search(
+            query,
+            entity_types=params.validated_data.get("types"),
+            limit=params.validated_data.get("limit"),
+        )
+        results = {
+            entity_type: GlobalSearchResultSerializer(hits, many=True).data
+            for entity_type, hits in grouped.items()
+        }
+        return Response(
+            {
+                "query": query,
+                "count": sum(len(hits) for hits in results.values()),
+                "results": results,
+            }
+        )
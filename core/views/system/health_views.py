@@ -1,58 +1,50 @@
-from datetime import datetime
-
 from django.conf import settings
-from django.core.cache import cache
-from django.db import OperationalError, connections
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from rest_framework.views import APIView
+from django.http import JsonResponse
+from django.views import View
+
+from core.serializers import HealthCheckSerializer, LivenessSerializer
+from core.services.health_service import HealthService
+
+
+class LivenessView(View):
+    """
+    Endpoint reporting that the process is serving requests. It does no
+    I/O, so a slow database never gets a healthy pod restarted.
 
-from core.serializers import HealthCheckSerializer
+    Async, like ``HealthCheckView``, so under ASGI probes are answered on the
+    event loop instead of occupying a worker thread.
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request):
+        return JsonResponse(LivenessSerializer({"status": "ok"}).data)
 
 
-class HealthCheckView(APIView):
+class HealthCheckView(View):
     """
-    API endpoint that checks system health.
+    Endpoint reporting readiness: the latest result of the dependency
+    probes in ``HealthService``. Answers 503 when a database is unreachable.
     """
 
-    permission_classes = [AllowAny]
-    serializer_class = HealthCheckSerializer
-
-    @method_decorator(cache_page(60))  # Cache for 1 minute
-    def get(self, request):
-        # Check database
-        db_status = {}
-        for db in connections.all():
-            try:
-                db.cursor()
-                db_status[db.alias] = "healthy"
-            except OperationalError:
-                db_status[db.alias] = "unhealthy"
-
-        # Check cache
-        try:
-            cache.set("health_check", "ok", 1)
-            cache_status = cache.get("health_check") == "ok"
-        except (ConnectionError, ValueError):
-            cache_status = False
-
-        # Add more comprehensive checks
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request):
+        result = await HealthService().areadiness()
+        checks = result["checks"]
+
         status_checks = {
-            "database": db_status,
-            "cache": cache_status,
-            "status": (
-                "ok"
-                if all(status == "healthy" for status in db_status.values())
-                and cache_status
-                else "degraded"
-            ),
-            "timestamp": datetime.now(),
+            **result,
+            "database": {
+                name.split(":", 1)[1]: "healthy" if check["healthy"] else "unhealthy"
+                for name, check in checks.items()
+                if name.startswith("database:")
+            },
+            "cache": checks["cache"]["healthy"],
             "version": getattr(settings, "API_VERSION", "1.0.0"),
-            "environment": settings.ENVIRONMENT,
-            "debug": settings.DEBUG,
         }
 
         serializer = HealthCheckSerializer(status_checks)
-        return Response(serializer.data)
+        return JsonResponse(
+            serializer.data, status=503 if result["status"] == "unavailable" else 200
+        )
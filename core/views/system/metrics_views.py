@@ -0,0 +1,40 @@
+import hmac
+import ipaddress
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from core.metrics import CONTENT_TYPE, exposition
+
+
+def _from_internal_network(request) -> bool:
+    # A proxied request may come from anywhere, whatever address the proxy has
+    if "X-Forwarded-For" in request.headers:
+        return False
+    try:
+        address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(
+        address in ipaddress.ip_network(network)
+        for network in getattr(settings, "METRICS_ALLOWED_NETWORKS", [])
+    )
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Application metrics of every worker process in the OpenMetrics text
+    format. Requires ``Authorization: Bearer <METRICS_TOKEN>`` when the
+    token is configured; without one, only unproxied requests from
+    ``METRICS_ALLOWED_NETWORKS`` may scrape.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return HttpResponse(status=401)
+    elif not _from_internal_network(request):
+        return HttpResponse(status=403)
+    return HttpResponse(exposition(), content_type=CONTENT_TYPE)
@@ -0,0 +1,67 @@
+"""
+Gunicorn settings, tuned by environment variables.
+
+Workers are ``gthread`` processes: each serves GUNICORN_THREADS requests at
+once, which suits views that mostly wait on the database and blob storage.
+With GUNICORN_PRELOAD on, the master imports the application once and the
+workers are forked from it, sharing those pages copy-on-write. The objects
+built at import are then moved out of the garbage collector's reach
+(``gc.freeze``), so collections in the workers do not touch, and so copy,
+the shared pages.
+"""
+
+import gc
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "TitansManager.settings")
+
+wsgi_app = "TitansManager.wsgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+workers = int(os.environ.get("GUNICORN_WORKERS", 3))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+preload_app = os.environ.get("GUNICORN_PRELOAD", "True") == "True"
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 120))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+# Recycle workers after this many requests (0: never), jittered so they do
+# not all restart together
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 50))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    # Metrics files of a previous run belong to processes that are gone
+    from django.conf import settings
+
+    directory = settings.METRICS_DIR
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".db"):
+                os.unlink(os.path.join(directory, name))
+
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from django.db import connections
+    from django.urls import get_resolver
+
+    # Import the views too, so the workers share them
+    get_resolver().url_patterns
+    # A connection opened here would be shared by every worker
+    connections.close_all()
+    gc.collect()
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    from core.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)